@@ -1,6 +1,16 @@
 import argparse
 import os
 import sys
+from terraform_importer.handlers.providers_handler import DEFAULT_MAX_WORKERS
+
+def positive_int(value: str) -> int:
+    """
+    Argument type accepting only integers greater than zero.
+    """
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be a positive integer, got {value}")
+    return number
 
 class AppendOptionAction(argparse.Action):
     """
@@ -37,7 +47,7 @@ class TerraformImporterCLI:
         The conventional ways (quoted or equals format) work without preprocessing.
         """
         # Known long options that should not be treated as values for --option
-        known_options = {'--config', '--target', '--log-level', '--option', '--help', '-h'}
+        known_options = {'--config', '--target', '--log-level', '--max-workers', '--clear-cache', '--option', '--help', '-h'}
         
         processed = []
         i = 0
@@ -91,6 +101,18 @@ class TerraformImporterCLI:
             help="Set logging level (default: INFO)"
         )
 
+        # Optional: concurrency of the resource lookups
+        self.parser.add_argument(
+            "--max-workers", type=positive_int, default=DEFAULT_MAX_WORKERS,
+            help=f"Maximum number of resources looked up concurrently, 1 looks them up one by one (default: {DEFAULT_MAX_WORKERS})"
+        )
+
+        # Optional: drop previously cached resource IDs
+        self.parser.add_argument(
+            "--clear-cache", action="store_true",
+            help="Clear the persistent result cache (see TF_IMPORTER_CACHE_TTL) before looking up resources"
+        )
+
     def parse_args(self, args=None):
         # Preprocess arguments to handle --option -value format
         if args is None:
@@ -1,6 +1,6 @@
 from typing import List, Optional, Dict
 from terraform_importer.handlers.terraform_handler import TerraformHandler
-from terraform_importer.handlers.providers_handler import ProvidersHandler
+from terraform_importer.handlers.providers_handler import ProvidersHandler, DEFAULT_MAX_WORKERS
 import os
 import json
 import logging
@@ -20,15 +20,17 @@ class ImportBlockGenerator:
         _provider_handler (ProvidersHandler): Handler for provider-specific resource actions.
     """
     
-    def __init__(self, tf_handler: TerraformHandler):
+    def __init__(self, tf_handler: TerraformHandler, max_workers: int = DEFAULT_MAX_WORKERS):
         """
         Initializes the ImportBlockGenerator with Terraform and Provider handlers.
         
         Args:
             tf_handler (TerraformHandler): An instance of TerraformHandler for Terraform operations.
             provider_handler (ProvidersHandler): An instance of ProvidersHandler for provider resource handling.
+            max_workers (int): Maximum number of resources looked up concurrently by the ProvidersHandler.
         """
         self._tf_handler = tf_handler
+        self._max_workers = max_workers
         self._provider_handler = None
         self.logger = logging.getLogger(__name__)
 
@@ -77,13 +79,13 @@ class ImportBlockGenerator:
             Dict[str, list]: A dictionary containing resource details.
         """
         targets     = targets or []
-        self.logger.info(f"Starting resource extraction for targets: {targets}")
+        self.logger.info("Starting resource extraction for targets: %s", targets)
         
         try:
             # Run Terraform plan and show to extract resource information
             resource_list = self.run_terraform(targets)
             
-            self._provider_handler = ProvidersHandler(resource_list)
+            self._provider_handler = ProvidersHandler(resource_list, self._max_workers)
             
             # Generate import blocks from the resource list
             self.logger.info("Generating import blocks...")
@@ -91,14 +93,14 @@ class ImportBlockGenerator:
             
             # Determine output file path
             output_file = os.path.join(self._tf_handler.get_terraform_folder(), f"import-{targets}.tf")
-            self.logger.info(f"Saving import blocks to {output_file}")
+            self.logger.info("Saving import blocks to %s", output_file)
             
             # Create the import file
             self.create_import_file(import_blocks, output_file)
             
             return import_blocks
         except Exception as e:
-            self.logger.error(f"Failed to extract resource list: {e}")
+            self.logger.error("Failed to extract resource list: %s", e)
             raise
 
     def _get_provider_for_resource(self, resource: Dict, address_to_provider_dict: Dict) -> Optional[str]:
@@ -116,10 +118,10 @@ class ImportBlockGenerator:
         address = re.sub(r'\[\d+\]|\["[^"]+"\]', '', resource['address'])
         try:
             provider = address_to_provider_dict.get(address)
-            self.logger.debug(f"Found provider {provider} for resource {address}")
+            self.logger.debug("Found provider %s for resource %s", provider, address)
             return provider
         except Exception as e:
-            self.logger.warning(f"Failed to get provider for resource {address}: {e}")
+            self.logger.warning("Failed to get provider for resource %s: %s", address, e)
             return None
 
     def generate_imports_from_plan(self, resource_list: Dict) -> List[Dict[str, str]]:
@@ -142,8 +144,9 @@ class ImportBlockGenerator:
         for resource in resource_list.get('resource_changes', []):
             
             actions = resource['change']['actions']
-            if "create" not in actions:
-                self.logger.debug(f"Skipping resource {resource['address']} with actions: {actions}")
+            # Replacements (delete and create) are already in the state, so only plain creates can be imported
+            if actions != ["create"]:
+                self.logger.debug("Skipping resource %s with actions: %s", resource['address'], actions)
                 continue
             
             provider = self._get_provider_for_resource(resource, address_to_provider_dict)
@@ -154,7 +157,7 @@ class ImportBlockGenerator:
             
             import_blocks.append(resource)
         
-        self.logger.info(f"Filtered {len(import_blocks)} resources for import.")
+        self.logger.info("Filtered %s resources for import.", len(import_blocks))
         return self._provider_handler.run_all_resources(import_blocks)
 
     def create_import_file(self, resources: List[Dict[str, str]], output_path: str) -> None:
@@ -165,14 +168,14 @@ class ImportBlockGenerator:
             resources (List[Dict[str, str]]): List of resource details (address and ID).
             output_path (str): Path to save the generated import file.
         """
-        self.logger.info(f"Creating import file at {output_path}")
+        self.logger.info("Creating import file at %s", output_path)
         import_blocks = []
 
         for resource in resources:
             try:
                 import_blocks.append(f"import {{\n  to = {resource['address']}\n  id = \"{resource['id']}\"\n}}")
             except KeyError as e:
-                self.logger.error(f"Resource missing required key: {e}")
+                self.logger.error("Resource missing required key: %s", e)
                 raise ValueError(f"Invalid resource format: {resource}")
         
         # Write import blocks to the file
@@ -183,5 +186,5 @@ class ImportBlockGenerator:
                     f.write(block + "\n\n")
             self.logger.info("Import file successfully created.")
         except IOError as e:
-            self.logger.error(f"Failed to write to file {output_path}: {e}")
+            self.logger.error("Failed to write to file %s: %s", output_path, e)
             raise
@@ -0,0 +1,112 @@
+from typing import Any, Optional
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+
+# Seconds a resolved resource ID stays valid; the persistent cache is disabled when unset or 0
+CACHE_TTL_ENV = "TF_IMPORTER_CACHE_TTL"
+DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser("~"), ".terraform-importer", "cache.db")
+
+class ResultCache:
+    """
+    Persistent cache of resolved resource IDs, kept in a SQLite file so consecutive runs against
+    the same account can skip lookups that were already answered. Every entry expires after `ttl` seconds.
+    """
+
+    def __init__(self, ttl: float, path: str = DEFAULT_CACHE_PATH):
+        """
+        Opens the cache file, creating it if needed.
+        Args:
+            ttl (float): Number of seconds an entry stays valid.
+            path (str): Path of the SQLite file.
+        """
+        self.ttl = ttl
+        self.path = path
+        self.logger = logging.getLogger(__name__)
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, value TEXT NOT NULL, expires REAL NOT NULL)"
+            )
+
+    @classmethod
+    def from_env(cls) -> Optional["ResultCache"]:
+        """
+        Builds the cache configured by the TF_IMPORTER_CACHE_TTL environment variable.
+        Returns:
+            Optional[ResultCache]: The cache, or None if it is disabled or cannot be opened.
+        """
+        value = os.environ.get(CACHE_TTL_ENV)
+        if not value:
+            return None
+        logger = logging.getLogger(__name__)
+        try:
+            ttl = float(value)
+        except ValueError:
+            logger.warning("Ignoring %s=%s: expected a number of seconds", CACHE_TTL_ENV, value)
+            return None
+        if ttl <= 0:
+            return None
+        try:
+            return cls(ttl)
+        except (OSError, sqlite3.Error) as e:
+            logger.warning("Persistent result cache disabled: %s", e)
+            return None
+
+    @classmethod
+    def clear_file(cls, path: str = DEFAULT_CACHE_PATH) -> None:
+        """
+        Removes every entry from the cache file at `path`, if it exists, so the next lookups go to AWS.
+        Args:
+            path (str): Path of the SQLite file.
+        """
+        if not os.path.exists(path):
+            return
+        cache = cls(0, path)
+        try:
+            cache.clear()
+        finally:
+            cache._conn.close()
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """
+        Builds a cache key from JSON-serializable parts.
+        Returns:
+            str: A SHA-256 digest of the parts.
+        """
+        encoded = json.dumps(parts, sort_keys=True, default=str)
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Returns the cached value for the key, or None if it is missing or expired.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value FROM results WHERE key = ? AND expires > ?", (key, time.time())
+            ).fetchone()
+        return row[0] if row else None
+
+    def set(self, key: str, value: str) -> None:
+        """
+        Stores a value for the key, valid for the next `ttl` seconds.
+        """
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO results (key, value, expires) VALUES (?, ?, ?)",
+                (key, value, time.time() + self.ttl)
+            )
+
+    def clear(self) -> None:
+        """
+        Removes every entry from the cache.
+        """
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM results")
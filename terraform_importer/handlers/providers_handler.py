@@ -5,8 +5,12 @@ from terraform_importer.providers.bitbucket.bitbucket_provider import BitbucketD
 from terraform_importer.providers.kubernetes.kubernetes_provider import KubernetesProvider
 # from terraform_importer.providers.gcp.gcp_provider import GCPProvider
 from terraform_importer.handlers.json_config_handler import JsonConfigHandler
+from concurrent.futures import ThreadPoolExecutor
 import logging
 
+# Resource lookups are network-bound, so several of them are kept in flight at once
+DEFAULT_MAX_WORKERS = 16
+
 class ProvidersHandler:
     """Handles interaction with all providers."""
 
@@ -17,11 +21,12 @@ class ProvidersHandler:
         # "registry.terraform.io/hashicorp/gcp": GCPProvider
     }
     
-    def __init__(self, provider_config: Dict):
+    def __init__(self, provider_config: Dict, max_workers: int = DEFAULT_MAX_WORKERS):
         """
         Initializes the handler with a list of provider instances.
         Args:
             provider_config: Dict: List of provider objects.
+            max_workers (int): Maximum number of resources resolved concurrently. 1 resolves them one by one.
         """
         # self.providers = {provider.__name__: provider for provider in providers}
         #stript_config = JsonConfigHandler.replace_variables(provider_config["configuration"]["provider_config"], provider_config["variables"])
@@ -29,6 +34,7 @@ class ProvidersHandler:
         #stript_config = JsonConfigHandler.simplify_constant_values(stript_config)
         stript_config = JsonConfigHandler.edit_provider_config(provider_config)
         self.logger = logging.getLogger(__name__)
+        self.max_workers = max_workers
         self.providers = self.init_providers(stript_config)
         # self.validate_providers()
     
@@ -50,12 +56,13 @@ class ProvidersHandler:
                     providers[provider_name] = provider_class(provider_data, provider_name)
                 except Exception as e:
                     self.logger.warning(
-                        f"Failed to initialize provider '{provider_name}' ({provider_full_name}): {e}. "
-                        f"Skipping this provider. The tool will continue without it."
+                        "Failed to initialize provider '%s' (%s): %s. "
+                        "Skipping this provider. The tool will continue without it.",
+                        provider_name, provider_full_name, e
                     )
                     providers[provider_name] = None
             else:
-                self.logger.warning(f"Unhandled provider type: {provider_full_name}")
+                self.logger.warning("Unhandled provider type: %s", provider_full_name)
                 providers[provider_name] = None
         return providers
 
@@ -75,13 +82,43 @@ class ProvidersHandler:
         Returns:
             List[Dict[str, str]]: List of resource details (address and ID).
         """
-        result_list = []
+        self.prefetch_resources(resource_list)
+        if self.max_workers > 1 and len(resource_list) > 1:
+            # executor.map keeps the results in the same order as resource_list
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                results = list(executor.map(self._resolve_resource, resource_list))
+        else:
+            results = [self._resolve_resource(resource) for resource in resource_list]
+        return [result for result in results if result]
+
+    def prefetch_resources(self, resource_list: List[Dict]) -> None:
+        """
+        Hands each provider the resource blocks it will resolve, so it can batch its lookups.
+        Args:
+            resource_list (List[Dict]): The resource blocks that will be resolved.
+        """
+        blocks_by_provider = {}
         for resource in resource_list:
-            resource_type = resource['type']
-            resource = self.get_resource(resource_type, resource)
-            if resource:
-                result_list.append(resource)
-        return result_list
+            blocks_by_provider.setdefault(resource['provider'], []).append(resource)
+        for provider_name, blocks in blocks_by_provider.items():
+            provider = self.providers.get(provider_name)
+            if provider:
+                provider.prefetch(blocks)
+
+    def _resolve_resource(self, resource: Dict) -> Optional[Dict[str, str]]:
+        """
+        Resolves a single resource block to its {address, id} pair.
+        A failure is logged and skipped so it does not abort the other lookups.
+        Args:
+            resource (Dict): The resource block to resolve.
+        Returns:
+            Optional[Dict[str, str]]: Resource details or None if not found.
+        """
+        try:
+            return self.get_resource(resource['type'], resource)
+        except Exception as e:
+            self.logger.error("Failed to resolve resource %s: %s", resource.get('address'), e)
+            return None
     
     def get_resource(self, resource_type: str, resource_block: dict) -> Optional[Dict[str, str]]:
         """
@@ -101,6 +138,6 @@ class ProvidersHandler:
                 if id:
                     return {"address": address, "id": id}
         except KeyError:
-            self.logger.warning(f"Provider type {provider_name} doesnt exist")
+            self.logger.warning("Provider type %s doesnt exist", provider_name)
         return None
         
@@ -36,7 +36,7 @@ class TerraformHandler:
 
         # Ensure the folder exists
         if self.__terraform_folder and not os.path.isdir(self.__terraform_folder):
-            self.logger.error(f"Error: The folder '{self.__terraform_folder}' does not exist.")
+            self.logger.error("Error: The folder '%s' does not exist.", self.__terraform_folder)
             raise ValueError(f"The folder '{self.__terraform_folder}' does not exist.")
 
     def get_terraform_folder(self) -> Optional[str]:
@@ -64,16 +64,16 @@ class TerraformHandler:
             if self.__terraform_folder:
                 os.chdir(self.__terraform_folder)
 
-            self.logger.info(f"Executing command: {' '.join(command)}")
+            self.logger.info("Executing command: %s", ' '.join(command))
             result = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
 
             # self.logger.info(f"Command output:\n{result.stdout}")
             if result.stderr:
-                self.logger.warning(f"Command stderr:\n{result.stderr}")
+                self.logger.warning("Command stderr:\n%s", result.stderr)
 
             return result.stdout, result.stderr, result.returncode
         except Exception as e:
-            self.logger.error(f"An error occurred while running command '{' '.join(command)}': {e}")
+            self.logger.error("An error occurred while running command '%s': %s", ' '.join(command), e)
             return None
         finally:
             # Restore the original working directory
@@ -98,16 +98,16 @@ class TerraformHandler:
                     if message.startswith("Plan"):
                         changes = log_entry.get("changes", {})
                         if changes.get("add", 0) > 0 or changes.get("change", 0) > 0 or changes.get("remove", 0) > 0:
-                            self.logger.info(f"Non-import actions detected: {changes}")
+                            self.logger.info("Non-import actions detected: %s", changes)
                             return True
                 except json.JSONDecodeError:
-                    self.logger.warning(f"Invalid JSON entry in log: {line}")
+                    self.logger.warning("Invalid JSON entry in log: %s", line)
                     continue
 
             self.logger.info("Only import actions detected in the plan.")
             return False
         except Exception as e:
-            self.logger.error(f"Error while checking for imports: {e}")
+            self.logger.error("Error while checking for imports: %s", e)
             return True
 
     def apply_if_only_import(self, targets: List[str]) -> None:
@@ -132,9 +132,9 @@ class TerraformHandler:
             if return_code == 0:
                 self.logger.info("Terraform apply completed successfully.")
             else:
-                self.logger.error(f"Terraform apply failed:\n{stderr}")
+                self.logger.error("Terraform apply failed:\n%s", stderr)
         except Exception as e:
-            self.logger.error(f"Error during apply operation: {e}")
+            self.logger.error("Error during apply operation: %s", e)
 
     def run_terraform_plan(self, targets: List[str]) -> None:
         """
@@ -156,7 +156,7 @@ class TerraformHandler:
                 self.logger.error("Terraform plan failed.")
                 exit(1)
         except Exception as e:
-            self.logger.error(f"Error during plan operation: {e}")
+            self.logger.error("Error during plan operation: %s", e)
 
     def run_terraform_show(self, file_path: Optional[str] = None) -> Optional[Dict]:
         """
@@ -182,7 +182,7 @@ class TerraformHandler:
                 self.logger.error(stderr)
                 exit(1)
         except Exception as e:
-            self.logger.error(f"Error during `terraform show`: {e}")
+            self.logger.error("Error during `terraform show`: %s", e)
         return None
 
     def save_json_plan(self, json_data: Dict, file_path: str) -> None:
@@ -196,6 +196,6 @@ class TerraformHandler:
         try:
             with open(file_path, 'w') as file:
                 json.dump(json_data, file, indent=4)
-            self.logger.info(f"Terraform plan JSON saved to {file_path}")
+            self.logger.info("Terraform plan JSON saved to %s", file_path)
         except Exception as e:
-            self.logger.error(f"Failed to save Terraform plan JSON: {e}")
+            self.logger.error("Failed to save Terraform plan JSON: %s", e)
@@ -1,5 +1,6 @@
 from terraform_importer.manager import Manager
 from terraform_importer.cli import TerraformImporterCLI
+from terraform_importer.handlers.cache_handler import ResultCache
 import logging
 
 def main():
@@ -23,12 +24,17 @@ def main():
         options.extend(option_string.split())
     targets = args.target
 
-    logging.debug(f"Config path: {terraform_config_path}")
-    logging.debug(f"Options: {options}")
-    logging.debug(f"Targets: {targets}")
+    logging.debug("Config path: %s", terraform_config_path)
+    logging.debug("Options: %s", options)
+    logging.debug("Targets: %s", targets)
+    logging.debug("Max workers: %s", args.max_workers)
+
+    if args.clear_cache:
+        logger.info("Clearing the persistent result cache")
+        ResultCache.clear_file()
 
     # Run the manager
-    manager = Manager(terraform_config_path, options, targets)
+    manager = Manager(terraform_config_path, options, targets, args.max_workers)
     manager.run()
 
 if __name__ == "__main__":
@@ -1,20 +1,23 @@
 from terraform_importer.handlers.terraform_handler import TerraformHandler
 from terraform_importer.generators.import_block_generator import ImportBlockGenerator
+from terraform_importer.handlers.providers_handler import DEFAULT_MAX_WORKERS
 from typing import List, Optional
 
 class Manager:
     """Orchestrates the process of generating and importing resources."""
     
-    def __init__(self, terraform_config_path: str, options: Optional[List[str]] = None, targets: Optional[List[str]] = None):
+    def __init__(self, terraform_config_path: str, options: Optional[List[str]] = None, targets: Optional[List[str]] = None,
+                 max_workers: int = DEFAULT_MAX_WORKERS):
         """
         Initializes the manager with dependencies.
         Args:
             providers (List[BaseProvider]): List of provider instances.
             terraform_config_path (str): Path to Terraform configurations.
             output_path (str): Path to save the import file.
+            max_workers (int): Maximum number of resources looked up concurrently.
         """
         self.tf_handler = TerraformHandler(terraform_config_path, options)
-        self.import_block_generator = ImportBlockGenerator(self.tf_handler)
+        self.import_block_generator = ImportBlockGenerator(self.tf_handler, max_workers)
         self.targets = targets
     def run(self) -> None:
         """
@@ -1,11 +1,14 @@
 from terraform_importer.providers.base_provider import BaseProvider
 from typing import List, Optional, Dict
-from terraform_importer.providers.aws.aws_services.base import BaseAWSService
+from terraform_importer.providers.aws.aws_services.base import BaseAWSService, CLIENT_CACHE
 from terraform_importer.providers.aws.aws_services.aws_auth import AWSAuthHandler
+from terraform_importer.handlers.cache_handler import ResultCache
+from concurrent.futures import ThreadPoolExecutor
 import os
 import importlib.util
 import logging
 import inspect
+import threading
 import boto3
 
 # AWS Provider
@@ -20,6 +23,11 @@ class AWSProvider(BaseProvider):
         self._sessions = self.auth_handler.get_session()
         self._resources_dict = {}
         self.logger = logging.getLogger(__name__)
+        # Resolved IDs persisted across runs, enabled through TF_IMPORTER_CACHE_TTL
+        self._result_cache = ResultCache.from_env()
+        self._account_id: Optional[str] = None
+        # Guards the one-time account lookup that the persistent cache is keyed by
+        self._account_lock = threading.Lock()
         
         # Discover and instantiate all subclasses of BaseAWSService
         # Get the directory of this file and construct path to aws_services
@@ -70,10 +78,81 @@ class AWSProvider(BaseProvider):
 
         return subclasses
     
+    def prefetch(self, resource_blocks: List[Dict]) -> None:
+        """
+        Lets every service warm its caches for the given resources. Services are prefetched
+        concurrently and a failing prefetch only falls back to per-resource lookups.
+        Resources already held by the persistent result cache are left out.
+        Args:
+            resource_blocks (List[Dict]): The resource blocks that will be resolved.
+        """
+        result_cache = self._get_result_cache()
+        blocks_by_service = {}
+        for block in resource_blocks:
+            service = self._resources_dict.get(block['type'])
+            if not service:
+                continue
+            if result_cache is not None and result_cache.get(self._result_cache_key(block['type'], block)) is not None:
+                continue
+            blocks_by_service.setdefault(service, {}).setdefault(block['type'], []).append(block)
+        if not blocks_by_service:
+            return
+
+        with ThreadPoolExecutor(max_workers=len(blocks_by_service)) as executor:
+            futures = {
+                service: executor.submit(service.prefetch, blocks)
+                for service, blocks in blocks_by_service.items()
+            }
+            for service, future in futures.items():
+                try:
+                    future.result()
+                except Exception as e:
+                    self.logger.warning("Prefetch failed for %s: %s", type(service).__name__, e)
+
     def get_id(self, resource_type: str, resource_block: dict) -> Optional[str]:
-        try: 
-            id = self._resources_dict[resource_type].get_id(resource_type, resource_block)
-        except KeyError:
-            self.logger.warning(f"resource type {resource_type} doesnt exist")
+        service = self._resources_dict.get(resource_type)
+        if service is None:
+            self.logger.warning("resource type %s doesnt exist", resource_type)
             return None
+
+        result_cache = self._get_result_cache()
+        if result_cache is not None:
+            cache_key = self._result_cache_key(resource_type, resource_block)
+            cached_id = result_cache.get(cache_key)
+            if cached_id is not None:
+                return cached_id
+
+        id = service.get_id(resource_type, resource_block)
+        if id is not None and result_cache is not None:
+            result_cache.set(cache_key, id)
         return id
+
+    def _get_result_cache(self) -> Optional[ResultCache]:
+        """
+        Returns the persistent result cache, looking up the AWS account it is keyed by on first use.
+        The lookup runs once under a lock, and the cache is turned off if the account cannot be determined.
+        Returns:
+            Optional[ResultCache]: The cache, or None if the persistent cache is disabled.
+        """
+        with self._account_lock:
+            if self._result_cache is not None and self._account_id is None:
+                try:
+                    self._account_id = CLIENT_CACHE.get(self._sessions, "sts").get_caller_identity()["Account"]
+                except Exception as e:
+                    self.logger.warning("Persistent result cache disabled, unable to determine the AWS account: %s", e)
+                    self._result_cache = None
+            return self._result_cache
+
+    def _result_cache_key(self, resource_type: str, resource_block: dict) -> str:
+        """
+        Builds the persistent cache key of a resource from the account, region, resource type and
+        planned values. Only called once _get_result_cache() has determined the account.
+        Returns:
+            str: The cache key.
+        """
+        return ResultCache.make_key(
+            self._account_id,
+            self._sessions.region_name,
+            resource_type,
+            resource_block.get("change", {}).get("after"),
+        )
@@ -1,19 +1,27 @@
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
 from abc import ABC, abstractmethod
 import boto3
-import botocore
+from botocore.exceptions import ClientError
 import logging
+import os
 from terraform_importer.providers.aws.aws_services.base import BaseAWSService
 
+logger = logging.getLogger(__name__)
+
 class APIGatewayService(BaseAWSService):
     """
     Handles API Gateway-related resources (e.g., REST APIs, resources, methods, integrations).
     """
-    def __init__(self, session: boto3.Session):
+    def __init__(self, session: boto3.Session, skip_validation: Optional[bool] = None):
         super().__init__(session)
-        self.logger = logging.getLogger(__name__)
+        self.logger = logger
         self.client = self.get_client("apigateway")
-        self._resources = [
+        # When enabled, API Gateway V2 identifiers already present in the plan are trusted
+        # as-is instead of being confirmed with an extra AWS call.
+        if skip_validation is None:
+            skip_validation = os.environ.get("TF_IMPORTER_SKIP_VALIDATION") == "1"
+        self.skip_validation = skip_validation
+        self._resources = (
             "aws_api_gateway_rest_api",
             "aws_api_gateway_resource",
             "aws_api_gateway_method",
@@ -33,16 +41,15 @@ class APIGatewayService(BaseAWSService):
             "aws_apigatewayv2_integration",
             "aws_apigatewayv2_integration_response",
             "aws_apigatewayv2_route"
-        ]
+        )
 
-    def get_resource_list(self) -> List[str]:
+    def get_resource_list(self) -> Tuple[str, ...]:
         """
         Getter for the private API Gateway resources list.
         Returns:
-            list: A copy of the API Gateway resources list.
+            tuple: The API Gateway resources, immutable so no defensive copy is needed.
         """
-        # Return a copy to prevent external modification
-        return self._resources.copy()
+        return self._resources
 
     def aws_api_gateway_rest_api(self, resource):
         """
@@ -55,8 +62,9 @@ class APIGatewayService(BaseAWSService):
             str: The AWS API Gateway REST API ID if it exists, otherwise None.
         """
         try:
-            api_id = resource['change']['after'].get('id')
-            api_name = resource['change']['after'].get('name')
+            after = self._after(resource)
+            api_id = after.get('id')
+            api_name = after.get('name')
             
             if api_id:
                 # If ID is provided, validate it directly
@@ -64,10 +72,10 @@ class APIGatewayService(BaseAWSService):
                     self.client.get_rest_api(restApiId=api_id)
                     return api_id
                 except self.client.exceptions.NotFoundException:
-                    self.logger.warning(f"API Gateway REST API with ID '{api_id}' not found.")
+                    self.logger.warning("API Gateway REST API with ID '%s' not found.", api_id)
                     return None
-                except botocore.exceptions.ClientError as e:
-                    self.logger.warning(f"Error retrieving API Gateway REST API: {e}")
+                except ClientError as e:
+                    self.logger.warning("Error retrieving API Gateway REST API: %s", e)
                     return None
             
             if api_name:
@@ -77,20 +85,20 @@ class APIGatewayService(BaseAWSService):
                     for api in apis.get('items', []):
                         if api.get('name') == api_name:
                             return api['id']
-                    self.logger.warning(f"API Gateway REST API '{api_name}' not found.")
-                except botocore.exceptions.ClientError as e:
-                    self.logger.warning(f"Error retrieving API Gateway REST APIs: {e}")
+                    self.logger.warning("API Gateway REST API '%s' not found.", api_name)
+                except ClientError as e:
+                    self.logger.warning("Error retrieving API Gateway REST APIs: %s", e)
                     return None
             else:
                 self.logger.warning("Missing 'id' or 'name' in resource data")
                 return None
                 
         except KeyError as e:
-            self.logger.warning(f"Missing expected key in resource: {e}")
-        except botocore.exceptions.ClientError as e:
-            self.logger.warning(f"AWS ClientError while validating API Gateway REST API: {e}")
+            self.logger.warning("Missing expected key in resource: %s", e)
+        except ClientError as e:
+            self.logger.warning("AWS ClientError while validating API Gateway REST API: %s", e)
         except Exception as e:
-            self.logger.error(f"Unexpected error occurred: {e}")
+            self.logger.error("Unexpected error occurred: %s", e)
         
         return None
 
@@ -105,10 +113,11 @@ class APIGatewayService(BaseAWSService):
             str: The AWS API Gateway Resource ID in format 'rest_api_id/resource_id' if it exists, otherwise None.
         """
         try:
-            rest_api_id = resource['change']['after'].get('rest_api_id')
-            resource_id = resource['change']['after'].get('id')
-            path = resource['change']['after'].get('path')
-            path_part = resource['change']['after'].get('path_part')
+            after = self._after(resource)
+            rest_api_id = after.get('rest_api_id')
+            resource_id = after.get('id')
+            path = after.get('path')
+            path_part = after.get('path_part')
             
             if not rest_api_id:
                 self.logger.warning("Missing 'rest_api_id' in resource data")
@@ -120,7 +129,7 @@ class APIGatewayService(BaseAWSService):
                     self.client.get_resource(restApiId=rest_api_id, resourceId=resource_id)
                     return f"{rest_api_id}/{resource_id}"
                 except self.client.exceptions.NotFoundException:
-                    self.logger.warning(f"API Gateway Resource with ID '{resource_id}' not found.")
+                    self.logger.warning("API Gateway Resource with ID '%s' not found.", resource_id)
                     return None
             
             # Search by path or path_part
@@ -132,20 +141,20 @@ class APIGatewayService(BaseAWSService):
                             return f"{rest_api_id}/{res['id']}"
                         if path_part and res.get('pathPart') == path_part:
                             return f"{rest_api_id}/{res['id']}"
-                    self.logger.warning(f"API Gateway Resource with path '{path or path_part}' not found.")
-                except botocore.exceptions.ClientError as e:
-                    self.logger.warning(f"Error retrieving API Gateway Resources: {e}")
+                    self.logger.warning("API Gateway Resource with path '%s' not found.", path or path_part)
+                except ClientError as e:
+                    self.logger.warning("Error retrieving API Gateway Resources: %s", e)
                     return None
             else:
                 self.logger.warning("Missing 'id', 'path', or 'path_part' in resource data")
                 return None
                 
         except KeyError as e:
-            self.logger.warning(f"Missing expected key in resource: {e}")
-        except botocore.exceptions.ClientError as e:
-            self.logger.warning(f"AWS ClientError while validating API Gateway Resource: {e}")
+            self.logger.warning("Missing expected key in resource: %s", e)
+        except ClientError as e:
+            self.logger.warning("AWS ClientError while validating API Gateway Resource: %s", e)
         except Exception as e:
-            self.logger.error(f"Unexpected error occurred: {e}")
+            self.logger.error("Unexpected error occurred: %s", e)
         
         return None
 
@@ -160,9 +169,10 @@ class APIGatewayService(BaseAWSService):
             str: The AWS API Gateway Method identifier in format 'rest_api_id/resource_id/http_method' if it exists, otherwise None.
         """
         try:
-            rest_api_id = resource['change']['after'].get('rest_api_id')
-            resource_id = resource['change']['after'].get('resource_id')
-            http_method = resource['change']['after'].get('http_method')
+            after = self._after(resource)
+            rest_api_id = after.get('rest_api_id')
+            resource_id = after.get('resource_id')
+            http_method = after.get('http_method')
             
             if not all([rest_api_id, resource_id, http_method]):
                 self.logger.warning("Missing required fields: 'rest_api_id', 'resource_id', or 'http_method'")
@@ -176,15 +186,15 @@ class APIGatewayService(BaseAWSService):
                 )
                 return f"{rest_api_id}/{resource_id}/{http_method}"
             except self.client.exceptions.NotFoundException:
-                self.logger.warning(f"API Gateway Method '{http_method}' not found for resource '{resource_id}'.")
+                self.logger.warning("API Gateway Method '%s' not found for resource '%s'.", http_method, resource_id)
                 return None
                 
         except KeyError as e:
-            self.logger.warning(f"Missing expected key in resource: {e}")
-        except botocore.exceptions.ClientError as e:
-            self.logger.warning(f"AWS ClientError while validating API Gateway Method: {e}")
+            self.logger.warning("Missing expected key in resource: %s", e)
+        except ClientError as e:
+            self.logger.warning("AWS ClientError while validating API Gateway Method: %s", e)
         except Exception as e:
-            self.logger.error(f"Unexpected error occurred: {e}")
+            self.logger.error("Unexpected error occurred: %s", e)
         
         return None
 
@@ -199,9 +209,10 @@ class APIGatewayService(BaseAWSService):
             str: The AWS API Gateway Integration identifier in format 'rest_api_id/resource_id/http_method' if it exists, otherwise None.
         """
         try:
-            rest_api_id = resource['change']['after'].get('rest_api_id')
-            resource_id = resource['change']['after'].get('resource_id')
-            http_method = resource['change']['after'].get('http_method')
+            after = self._after(resource)
+            rest_api_id = after.get('rest_api_id')
+            resource_id = after.get('resource_id')
+            http_method = after.get('http_method')
             
             if not all([rest_api_id, resource_id, http_method]):
                 self.logger.warning("Missing required fields: 'rest_api_id', 'resource_id', or 'http_method'")
@@ -215,15 +226,15 @@ class APIGatewayService(BaseAWSService):
                 )
                 return f"{rest_api_id}/{resource_id}/{http_method}"
             except self.client.exceptions.NotFoundException:
-                self.logger.warning(f"API Gateway Integration not found for method '{http_method}' on resource '{resource_id}'.")
+                self.logger.warning("API Gateway Integration not found for method '%s' on resource '%s'.", http_method, resource_id)
                 return None
                 
         except KeyError as e:
-            self.logger.warning(f"Missing expected key in resource: {e}")
-        except botocore.exceptions.ClientError as e:
-            self.logger.warning(f"AWS ClientError while validating API Gateway Integration: {e}")
+            self.logger.warning("Missing expected key in resource: %s", e)
+        except ClientError as e:
+            self.logger.warning("AWS ClientError while validating API Gateway Integration: %s", e)
         except Exception as e:
-            self.logger.error(f"Unexpected error occurred: {e}")
+            self.logger.error("Unexpected error occurred: %s", e)
         
         return None
 
@@ -238,8 +249,9 @@ class APIGatewayService(BaseAWSService):
             str: The AWS API Gateway Deployment ID in format 'rest_api_id/deployment_id' if it exists, otherwise None.
         """
         try:
-            rest_api_id = resource['change']['after'].get('rest_api_id')
-            deployment_id = resource['change']['after'].get('id')
+            after = self._after(resource)
+            rest_api_id = after.get('rest_api_id')
+            deployment_id = after.get('id')
             
             if not rest_api_id:
                 self.logger.warning("Missing 'rest_api_id' in resource data")
@@ -251,7 +263,7 @@ class APIGatewayService(BaseAWSService):
                     self.client.get_deployment(restApiId=rest_api_id, deploymentId=deployment_id)
                     return f"{rest_api_id}/{deployment_id}"
                 except self.client.exceptions.NotFoundException:
-                    self.logger.warning(f"API Gateway Deployment with ID '{deployment_id}' not found.")
+                    self.logger.warning("API Gateway Deployment with ID '%s' not found.", deployment_id)
                     return None
             else:
                 # Get the latest deployment
@@ -260,17 +272,17 @@ class APIGatewayService(BaseAWSService):
                     if deployments.get('items'):
                         latest_deployment = deployments['items'][0]
                         return f"{rest_api_id}/{latest_deployment['id']}"
-                    self.logger.warning(f"No deployments found for REST API '{rest_api_id}'.")
-                except botocore.exceptions.ClientError as e:
-                    self.logger.warning(f"Error retrieving API Gateway Deployments: {e}")
+                    self.logger.warning("No deployments found for REST API '%s'.", rest_api_id)
+                except ClientError as e:
+                    self.logger.warning("Error retrieving API Gateway Deployments: %s", e)
                     return None
                 
         except KeyError as e:
-            self.logger.warning(f"Missing expected key in resource: {e}")
-        except botocore.exceptions.ClientError as e:
-            self.logger.warning(f"AWS ClientError while validating API Gateway Deployment: {e}")
+            self.logger.warning("Missing expected key in resource: %s", e)
+        except ClientError as e:
+            self.logger.warning("AWS ClientError while validating API Gateway Deployment: %s", e)
         except Exception as e:
-            self.logger.error(f"Unexpected error occurred: {e}")
+            self.logger.error("Unexpected error occurred: %s", e)
         
         return None
 
@@ -285,8 +297,9 @@ class APIGatewayService(BaseAWSService):
             str: The AWS API Gateway Stage identifier in format 'rest_api_id/stage_name' if it exists, otherwise None.
         """
         try:
-            rest_api_id = resource['change']['after'].get('rest_api_id')
-            stage_name = resource['change']['after'].get('stage_name')
+            after = self._after(resource)
+            rest_api_id = after.get('rest_api_id')
+            stage_name = after.get('stage_name')
             
             if not all([rest_api_id, stage_name]):
                 self.logger.warning("Missing required fields: 'rest_api_id' or 'stage_name'")
@@ -296,15 +309,15 @@ class APIGatewayService(BaseAWSService):
                 self.client.get_stage(restApiId=rest_api_id, stageName=stage_name)
                 return f"{rest_api_id}/{stage_name}"
             except self.client.exceptions.NotFoundException:
-                self.logger.warning(f"API Gateway Stage '{stage_name}' not found for REST API '{rest_api_id}'.")
+                self.logger.warning("API Gateway Stage '%s' not found for REST API '%s'.", stage_name, rest_api_id)
                 return None
                 
         except KeyError as e:
-            self.logger.warning(f"Missing expected key in resource: {e}")
-        except botocore.exceptions.ClientError as e:
-            self.logger.warning(f"AWS ClientError while validating API Gateway Stage: {e}")
+            self.logger.warning("Missing expected key in resource: %s", e)
+        except ClientError as e:
+            self.logger.warning("AWS ClientError while validating API Gateway Stage: %s", e)
         except Exception as e:
-            self.logger.error(f"Unexpected error occurred: {e}")
+            self.logger.error("Unexpected error occurred: %s", e)
         
         return None
 
@@ -319,8 +332,9 @@ class APIGatewayService(BaseAWSService):
             str: The AWS API Gateway API Key ID if it exists, otherwise None.
         """
         try:
-            api_key_id = resource['change']['after'].get('id')
-            name = resource['change']['after'].get('name')
+            after = self._after(resource)
+            api_key_id = after.get('id')
+            name = after.get('name')
             
             if api_key_id:
                 # If ID is provided, validate it directly
@@ -328,7 +342,7 @@ class APIGatewayService(BaseAWSService):
                     self.client.get_api_key(apiKey=api_key_id)
                     return api_key_id
                 except self.client.exceptions.NotFoundException:
-                    self.logger.warning(f"API Gateway API Key with ID '{api_key_id}' not found.")
+                    self.logger.warning("API Gateway API Key with ID '%s' not found.", api_key_id)
                     return None
             
             if name:
@@ -338,20 +352,20 @@ class APIGatewayService(BaseAWSService):
                     for key in api_keys.get('items', []):
                         if key.get('name') == name:
                             return key['id']
-                    self.logger.warning(f"API Gateway API Key '{name}' not found.")
-                except botocore.exceptions.ClientError as e:
-                    self.logger.warning(f"Error retrieving API Gateway API Keys: {e}")
+                    self.logger.warning("API Gateway API Key '%s' not found.", name)
+                except ClientError as e:
+                    self.logger.warning("Error retrieving API Gateway API Keys: %s", e)
                     return None
             else:
                 self.logger.warning("Missing 'id' or 'name' in resource data")
                 return None
                 
         except KeyError as e:
-            self.logger.warning(f"Missing expected key in resource: {e}")
-        except botocore.exceptions.ClientError as e:
-            self.logger.warning(f"AWS ClientError while validating API Gateway API Key: {e}")
+            self.logger.warning("Missing expected key in resource: %s", e)
+        except ClientError as e:
+            self.logger.warning("AWS ClientError while validating API Gateway API Key: %s", e)
         except Exception as e:
-            self.logger.error(f"Unexpected error occurred: {e}")
+            self.logger.error("Unexpected error occurred: %s", e)
         
         return None
 
@@ -366,8 +380,9 @@ class APIGatewayService(BaseAWSService):
             str: The AWS API Gateway Usage Plan ID if it exists, otherwise None.
         """
         try:
-            usage_plan_id = resource['change']['after'].get('id')
-            name = resource['change']['after'].get('name')
+            after = self._after(resource)
+            usage_plan_id = after.get('id')
+            name = after.get('name')
             
             if usage_plan_id:
                 # If ID is provided, validate it directly
@@ -375,7 +390,7 @@ class APIGatewayService(BaseAWSService):
                     self.client.get_usage_plan(usagePlanId=usage_plan_id)
                     return usage_plan_id
                 except self.client.exceptions.NotFoundException:
-                    self.logger.warning(f"API Gateway Usage Plan with ID '{usage_plan_id}' not found.")
+                    self.logger.warning("API Gateway Usage Plan with ID '%s' not found.", usage_plan_id)
                     return None
             
             if name:
@@ -385,20 +400,20 @@ class APIGatewayService(BaseAWSService):
                     for plan in usage_plans.get('items', []):
                         if plan.get('name') == name:
                             return plan['id']
-                    self.logger.warning(f"API Gateway Usage Plan '{name}' not found.")
-                except botocore.exceptions.ClientError as e:
-                    self.logger.warning(f"Error retrieving API Gateway Usage Plans: {e}")
+                    self.logger.warning("API Gateway Usage Plan '%s' not found.", name)
+                except ClientError as e:
+                    self.logger.warning("Error retrieving API Gateway Usage Plans: %s", e)
                     return None
             else:
                 self.logger.warning("Missing 'id' or 'name' in resource data")
                 return None
                 
         except KeyError as e:
-            self.logger.warning(f"Missing expected key in resource: {e}")
-        except botocore.exceptions.ClientError as e:
-            self.logger.warning(f"AWS ClientError while validating API Gateway Usage Plan: {e}")
+            self.logger.warning("Missing expected key in resource: %s", e)
+        except ClientError as e:
+            self.logger.warning("AWS ClientError while validating API Gateway Usage Plan: %s", e)
         except Exception as e:
-            self.logger.error(f"Unexpected error occurred: {e}")
+            self.logger.error("Unexpected error occurred: %s", e)
         
         return None
 
@@ -413,9 +428,10 @@ class APIGatewayService(BaseAWSService):
             str: The AWS API Gateway Authorizer identifier in format 'rest_api_id/authorizer_id' if it exists, otherwise None.
         """
         try:
-            rest_api_id = resource['change']['after'].get('rest_api_id')
-            authorizer_id = resource['change']['after'].get('id')
-            name = resource['change']['after'].get('name')
+            after = self._after(resource)
+            rest_api_id = after.get('rest_api_id')
+            authorizer_id = after.get('id')
+            name = after.get('name')
             
             if not rest_api_id:
                 self.logger.warning("Missing 'rest_api_id' in resource data")
@@ -427,7 +443,7 @@ class APIGatewayService(BaseAWSService):
                     self.client.get_authorizer(restApiId=rest_api_id, authorizerId=authorizer_id)
                     return f"{rest_api_id}/{authorizer_id}"
                 except self.client.exceptions.NotFoundException:
-                    self.logger.warning(f"API Gateway Authorizer with ID '{authorizer_id}' not found.")
+                    self.logger.warning("API Gateway Authorizer with ID '%s' not found.", authorizer_id)
                     return None
             
             if name:
@@ -437,20 +453,20 @@ class APIGatewayService(BaseAWSService):
                     for auth in authorizers.get('items', []):
                         if auth.get('name') == name:
                             return f"{rest_api_id}/{auth['id']}"
-                    self.logger.warning(f"API Gateway Authorizer '{name}' not found.")
-                except botocore.exceptions.ClientError as e:
-                    self.logger.warning(f"Error retrieving API Gateway Authorizers: {e}")
+                    self.logger.warning("API Gateway Authorizer '%s' not found.", name)
+                except ClientError as e:
+                    self.logger.warning("Error retrieving API Gateway Authorizers: %s", e)
                     return None
             else:
                 self.logger.warning("Missing 'id' or 'name' in resource data")
                 return None
                 
         except KeyError as e:
-            self.logger.warning(f"Missing expected key in resource: {e}")
-        except botocore.exceptions.ClientError as e:
-            self.logger.warning(f"AWS ClientError while validating API Gateway Authorizer: {e}")
+            self.logger.warning("Missing expected key in resource: %s", e)
+        except ClientError as e:
+            self.logger.warning("AWS ClientError while validating API Gateway Authorizer: %s", e)
         except Exception as e:
-            self.logger.error(f"Unexpected error occurred: {e}")
+            self.logger.error("Unexpected error occurred: %s", e)
         
         return None
 
@@ -465,10 +481,11 @@ class APIGatewayService(BaseAWSService):
             str: The AWS API Gateway Method Response identifier in format 'rest_api_id/resource_id/http_method/status_code' if it exists, otherwise None.
         """
         try:
-            rest_api_id = resource['change']['after'].get('rest_api_id')
-            resource_id = resource['change']['after'].get('resource_id')
-            http_method = resource['change']['after'].get('http_method')
-            status_code = resource['change']['after'].get('status_code')
+            after = self._after(resource)
+            rest_api_id = after.get('rest_api_id')
+            resource_id = after.get('resource_id')
+            http_method = after.get('http_method')
+            status_code = after.get('status_code')
             
             if not all([rest_api_id, resource_id, http_method, status_code]):
                 self.logger.warning("Missing required fields: 'rest_api_id', 'resource_id', 'http_method', or 'status_code'")
@@ -483,15 +500,15 @@ class APIGatewayService(BaseAWSService):
                 )
                 return f"{rest_api_id}/{resource_id}/{http_method}/{status_code}"
             except self.client.exceptions.NotFoundException:
-                self.logger.warning(f"API Gateway Method Response with status code '{status_code}' not found for method '{http_method}' on resource '{resource_id}'.")
+                self.logger.warning("API Gateway Method Response with status code '%s' not found for method '%s' on resource '%s'.", status_code, http_method, resource_id)
                 return None
                 
         except KeyError as e:
-            self.logger.warning(f"Missing expected key in resource: {e}")
-        except botocore.exceptions.ClientError as e:
-            self.logger.warning(f"AWS ClientError while validating API Gateway Method Response: {e}")
+            self.logger.warning("Missing expected key in resource: %s", e)
+        except ClientError as e:
+            self.logger.warning("AWS ClientError while validating API Gateway Method Response: %s", e)
         except Exception as e:
-            self.logger.error(f"Unexpected error occurred: {e}")
+            self.logger.error("Unexpected error occurred: %s", e)
         
         return None
 
@@ -506,10 +523,11 @@ class APIGatewayService(BaseAWSService):
             str: The AWS API Gateway Integration Response identifier in format 'rest_api_id/resource_id/http_method/status_code' if it exists, otherwise None.
         """
         try:
-            rest_api_id = resource['change']['after'].get('rest_api_id')
-            resource_id = resource['change']['after'].get('resource_id')
-            http_method = resource['change']['after'].get('http_method')
-            status_code = resource['change']['after'].get('status_code')
+            after = self._after(resource)
+            rest_api_id = after.get('rest_api_id')
+            resource_id = after.get('resource_id')
+            http_method = after.get('http_method')
+            status_code = after.get('status_code')
             
             if not all([rest_api_id, resource_id, http_method, status_code]):
                 self.logger.warning("Missing required fields: 'rest_api_id', 'resource_id', 'http_method', or 'status_code'")
@@ -524,15 +542,15 @@ class APIGatewayService(BaseAWSService):
                 )
                 return f"{rest_api_id}/{resource_id}/{http_method}/{status_code}"
             except self.client.exceptions.NotFoundException:
-                self.logger.warning(f"API Gateway Integration Response with status code '{status_code}' not found for method '{http_method}' on resource '{resource_id}'.")
+                self.logger.warning("API Gateway Integration Response with status code '%s' not found for method '%s' on resource '%s'.", status_code, http_method, resource_id)
                 return None
                 
         except KeyError as e:
-            self.logger.warning(f"Missing expected key in resource: {e}")
-        except botocore.exceptions.ClientError as e:
-            self.logger.warning(f"AWS ClientError while validating API Gateway Integration Response: {e}")
+            self.logger.warning("Missing expected key in resource: %s", e)
+        except ClientError as e:
+            self.logger.warning("AWS ClientError while validating API Gateway Integration Response: %s", e)
         except Exception as e:
-            self.logger.error(f"Unexpected error occurred: {e}")
+            self.logger.error("Unexpected error occurred: %s", e)
         
         return None
     
@@ -547,8 +565,9 @@ class APIGatewayService(BaseAWSService):
             str: The AWS API Gateway V2 API ID if it exists, otherwise None.
         """
         try:
-            api_id = resource['change']['after'].get('id')
-            name = resource['change']['after'].get('name')
+            after = self._after(resource)
+            api_id = after.get('id')
+            name = after.get('name')
             
             # Get the apigatewayv2 client for HTTP/WebSocket APIs
             v2_client = self.get_client("apigatewayv2")
@@ -559,7 +578,7 @@ class APIGatewayService(BaseAWSService):
                     v2_client.get_api(ApiId=api_id)
                     return api_id
                 except v2_client.exceptions.NotFoundException:
-                    self.logger.warning(f"API Gateway V2 API with ID '{api_id}' not found.")
+                    self.logger.warning("API Gateway V2 API with ID '%s' not found.", api_id)
                     return None
             
             if name:
@@ -569,20 +588,20 @@ class APIGatewayService(BaseAWSService):
                     for api in apis.get('Items', []):
                         if api.get('Name') == name:
                             return api['ApiId']
-                    self.logger.warning(f"API Gateway V2 API '{name}' not found.")
-                except botocore.exceptions.ClientError as e:
-                    self.logger.warning(f"Error retrieving API Gateway V2 APIs: {e}")
+                    self.logger.warning("API Gateway V2 API '%s' not found.", name)
+                except ClientError as e:
+                    self.logger.warning("Error retrieving API Gateway V2 APIs: %s", e)
                     return None
             else:
                 self.logger.warning("Missing 'id' or 'name' in resource data")
                 return None
                 
         except KeyError as e:
-            self.logger.warning(f"Missing expected key in resource: {e}")
-        except botocore.exceptions.ClientError as e:
-            self.logger.warning(f"AWS ClientError while validating API Gateway V2 API: {e}")
+            self.logger.warning("Missing expected key in resource: %s", e)
+        except ClientError as e:
+            self.logger.warning("AWS ClientError while validating API Gateway V2 API: %s", e)
         except Exception as e:
-            self.logger.error(f"Unexpected error occurred: {e}")
+            self.logger.error("Unexpected error occurred: %s", e)
         
         return None
 
@@ -597,9 +616,10 @@ class APIGatewayService(BaseAWSService):
             str: The AWS API Gateway V2 Authorizer identifier in format 'api_id/authorizer_id' if it exists, otherwise None.
         """
         try:
-            api_id = resource['change']['after'].get('api_id')
-            authorizer_id = resource['change']['after'].get('id')
-            name = resource['change']['after'].get('name')
+            after = self._after(resource)
+            api_id = after.get('api_id')
+            authorizer_id = after.get('id')
+            name = after.get('name')
             
             if not api_id:
                 self.logger.warning("Missing 'api_id' in resource data")
@@ -614,7 +634,7 @@ class APIGatewayService(BaseAWSService):
                     v2_client.get_authorizer(ApiId=api_id, AuthorizerId=authorizer_id)
                     return f"{api_id}/{authorizer_id}"
                 except v2_client.exceptions.NotFoundException:
-                    self.logger.warning(f"API Gateway V2 Authorizer with ID '{authorizer_id}' not found.")
+                    self.logger.warning("API Gateway V2 Authorizer with ID '%s' not found.", authorizer_id)
                     return None
             
             if name:
@@ -624,20 +644,20 @@ class APIGatewayService(BaseAWSService):
                     for auth in authorizers.get('Items', []):
                         if auth.get('Name') == name:
                             return f"{api_id}/{auth['AuthorizerId']}"
-                    self.logger.warning(f"API Gateway V2 Authorizer '{name}' not found.")
-                except botocore.exceptions.ClientError as e:
-                    self.logger.warning(f"Error retrieving API Gateway V2 Authorizers: {e}")
+                    self.logger.warning("API Gateway V2 Authorizer '%s' not found.", name)
+                except ClientError as e:
+                    self.logger.warning("Error retrieving API Gateway V2 Authorizers: %s", e)
                     return None
             else:
                 self.logger.warning("Missing 'id' or 'name' in resource data")
                 return None
                 
         except KeyError as e:
-            self.logger.warning(f"Missing expected key in resource: {e}")
-        except botocore.exceptions.ClientError as e:
-            self.logger.warning(f"AWS ClientError while validating API Gateway V2 Authorizer: {e}")
+            self.logger.warning("Missing expected key in resource: %s", e)
+        except ClientError as e:
+            self.logger.warning("AWS ClientError while validating API Gateway V2 Authorizer: %s", e)
         except Exception as e:
-            self.logger.error(f"Unexpected error occurred: {e}")
+            self.logger.error("Unexpected error occurred: %s", e)
         
         return None
 
@@ -652,9 +672,10 @@ class APIGatewayService(BaseAWSService):
             str: The AWS API Gateway V2 API Mapping identifier in format 'api_mapping_id/domain_name' if it exists, otherwise None.
         """
         try:
-            api_mapping_id = resource['change']['after'].get('id')
-            domain_name = resource['change']['after'].get('domain_name')
-            api_id = resource['change']['after'].get('api_id')
+            after = self._after(resource)
+            api_mapping_id = after.get('id')
+            domain_name = after.get('domain_name')
+            api_id = after.get('api_id')
             
             if not domain_name:
                 self.logger.warning("Missing 'domain_name' in resource data")
@@ -669,7 +690,7 @@ class APIGatewayService(BaseAWSService):
                     v2_client.get_api_mapping(ApiMappingId=api_mapping_id, DomainName=domain_name)
                     return f"{api_mapping_id}/{domain_name}"
                 except v2_client.exceptions.NotFoundException:
-                    self.logger.warning(f"API Gateway V2 API Mapping with ID '{api_mapping_id}' not found.")
+                    self.logger.warning("API Gateway V2 API Mapping with ID '%s' not found.", api_mapping_id)
                     return None
             
             if api_id:
@@ -679,20 +700,20 @@ class APIGatewayService(BaseAWSService):
                     for mapping in mappings.get('Items', []):
                         if mapping.get('ApiId') == api_id:
                             return f"{mapping['ApiMappingId']}/{domain_name}"
-                    self.logger.warning(f"API Gateway V2 API Mapping for API '{api_id}' not found on domain '{domain_name}'.")
-                except botocore.exceptions.ClientError as e:
-                    self.logger.warning(f"Error retrieving API Gateway V2 API Mappings: {e}")
+                    self.logger.warning("API Gateway V2 API Mapping for API '%s' not found on domain '%s'.", api_id, domain_name)
+                except ClientError as e:
+                    self.logger.warning("Error retrieving API Gateway V2 API Mappings: %s", e)
                     return None
             else:
                 self.logger.warning("Missing 'id' or 'api_id' in resource data")
                 return None
                 
         except KeyError as e:
-            self.logger.warning(f"Missing expected key in resource: {e}")
-        except botocore.exceptions.ClientError as e:
-            self.logger.warning(f"AWS ClientError while validating API Gateway V2 API Mapping: {e}")
+            self.logger.warning("Missing expected key in resource: %s", e)
+        except ClientError as e:
+            self.logger.warning("AWS ClientError while validating API Gateway V2 API Mapping: %s", e)
         except Exception as e:
-            self.logger.error(f"Unexpected error occurred: {e}")
+            self.logger.error("Unexpected error occurred: %s", e)
         
         return None
 
@@ -707,13 +728,17 @@ class APIGatewayService(BaseAWSService):
             str: The AWS API Gateway V2 Deployment identifier in format 'api_id/deployment_id' if it exists, otherwise None.
         """
         try:
-            api_id = resource['change']['after'].get('api_id')
-            deployment_id = resource['change']['after'].get('id')
+            after = self._after(resource)
+            api_id = after.get('api_id')
+            deployment_id = after.get('id')
             
             if not api_id:
                 self.logger.warning("Missing 'api_id' in resource data")
                 return None
             
+            if deployment_id and self.skip_validation:
+                return f"{api_id}/{deployment_id}"
+            
             # Get the apigatewayv2 client for HTTP/WebSocket APIs
             v2_client = self.get_client("apigatewayv2")
             
@@ -723,7 +748,7 @@ class APIGatewayService(BaseAWSService):
                     v2_client.get_deployment(ApiId=api_id, DeploymentId=deployment_id)
                     return f"{api_id}/{deployment_id}"
                 except v2_client.exceptions.NotFoundException:
-                    self.logger.warning(f"API Gateway V2 Deployment with ID '{deployment_id}' not found.")
+                    self.logger.warning("API Gateway V2 Deployment with ID '%s' not found.", deployment_id)
                     return None
             else:
                 # Get the latest deployment
@@ -732,17 +757,17 @@ class APIGatewayService(BaseAWSService):
                     if deployments.get('Items'):
                         latest_deployment = deployments['Items'][0]
                         return f"{api_id}/{latest_deployment['DeploymentId']}"
-                    self.logger.warning(f"No deployments found for API '{api_id}'.")
-                except botocore.exceptions.ClientError as e:
-                    self.logger.warning(f"Error retrieving API Gateway V2 Deployments: {e}")
+                    self.logger.warning("No deployments found for API '%s'.", api_id)
+                except ClientError as e:
+                    self.logger.warning("Error retrieving API Gateway V2 Deployments: %s", e)
                     return None
                 
         except KeyError as e:
-            self.logger.warning(f"Missing expected key in resource: {e}")
-        except botocore.exceptions.ClientError as e:
-            self.logger.warning(f"AWS ClientError while validating API Gateway V2 Deployment: {e}")
+            self.logger.warning("Missing expected key in resource: %s", e)
+        except ClientError as e:
+            self.logger.warning("AWS ClientError while validating API Gateway V2 Deployment: %s", e)
         except Exception as e:
-            self.logger.error(f"Unexpected error occurred: {e}")
+            self.logger.error("Unexpected error occurred: %s", e)
         
         return None
 
@@ -757,7 +782,8 @@ class APIGatewayService(BaseAWSService):
             str: The AWS API Gateway V2 Domain Name if it exists, otherwise None.
         """
         try:
-            domain_name = resource['change']['after'].get('domain_name')
+            after = self._after(resource)
+            domain_name = after.get('domain_name')
             
             if not domain_name:
                 self.logger.warning("Missing 'domain_name' in resource data")
@@ -770,15 +796,15 @@ class APIGatewayService(BaseAWSService):
                 v2_client.get_domain_name(DomainName=domain_name)
                 return domain_name
             except v2_client.exceptions.NotFoundException:
-                self.logger.warning(f"API Gateway V2 Domain Name '{domain_name}' not found.")
+                self.logger.warning("API Gateway V2 Domain Name '%s' not found.", domain_name)
                 return None
                 
         except KeyError as e:
-            self.logger.warning(f"Missing expected key in resource: {e}")
-        except botocore.exceptions.ClientError as e:
-            self.logger.warning(f"AWS ClientError while validating API Gateway V2 Domain Name: {e}")
+            self.logger.warning("Missing expected key in resource: %s", e)
+        except ClientError as e:
+            self.logger.warning("AWS ClientError while validating API Gateway V2 Domain Name: %s", e)
         except Exception as e:
-            self.logger.error(f"Unexpected error occurred: {e}")
+            self.logger.error("Unexpected error occurred: %s", e)
         
         return None
 
@@ -819,14 +845,18 @@ class APIGatewayService(BaseAWSService):
             str: The AWS API Gateway V2 Integration identifier in format 'api_id/integration_id' if it exists, otherwise None.
         """
         try:
-            api_id = resource['change']['after'].get('api_id')
-            integration_id = resource['change']['after'].get('id')
-            integration_uri = resource['change']['after'].get('integration_uri')
+            after = self._after(resource)
+            api_id = after.get('api_id')
+            integration_id = after.get('id')
+            integration_uri = after.get('integration_uri')
             
             if not api_id:
                 self.logger.warning("Missing 'api_id' in resource data")
                 return None
             
+            if integration_id and self.skip_validation:
+                return f"{api_id}/{integration_id}"
+            
             # Get the apigatewayv2 client for HTTP/WebSocket APIs
             v2_client = self.get_client("apigatewayv2")
             
@@ -836,7 +866,7 @@ class APIGatewayService(BaseAWSService):
                     v2_client.get_integration(ApiId=api_id, IntegrationId=integration_id)
                     return f"{api_id}/{integration_id}"
                 except v2_client.exceptions.NotFoundException:
-                    self.logger.warning(f"API Gateway V2 Integration with ID '{integration_id}' not found.")
+                    self.logger.warning("API Gateway V2 Integration with ID '%s' not found.", integration_id)
                     return None
             
             # Try to find integration by matching route key from integration_uri (for WebSocket APIs)
@@ -854,9 +884,9 @@ class APIGatewayService(BaseAWSService):
                                 # Validate the integration exists
                                 v2_client.get_integration(ApiId=api_id, IntegrationId=found_integration_id)
                                 return f"{api_id}/{found_integration_id}"
-                    self.logger.warning(f"No integration found for route key '{route_key}' in API '{api_id}'.")
-                except botocore.exceptions.ClientError as e:
-                    self.logger.warning(f"Error retrieving API Gateway V2 Routes/Integrations: {e}")
+                    self.logger.warning("No integration found for route key '%s' in API '%s'.", route_key, api_id)
+                except ClientError as e:
+                    self.logger.warning("Error retrieving API Gateway V2 Routes/Integrations: %s", e)
                     return None
             else:
                 # Fallback: get the first integration
@@ -865,17 +895,17 @@ class APIGatewayService(BaseAWSService):
                     if integrations.get('Items'):
                         first_integration = integrations['Items'][0]
                         return f"{api_id}/{first_integration['IntegrationId']}"
-                    self.logger.warning(f"No integrations found for API '{api_id}'.")
-                except botocore.exceptions.ClientError as e:
-                    self.logger.warning(f"Error retrieving API Gateway V2 Integrations: {e}")
+                    self.logger.warning("No integrations found for API '%s'.", api_id)
+                except ClientError as e:
+                    self.logger.warning("Error retrieving API Gateway V2 Integrations: %s", e)
                     return None
                 
         except KeyError as e:
-            self.logger.warning(f"Missing expected key in resource: {e}")
-        except botocore.exceptions.ClientError as e:
-            self.logger.warning(f"AWS ClientError while validating API Gateway V2 Integration: {e}")
+            self.logger.warning("Missing expected key in resource: %s", e)
+        except ClientError as e:
+            self.logger.warning("AWS ClientError while validating API Gateway V2 Integration: %s", e)
         except Exception as e:
-            self.logger.error(f"Unexpected error occurred: {e}")
+            self.logger.error("Unexpected error occurred: %s", e)
         
         return None
 
@@ -890,15 +920,19 @@ class APIGatewayService(BaseAWSService):
             str: The AWS API Gateway V2 Integration Response identifier in format 'api_id/integration_id/integration_response_id' if it exists, otherwise None.
         """
         try:
-            api_id = resource['change']['after'].get('api_id')
-            integration_id = resource['change']['after'].get('integration_id')
-            integration_response_id = resource['change']['after'].get('id')
-            integration_response_key = resource['change']['after'].get('integration_response_key')
+            after = self._after(resource)
+            api_id = after.get('api_id')
+            integration_id = after.get('integration_id')
+            integration_response_id = after.get('id')
+            integration_response_key = after.get('integration_response_key')
             
             if not all([api_id, integration_id]):
                 self.logger.warning("Missing required fields: 'api_id' or 'integration_id'")
                 return None
             
+            if integration_response_id and self.skip_validation:
+                return f"{api_id}/{integration_id}/{integration_response_id}"
+            
             # Get the apigatewayv2 client for HTTP/WebSocket APIs
             v2_client = self.get_client("apigatewayv2")
             
@@ -912,7 +946,7 @@ class APIGatewayService(BaseAWSService):
                     )
                     return f"{api_id}/{integration_id}/{integration_response_id}"
                 except v2_client.exceptions.NotFoundException:
-                    self.logger.warning(f"API Gateway V2 Integration Response with ID '{integration_response_id}' not found.")
+                    self.logger.warning("API Gateway V2 Integration Response with ID '%s' not found.", integration_response_id)
                     return None
             
             if integration_response_key:
@@ -922,20 +956,20 @@ class APIGatewayService(BaseAWSService):
                     for response in responses.get('Items', []):
                         if response.get('IntegrationResponseKey') == integration_response_key:
                             return f"{api_id}/{integration_id}/{response['IntegrationResponseId']}"
-                    self.logger.warning(f"API Gateway V2 Integration Response with key '{integration_response_key}' not found.")
-                except botocore.exceptions.ClientError as e:
-                    self.logger.warning(f"Error retrieving API Gateway V2 Integration Responses: {e}")
+                    self.logger.warning("API Gateway V2 Integration Response with key '%s' not found.", integration_response_key)
+                except ClientError as e:
+                    self.logger.warning("Error retrieving API Gateway V2 Integration Responses: %s", e)
                     return None
             else:
                 self.logger.warning("Missing 'id' or 'integration_response_key' in resource data")
                 return None
                 
         except KeyError as e:
-            self.logger.warning(f"Missing expected key in resource: {e}")
-        except botocore.exceptions.ClientError as e:
-            self.logger.warning(f"AWS ClientError while validating API Gateway V2 Integration Response: {e}")
+            self.logger.warning("Missing expected key in resource: %s", e)
+        except ClientError as e:
+            self.logger.warning("AWS ClientError while validating API Gateway V2 Integration Response: %s", e)
         except Exception as e:
-            self.logger.error(f"Unexpected error occurred: {e}")
+            self.logger.error("Unexpected error occurred: %s", e)
         
         return None
 
@@ -950,14 +984,18 @@ class APIGatewayService(BaseAWSService):
             str: The AWS API Gateway V2 Route identifier in format 'api_id/route_id' if it exists, otherwise None.
         """
         try:
-            api_id = resource['change']['after'].get('api_id')
-            route_id = resource['change']['after'].get('id')
-            route_key = resource['change']['after'].get('route_key')
+            after = self._after(resource)
+            api_id = after.get('api_id')
+            route_id = after.get('id')
+            route_key = after.get('route_key')
             
             if not api_id:
                 self.logger.warning("Missing 'api_id' in resource data")
                 return None
             
+            if route_id and self.skip_validation:
+                return f"{api_id}/{route_id}"
+            
             # Get the apigatewayv2 client for HTTP/WebSocket APIs
             v2_client = self.get_client("apigatewayv2")
             
@@ -967,7 +1005,7 @@ class APIGatewayService(BaseAWSService):
                     v2_client.get_route(ApiId=api_id, RouteId=route_id)
                     return f"{api_id}/{route_id}"
                 except v2_client.exceptions.NotFoundException:
-                    self.logger.warning(f"API Gateway V2 Route with ID '{route_id}' not found.")
+                    self.logger.warning("API Gateway V2 Route with ID '%s' not found.", route_id)
                     return None
             
             if route_key:
@@ -977,19 +1015,19 @@ class APIGatewayService(BaseAWSService):
                     for route in routes.get('Items', []):
                         if route.get('RouteKey') == route_key:
                             return f"{api_id}/{route['RouteId']}"
-                    self.logger.warning(f"API Gateway V2 Route with key '{route_key}' not found.")
-                except botocore.exceptions.ClientError as e:
-                    self.logger.warning(f"Error retrieving API Gateway V2 Routes: {e}")
+                    self.logger.warning("API Gateway V2 Route with key '%s' not found.", route_key)
+                except ClientError as e:
+                    self.logger.warning("Error retrieving API Gateway V2 Routes: %s", e)
                     return None
             else:
                 self.logger.warning("Missing 'id' or 'route_key' in resource data")
                 return None
                 
         except KeyError as e:
-            self.logger.warning(f"Missing expected key in resource: {e}")
-        except botocore.exceptions.ClientError as e:
-            self.logger.warning(f"AWS ClientError while validating API Gateway V2 Route: {e}")
+            self.logger.warning("Missing expected key in resource: %s", e)
+        except ClientError as e:
+            self.logger.warning("AWS ClientError while validating API Gateway V2 Route: %s", e)
         except Exception as e:
-            self.logger.error(f"Unexpected error occurred: {e}")
+            self.logger.error("Unexpected error occurred: %s", e)
         
         return None
\ No newline at end of file
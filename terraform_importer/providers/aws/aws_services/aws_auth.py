@@ -1,6 +1,7 @@
 from typing import Optional
 import boto3
 import logging
+from terraform_importer.providers.aws.aws_services.base import CLIENT_CONFIG
 
 class AWSAuthHandler:
     def __init__(self, auth_config: dict): 
@@ -63,14 +64,14 @@ class AWSAuthHandler:
                 self.secret_key = self.auth_config["expressions"]["secret_key"]
             
         except Exception as e:
-            self.logger.error(f"Failed to create AWS session: {str(e)}")
+            self.logger.error("Failed to create AWS session: %s", str(e))
             raise 
 
     def get_session(self) -> boto3.Session:
         return self.session
 
     def assume_role(self, session: boto3.Session) -> boto3.Session:
-        sts_client = session.client('sts')
+        sts_client = session.client('sts', config=CLIENT_CONFIG)
         assumed_role = sts_client.assume_role(
             RoleArn=self.role_arn,
             RoleSessionName="terraform-importer"
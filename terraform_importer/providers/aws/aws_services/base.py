@@ -1,36 +1,180 @@
-from typing import List, Optional, Dict
+from typing import Any, Callable, List, Optional, Dict, Sequence, Tuple
 from abc import ABC, abstractmethod
 import boto3
+from botocore.config import Config
 import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# Shared botocore client settings: short timeouts so one stalled call cannot hold up the
+# whole run, TCP keep-alive and a connection pool large enough for concurrent lookups,
+# and adaptive retries for throttling.
+CLIENT_CONFIG = Config(
+    connect_timeout=3,
+    read_timeout=10,
+    tcp_keepalive=True,
+    max_pool_connections=50,
+    retries={'mode': 'adaptive', 'max_attempts': 5},
+)
+
+# Client-side cap on AWS requests, shared by every client so concurrent lookups
+# smooth out into a steady rate instead of bursting into throttling errors.
+REQUESTS_PER_SECOND = 25
+REQUESTS_BURST = 50
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket allowing `rate` requests per second with bursts of up to `capacity`.
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, **kwargs) -> None:
+        """
+        Blocks until a token is available. Accepts and ignores keyword arguments so it can be
+        registered directly as a botocore 'before-send' event handler.
+        """
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+REQUEST_LIMITER = TokenBucket(REQUESTS_PER_SECOND, REQUESTS_BURST)
+
+
+class ClientCache:
+    """
+    Thread-safe, process-wide cache of boto3 clients keyed by session, service name and region,
+    so services sharing a session also share their clients instead of building one each.
+    """
+
+    def __init__(self):
+        self._clients: Dict[Tuple[boto3.Session, str, Optional[str]], Any] = {}
+        self._lock = threading.Lock()
+
+    def get(self, session: boto3.Session, service_name: str):
+        """
+        Returns the client for the service, creating it on first use.
+        Every request sent by the client first takes a token from the shared REQUEST_LIMITER.
+        Args:
+            session (boto3.Session): The session the client is created from.
+            service_name (str): The name of the AWS service (e.g., 'ec2', 'iam').
+        Returns:
+            boto3.client: A boto3 client for the specified service.
+        """
+        key = (session, service_name, session.region_name)
+        # Creation is serialized as well, since boto3 sessions are not thread-safe
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                client = session.client(service_name, config=CLIENT_CONFIG)
+                client.meta.events.register('before-send', REQUEST_LIMITER.acquire, unique_id='terraform-importer-rate-limit')
+                self._clients[key] = client
+        return client
+
+
+CLIENT_CACHE = ClientCache()
 
 # Abstract Base Class for AWS Services
 class BaseAWSService(ABC):
     """
     Abstract base class for AWS service handlers (e.g., EC2, VPC).
     """
+    # Resource types that can be validated from one paginated listing:
+    # resource type -> (paginator name, paginate arguments, response key, identifier field)
+    LISTINGS: Dict[str, Tuple[str, Dict, str, str]] = {}
+    # Number of planned resources of one type from which a single paginated listing
+    # is cheaper than one lookup per resource
+    LIST_PREFETCH_THRESHOLD = 5
 
     def __init__(self, session: boto3.Session ):
         # Shared data for all AWS services
         self.session = session
-        self.logger = logging.getLogger(__name__)
+        self.logger = logger
+        # Maps each supported resource type to its bound handler, built on first use
+        self._dispatch: Optional[Dict[str, Callable]] = None
+        # Identifiers of existing resources, by resource type, for the types listed by _prefetch_listings()
+        self._listings: Dict[str, set] = {}
     
     def get_client(self, service_name: str):
         """
-        Creates a boto3 client for the specified AWS service.
+        Returns the boto3 client for the specified AWS service from the shared CLIENT_CACHE.
         Args: 
             service_name (str): The name of the AWS service (e.g., 'ec2', 'vpc').
         Returns:
             boto3.client: A boto3 client for the specified service.
         """
-        return self.session.client(service_name)
+        return CLIENT_CACHE.get(self.session, service_name)
 
 
     @abstractmethod
-    def get_resource_list(self) -> List[str]:
+    def get_resource_list(self) -> Sequence[str]:
         """
+        Returns the resource types handled by this service.
         """
         pass
     
+    def prefetch(self, resource_blocks: Dict[str, List[Dict]]) -> None:
+        """
+        Optional hook to warm the service's caches with batched AWS calls before the
+        resources are resolved one by one. The default implementation does nothing.
+        Args:
+            resource_blocks (Dict[str, List[Dict]]): Resource blocks grouped by resource type.
+        """
+        pass
+
+    def _prefetch_listings(self, client, resource_blocks: Dict[str, List[Dict]]) -> None:
+        """
+        Pages through the listing of every type in LISTINGS with at least LIST_PREFETCH_THRESHOLD
+        planned resources and keeps the identifiers it returns for _check_listing().
+        Args:
+            client (boto3.client): The client serving the listings.
+            resource_blocks (Dict[str, List[Dict]]): Resource blocks grouped by resource type.
+        """
+        for resource_type, (operation, arguments, response_key, field) in self.LISTINGS.items():
+            if len(resource_blocks.get(resource_type, [])) < self.LIST_PREFETCH_THRESHOLD:
+                continue
+            identifiers = set()
+            paginator = client.get_paginator(operation)
+            for page in paginator.paginate(**arguments):
+                identifiers.update(item[field] for item in page.get(response_key, []))
+            self._listings[resource_type] = identifiers
+
+    def _check_listing(self, resource_type: str, identifier: str, label: str) -> Optional[bool]:
+        """
+        Looks an identifier up in the completed listing of its resource type. A listing is
+        authoritative, so an identifier missing from it does not exist and is logged as such.
+        Args:
+            resource_type (str): The type of the resource (e.g., 'aws_iam_role').
+            identifier (str): The identifier to look up.
+            label (str): Human readable resource kind used in the not-found warning.
+        Returns:
+            Optional[bool]: True if listed, False if missing from the listing,
+            or None if the type was not listed and must be looked up.
+        """
+        listing = self._listings.get(resource_type)
+        if listing is None:
+            return None
+        if identifier in listing:
+            return True
+        self.logger.warning("%s '%s' does not exist.", label, identifier)
+        return False
+
     def get_id(self, resource_type: str, resource_block: Dict) -> Optional[str]:
         """
         Fetches the ID for a specific resource type and resource block.
@@ -40,11 +184,36 @@ class BaseAWSService(ABC):
         Returns:
             Optional[str]: Resource ID if found, or None if not found.
         """
-        if hasattr(self, resource_type):
-            method = getattr(self, resource_type)
-            return method(resource_block)
-        else:
-            self.logger.info(f"No such resource_type: {resource_type}")
+        method = self._get_dispatch_table().get(resource_type)
+        if method is None:
+            self.logger.info("No such resource_type: %s", resource_type)
             return None
+        return method(resource_block)
+
+    def _get_dispatch_table(self) -> Dict[str, Callable]:
+        """
+        Returns the mapping of supported resource types to their handler methods.
+        The table is built once from get_resource_list() and reused for every lookup.
+        Returns:
+            Dict[str, Callable]: Resource type to bound handler method.
+        """
+        if self._dispatch is None:
+            self._dispatch = {
+                resource_type: getattr(self, resource_type)
+                for resource_type in self.get_resource_list()
+                if hasattr(self, resource_type)
+            }
+        return self._dispatch
 
     
+
+    @staticmethod
+    def _after(resource: Dict) -> Dict:
+        """
+        Returns the planned attributes ('change.after') of a resource block.
+        Args:
+            resource (Dict): The resource block from the Terraform plan.
+        Returns:
+            Dict: The planned attributes, or an empty dict if the block has none.
+        """
+        return (resource.get('change') or {}).get('after') or {}
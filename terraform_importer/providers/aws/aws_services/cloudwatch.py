@@ -1,17 +1,19 @@
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
 from abc import ABC, abstractmethod
 import boto3
 import botocore.exceptions
 import logging
 from terraform_importer.providers.aws.aws_services.base import BaseAWSService
 
+logger = logging.getLogger(__name__)
+
 class CloudWatchService(BaseAWSService):
     """
     Handles ECS-related resources (e.g., instances, AMIs).
     """
     def __init__(self, session: boto3.Session):
         super().__init__(session)
-        self.logger = logging.getLogger(__name__)
+        self.logger = logger
         self.logs_client = self.get_client("logs")
         self.events_client = self.get_client("events")
         # Get account ID using STS client
@@ -19,24 +21,22 @@ class CloudWatchService(BaseAWSService):
         self.account_id = sts_client.get_caller_identity()['Account']
         # Get region from session
         self.region = session.region_name
-        self._resources = [
+        self._resources = (
             "aws_cloudwatch_query_definition",
             "aws_cloudwatch_event_target",
             "aws_cloudwatch_log_group",
             "aws_cloudwatch_metric_alarm",
             "aws_cloudwatch_event_rule",
-            "aws_cloudwatch_log_metric_filter",
-            "aws_cloudwatch_query_definition"
-        ]
+            "aws_cloudwatch_log_metric_filter"
+        )
 
-    def get_resource_list(self) -> List[str]:
+    def get_resource_list(self) -> Tuple[str, ...]:
         """
-        Getter for the private EC2 resources list.
+        Getter for the private CloudWatch resources list.
         Returns:
-            list: A copy of the EC2 resources list.
+            tuple: The CloudWatch resources, immutable so no defensive copy is needed.
         """
-        # Return a copy to prevent external modification
-        return self._resources.copy()
+        return self._resources
 
     #def aws_cloudwatch_event_target(self, resource):
     #    return f"{resource['change']['after']['rule']}/{resource['change']['after']['target_id']}"
@@ -51,8 +51,9 @@ class CloudWatchService(BaseAWSService):
         Returns:
             str: The AWS CloudWatch Event Target ID if it exists, otherwise None.
         """
-        rule_name = resource['change']['after']['rule']
-        target_id = resource['change']['after']['target_id']
+        after = self._after(resource)
+        rule_name = after['rule']
+        target_id = after['target_id']
     
         try:
             response = self.events_client.list_targets_by_rule(Rule=rule_name)
@@ -64,11 +65,11 @@ class CloudWatchService(BaseAWSService):
                     return f"{rule_name}/{target_id}"
     
             # If target not found
-            self.logger.warning(f"CloudWatch Event Target '{target_id}' not found in rule '{rule_name}'")
+            self.logger.warning("CloudWatch Event Target '%s' not found in rule '%s'", target_id, rule_name)
             return None
     
         except Exception as e:
-            self.logger.warning(f"Failed to validate CloudWatch Event Target: {e}")
+            self.logger.warning("Failed to validate CloudWatch Event Target: %s", e)
             return None
 
 
@@ -83,7 +84,7 @@ class CloudWatchService(BaseAWSService):
             str: The AWS CloudWatch Log Group name if it exists, otherwise None.
         """
         try:
-            log_group_name = resource['change']['after']['name']
+            log_group_name = self._after(resource)['name']
             
             # Check if the log group exists
             response = self.logs_client.describe_log_groups(logGroupNamePrefix=log_group_name)
@@ -94,15 +95,15 @@ class CloudWatchService(BaseAWSService):
                     return log_group_name
     
             # If log group is not found
-            self.logger.warning(f"CloudWatch Log Group '{log_group_name}' not found")
+            self.logger.warning("CloudWatch Log Group '%s' not found", log_group_name)
             return None
     
         except KeyError as e:
-            self.logger.warning(f"Missing expected key in resource: {e}")
+            self.logger.warning("Missing expected key in resource: %s", e)
         except boto3.exceptions.Boto3Error as e:
-            self.logger.warning(f"Failed to validate CloudWatch Log Group: {e}")
+            self.logger.warning("Failed to validate CloudWatch Log Group: %s", e)
         except Exception as e:
-            self.logger.error(f"An unexpected error occurred: {e}")
+            self.logger.error("An unexpected error occurred: %s", e)
     
         return None
 
@@ -120,7 +121,7 @@ class CloudWatchService(BaseAWSService):
             str: The AWS CloudWatch Event Rule name if it exists, otherwise None.
         """
         try:
-            rule_name = resource['change']['after']['name']
+            rule_name = self._after(resource)['name']
     
             # Check if the event rule exists
             response = self.events_client.list_rules(NamePrefix=rule_name)
@@ -131,15 +132,15 @@ class CloudWatchService(BaseAWSService):
                     return rule_name
     
             # If event rule is not found
-            self.logger.warning(f"CloudWatch Event Rule '{rule_name}' not found")
+            self.logger.warning("CloudWatch Event Rule '%s' not found", rule_name)
             return None
     
         except KeyError as e:
-            self.logger.warning(f"Missing expected key in resource: {e}")
+            self.logger.warning("Missing expected key in resource: %s", e)
         except botocore.exceptions.ClientError as e:
-            self.logger.warning(f"Failed to validate CloudWatch Event Rule: {e}")
+            self.logger.warning("Failed to validate CloudWatch Event Rule: %s", e)
         except Exception as e:
-            self.logger.error(f"An unexpected error occurred: {e}")
+            self.logger.error("An unexpected error occurred: %s", e)
     
         return None
 
@@ -153,9 +154,10 @@ class CloudWatchService(BaseAWSService):
         Returns:
             str: The AWS CloudWatch Log Metric Filter identifier if it exists, otherwise None.
         """
+        after = self._after(resource)
         try:
-            name = resource['change']['after']['name']
-            log_group_name = resource['change']['after']['log_group_name']
+            name = after['name']
+            log_group_name = after['log_group_name']
     
             # Check if the log metric filter exists
             response = self.logs_client.describe_metric_filters(logGroupName=log_group_name, filterNamePrefix=name)
@@ -166,20 +168,20 @@ class CloudWatchService(BaseAWSService):
                     return f"{log_group_name}:{name}"
     
             # If metric filter is not found
-            self.logger.warning(f"CloudWatch Log Metric Filter '{name}' not found in log group '{log_group_name}'")
+            self.logger.warning("CloudWatch Log Metric Filter '%s' not found in log group '%s'", name, log_group_name)
             return None
     
         except KeyError as e:
-            self.logger.warning(f"Missing expected key in resource: {e}")
+            self.logger.warning("Missing expected key in resource: %s", e)
         except boto3.exceptions.Boto3Error as e:
-            self.logger.warning(f"Failed to validate CloudWatch Log Metric Filter: {e}")
+            self.logger.warning("Failed to validate CloudWatch Log Metric Filter: %s", e)
         except Exception as e:
-            self.logger.error(f"An unexpected error occurred: {e}")
+            self.logger.error("An unexpected error occurred: %s", e)
     
         return None
     
     def aws_cloudwatch_query_definition(self, resource, sessions):
-        name = f"{resource['change']['after']['name']}"
+        name = f"{self._after(resource)['name']}"
         """
         Retrieves the ID of an AWS CloudWatch Logs Query Definition by its name.
     
@@ -193,5 +195,5 @@ class CloudWatchService(BaseAWSService):
                 if item['name'] == name:
                     return f"arn:aws:logs:{self.region}:{self.account_id}:query-definition:{item['queryDefinitionId']}"
         except Exception as e:
-            self.logger.warning(f"An error occurred: {e}")
+            self.logger.warning("An error occurred: %s", e)
         return None
@@ -1,33 +1,131 @@
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
 from abc import ABC, abstractmethod
 import boto3
-import botocore.exceptions
+from botocore.exceptions import BotoCoreError, ClientError
 import logging
 from terraform_importer.providers.aws.aws_services.base import BaseAWSService
 
+logger = logging.getLogger(__name__)
+
+# Maximum number of values EC2 accepts in a single describe filter
+FILTER_VALUES_LIMIT = 200
+
 class EC2Service(BaseAWSService):
     """
-    Handles ECS-related resources (e.g., instances, AMIs).
+    Handles EC2-related resources (e.g., security groups, key pairs).
     """
     def __init__(self, session: boto3.Session):
         super().__init__(session)
-        self.logger = logging.getLogger(__name__)
+        self.logger = logger
         self.client = self.get_client("ec2")
-        self._resources = [
+        self._resources = (
             "aws_security_group",
             "aws_security_group_rule",
             "aws_autoscaling_group",
             "aws_key_pair"
-        ]
+        )
+        # Security group rules split by direction and indexed by (protocol, from_port, to_port),
+        # keyed by group ID
+        self._rules_by_sg: Dict[str, Dict[str, Dict[tuple, List[Dict]]]] = {}
+        # Security group IDs by group name and existing key pair names, filled by prefetch()
+        self._sg_by_name: Dict[str, str] = {}
+        self._key_pairs: set = set()
+        # Names prefetch() already filtered for; a covered name missing from the caches does not exist
+        self._sg_names_covered: set = set()
+        self._key_names_covered: set = set()
 
-    def get_resource_list(self) -> List[str]:
+    def get_resource_list(self) -> Tuple[str, ...]:
         """
         Getter for the private EC2 resources list.
         Returns:
-            list: A copy of the EC2 resources list.
+            tuple: The EC2 resources, immutable so no defensive copy is needed.
+        """
+        return self._resources
+
+    def _get_security_group_rules_index(self, security_group_id: str) -> Dict[str, Dict[tuple, List[Dict]]]:
+        """
+        Returns the rules of a security group split into 'ingress' and 'egress', each indexed
+        by (protocol, from_port, to_port).
+        The rules are described once per security group and cached for the rest of the run.
+
+        Args:
+            security_group_id (str): The ID of the security group.
+
+        Returns:
+            dict: Mapping of rule type to a mapping of (protocol, from_port, to_port) to the matching rules.
+        """
+        rules_index = self._rules_by_sg.get(security_group_id)
+        if rules_index is None:
+            response = self.client.describe_security_group_rules(
+                Filters=[{'Name': 'group-id', 'Values': [security_group_id]}]
+            )
+            rules_index = {'ingress': {}, 'egress': {}}
+            for rule in response.get('SecurityGroupRules', []):
+                self._add_rule_to_index(rules_index, rule)
+            self._rules_by_sg[security_group_id] = rules_index
+        return rules_index
+
+    @staticmethod
+    def _add_rule_to_index(rules_index: Dict[str, Dict[tuple, List[Dict]]], rule: Dict) -> None:
+        """
+        Adds a security group rule to its group's index under its direction and
+        (protocol, from_port, to_port) key.
+
+        Args:
+            rules_index (dict): The 'ingress'/'egress' index of the rule's security group.
+            rule (dict): A rule as returned by describe_security_group_rules.
         """
-        # Return a copy to prevent external modification
-        return self._resources.copy()
+        direction = rules_index['egress'] if rule.get('IsEgress', False) else rules_index['ingress']
+        key = (rule.get('IpProtocol'), rule.get('FromPort'), rule.get('ToPort'))
+        direction.setdefault(key, []).append(rule)
+
+    def prefetch(self, resource_blocks: Dict[str, List[Dict]]) -> None:
+        """
+        Describes the security groups, security group rules and key pairs referenced by the
+        given resources with a few batched calls, so the handlers can answer from the cache.
+        Security group and key pair names covered by a completed filter are answered from the
+        cache alone, including names the filter did not return.
+
+        Args:
+            resource_blocks (dict): Resource blocks to be resolved, grouped by resource type.
+        """
+        def planned_values(resource_type: str, field: str) -> List[str]:
+            values = {
+                self._after(block).get(field)
+                for block in resource_blocks.get(resource_type, [])
+            }
+            values.discard(None)
+            return sorted(values)
+
+        group_names = planned_values('aws_security_group', 'name')
+        for i in range(0, len(group_names), FILTER_VALUES_LIMIT):
+            paginator = self.client.get_paginator('describe_security_groups')
+            for page in paginator.paginate(Filters=[{'Name': 'group-name', 'Values': group_names[i:i + FILTER_VALUES_LIMIT]}]):
+                for group in page.get('SecurityGroups', []):
+                    self._sg_by_name.setdefault(group['GroupName'], group['GroupId'])
+            self._sg_names_covered.update(group_names[i:i + FILTER_VALUES_LIMIT])
+
+        group_ids = [
+            group_id for group_id in planned_values('aws_security_group_rule', 'security_group_id')
+            if group_id not in self._rules_by_sg
+        ]
+        for i in range(0, len(group_ids), FILTER_VALUES_LIMIT):
+            chunk = group_ids[i:i + FILTER_VALUES_LIMIT]
+            indexes = {group_id: {'ingress': {}, 'egress': {}} for group_id in chunk}
+            paginator = self.client.get_paginator('describe_security_group_rules')
+            for page in paginator.paginate(Filters=[{'Name': 'group-id', 'Values': chunk}]):
+                for rule in page.get('SecurityGroupRules', []):
+                    if rule.get('GroupId') in indexes:
+                        self._add_rule_to_index(indexes[rule['GroupId']], rule)
+            self._rules_by_sg.update(indexes)
+
+        key_names = planned_values('aws_key_pair', 'key_name')
+        for i in range(0, len(key_names), FILTER_VALUES_LIMIT):
+            response = self.client.describe_key_pairs(
+                Filters=[{'Name': 'key-name', 'Values': key_names[i:i + FILTER_VALUES_LIMIT]}]
+            )
+            self._key_pairs.update(key_pair['KeyName'] for key_pair in response.get('KeyPairs', []))
+            self._key_names_covered.update(key_names[i:i + FILTER_VALUES_LIMIT])
     
     def aws_security_group(self, resource):
         """
@@ -40,7 +138,14 @@ class EC2Service(BaseAWSService):
             str: The AWS Security Group ID if it exists, otherwise None.
         """
         try:
-            name = resource['change']['after']['name']
+            name = self._after(resource)['name']
+    
+            group_id = self._sg_by_name.get(name)
+            if group_id:
+                return group_id
+            if name in self._sg_names_covered:
+                self.logger.warning("Security Group '%s' not found", name)
+                return None
     
             response = self.client.describe_security_groups(
                 Filters=[{'Name': 'group-name', 'Values': [name]}]
@@ -49,15 +154,15 @@ class EC2Service(BaseAWSService):
             if response.get('SecurityGroups'):  # Check if SecurityGroups key exists and is not empty
                 return response['SecurityGroups'][0]['GroupId']
     
-            self.logger.warning(f"Security Group '{name}' not found")
+            self.logger.warning("Security Group '%s' not found", name)
             return None
     
         except KeyError as e:
-            self.logger.warning(f"Missing expected key in resource: {e}")
-        except botocore.exceptions.BotoCoreError as e:
-            self.logger.warning(f"AWS SDK error while describing security groups: {e}")
+            self.logger.warning("Missing expected key in resource: %s", e)
+        except BotoCoreError as e:
+            self.logger.warning("AWS SDK error while describing security groups: %s", e)
         except Exception as e:
-            self.logger.error(f"Unexpected error occurred: {e}")
+            self.logger.error("Unexpected error occurred: %s", e)
     
         return None
     
@@ -73,7 +178,7 @@ class EC2Service(BaseAWSService):
             str: The AWS Security Group Rule ID if it exists, otherwise None.
         """
         try:
-            values = resource['change']['after']
+            values = self._after(resource)
     
             security_group_id = values.get('security_group_id')
             if not security_group_id:
@@ -91,56 +196,44 @@ class EC2Service(BaseAWSService):
     
             # **Validation Step**: Check if the rule exists in AWS
             try:
-                response = self.client.describe_security_group_rules(
-                    Filters=[{'Name': 'group-id', 'Values': [security_group_id]}]
-                )
-                existing_rules = response.get('SecurityGroupRules', [])
+                rules_index = self._get_security_group_rules_index(security_group_id)
+                wanted_cidrs = frozenset(values.get('cidr_blocks') or ())
+                # Identifier used when SecurityGroupRuleId is not available (e.g. test mocks)
+                fallback_rule_id = "_".join((security_group_id, rule_type, protocol, str(from_port), str(to_port)))
     
                 # Match rules based on type, protocol, and ports
-                for rule in existing_rules:
-                    is_egress = rule.get('IsEgress', False)
-                    rule_type_match = 'egress' if is_egress else 'ingress'
+                for rule in rules_index.get(rule_type, {}).get((protocol, from_port, to_port), ()):
+                    rule_id = rule.get('SecurityGroupRuleId') or fallback_rule_id
                     
-                    if (rule_type_match == rule_type and
-                        rule.get('IpProtocol') == protocol and
-                        rule.get('FromPort') == from_port and
-                        rule.get('ToPort') == to_port):
-                        # Get the rule ID, or construct one if not available (for test mocks)
-                        rule_id = rule.get('SecurityGroupRuleId')
-                        if not rule_id:
-                            # Construct identifier when SecurityGroupRuleId is not available
-                            rule_id = f"{security_group_id}_{rule_type}_{protocol}_{from_port}_{to_port}"
-                        
-                        # Check CIDR blocks if provided in resource
-                        if "cidr_blocks" in values and values['cidr_blocks']:
-                            cidr_blocks = values['cidr_blocks']
-                            rule_cidrs = [ip_range.get('CidrIpv4', '') for ip_range in rule.get('CidrIpv4Ranges', [])]
-                            # If CIDR blocks match or rule has no CIDR blocks (legacy rules), consider it a match
-                            if set(cidr_blocks) == set(rule_cidrs) or not rule_cidrs:
-                                return rule_id
-                        # Check source security group if provided
-                        elif "source_security_group_id" in values and values['source_security_group_id']:
-                            source_sg_id = values['source_security_group_id']
-                            rule_sg_id = rule.get('ReferencedGroupInfo', {}).get('GroupId', '')
-                            if source_sg_id == rule_sg_id:
-                                return rule_id
-                        # If no source specified, match any rule with matching type/protocol/ports
-                        else:
+                    # Check CIDR blocks if provided in resource
+                    if wanted_cidrs:
+                        rule_cidrs = frozenset(ip_range.get('CidrIpv4', '') for ip_range in rule.get('CidrIpv4Ranges', ()))
+                        # If CIDR blocks match or rule has no CIDR blocks (legacy rules), consider it a match
+                        if wanted_cidrs == rule_cidrs or not rule_cidrs:
+                            return rule_id
+                    # Check source security group if provided
+                    elif "source_security_group_id" in values and values['source_security_group_id']:
+                        source_sg_id = values['source_security_group_id']
+                        rule_sg_id = rule.get('ReferencedGroupInfo', {}).get('GroupId', '')
+                        if source_sg_id == rule_sg_id:
                             return rule_id
+                    # If no source specified, match any rule with matching type/protocol/ports
+                    else:
+                        return rule_id
     
-                self.logger.warning(f"Security Group Rule not found in AWS")
+                self.logger.warning("Security Group Rule not found in AWS")
                 return None
     
-            except botocore.exceptions.ClientError as e:
-                self.logger.warning(f"AWS ClientError while validating rule: {e}")
+            except ClientError as e:
+                self.logger.warning("AWS ClientError while validating rule: %s", e)
                 return None
     
         except KeyError as e:
-            self.logger.warning(f"Missing expected key in resource: {e}")
-        except botocore.exceptions.BotoCoreError as e:
-            self.logger.warning(f"AWS BotoCoreError: {e}")
+            self.logger.warning("Missing expected key in resource: %s", e)
+        except BotoCoreError as e:
+            self.logger.warning("AWS BotoCoreError: %s", e)
         except Exception as e:
-            self.logger.error(f"Unexpected error occurred: {e}")
+            self.logger.error("Unexpected error occurred: %s", e)
     
         return None
 
@@ -156,7 +249,7 @@ class EC2Service(BaseAWSService):
             str: The AWS Auto Scaling Group name if it exists, otherwise None.
         """
         try:
-            asg_name = resource['change']['after'].get('name')
+            asg_name = self._after(resource).get('name')
     
             if not asg_name:
                 self.logger.warning("Missing 'name' in resource data")
@@ -170,19 +263,19 @@ class EC2Service(BaseAWSService):
                 if response.get('AutoScalingGroups'):
                     return asg_name
     
-                self.logger.warning(f"Auto Scaling Group '{asg_name}' not found in AWS")
+                self.logger.warning("Auto Scaling Group '%s' not found in AWS", asg_name)
                 return None
     
-            except botocore.exceptions.ClientError as e:
-                self.logger.warning(f"AWS ClientError while validating ASG: {e}")
+            except ClientError as e:
+                self.logger.warning("AWS ClientError while validating ASG: %s", e)
                 return None
     
         except KeyError as e:
-            self.logger.warning(f"Missing expected key in resource: {e}")
-        except botocore.exceptions.BotoCoreError as e:
-            self.logger.warning(f"AWS BotoCoreError: {e}")
+            self.logger.warning("Missing expected key in resource: %s", e)
+        except BotoCoreError as e:
+            self.logger.warning("AWS BotoCoreError: %s", e)
         except Exception as e:
-            self.logger.error(f"Unexpected error occurred: {e}")
+            self.logger.error("Unexpected error occurred: %s", e)
     
         return None
 
@@ -200,30 +293,36 @@ class EC2Service(BaseAWSService):
             str: The AWS Key Pair name if it exists, otherwise None.
         """
         try:
-            key_name = resource['change']['after'].get('key_name')
+            key_name = self._after(resource).get('key_name')
     
             if not key_name:
                 self.logger.warning("Missing 'key_name' in resource data")
                 return None
     
+            if key_name in self._key_pairs:
+                return key_name
+            if key_name in self._key_names_covered:
+                self.logger.warning("Key Pair '%s' not found in AWS", key_name)
+                return None
+    
             # **Validation Step**: Check if the Key Pair exists in AWS
             try:
                 response = self.client.describe_key_pairs(KeyNames=[key_name])
                 if response.get('KeyPairs'):
                     return key_name
     
-                self.logger.warning(f"Key Pair '{key_name}' not found in AWS")
+                self.logger.warning("Key Pair '%s' not found in AWS", key_name)
                 return None
     
-            except botocore.exceptions.ClientError as e:
-                self.logger.warning(f"AWS ClientError while validating Key Pair: {e}")
+            except ClientError as e:
+                self.logger.warning("AWS ClientError while validating Key Pair: %s", e)
                 return None
     
         except KeyError as e:
-            self.logger.warning(f"Missing expected key in resource: {e}")
-        except botocore.exceptions.BotoCoreError as e:
-            self.logger.warning(f"AWS BotoCoreError: {e}")
+            self.logger.warning("Missing expected key in resource: %s", e)
+        except BotoCoreError as e:
+            self.logger.warning("AWS BotoCoreError: %s", e)
         except Exception as e:
-            self.logger.error(f"Unexpected error occurred: {e}")
+            self.logger.error("Unexpected error occurred: %s", e)
     
         return None
@@ -1,31 +1,77 @@
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
 import boto3
 import botocore.exceptions
 import logging
 from terraform_importer.providers.aws.aws_services.base import BaseAWSService
 
+logger = logging.getLogger(__name__)
+
+# Maximum number of repository names accepted by a single DescribeRepositories call
+DESCRIBE_REPOSITORIES_LIMIT = 100
+
 class ECRService(BaseAWSService):
     """
     Handles ECR (Elastic Container Registry) related resources (e.g., repositories, registry scanning configuration).
     """
     def __init__(self, session: boto3.Session):
         super().__init__(session)
-        self.logger = logging.getLogger(__name__)
+        self.logger = logger
         self.client = self.get_client("ecr")
-        self._resources = [
+        self._resources = (
             "aws_ecr_repository",
             "aws_ecr_lifecycle_policy",
             "aws_ecr_registry_scanning_configuration"
-        ]
+        )
+        # Repositories described by prefetch(), keyed by repository name
+        self._repo_cache: Dict[str, Dict] = {}
+        # Whether every repository of the registry has been listed into _repo_cache
+        self._repos_listed = False
+        # Whether the account-level registry scanning configuration exists, None until checked
+        self._registry_scanning_configured: Optional[bool] = None
 
-    def get_resource_list(self) -> List[str]:
+    def get_resource_list(self) -> Tuple[str, ...]:
         """
         Getter for the private ECR resources list.
         Returns:
-            list: A copy of the ECR resources list.
+            tuple: The ECR resources, immutable so no defensive copy is needed.
         """
-        # Return a copy to prevent external modification
-        return self._resources.copy()
+        return self._resources
+
+    def prefetch(self, resource_blocks: Dict[str, List[Dict]]) -> None:
+        """
+        Describes all planned ECR repositories in batches of up to 100 names.
+        If a batch names a missing repository, every repository of the registry is listed once instead,
+        so both existing and missing repositories are answered without per-repository lookups.
+        
+        Args:
+            resource_blocks (dict): Resource blocks to be resolved, grouped by resource type.
+        """
+        names = sorted({
+            self._after(block).get('name')
+            for block in resource_blocks.get('aws_ecr_repository', [])
+        } - {None})
+        for i in range(0, len(names), DESCRIBE_REPOSITORIES_LIMIT):
+            chunk = names[i:i + DESCRIBE_REPOSITORIES_LIMIT]
+            try:
+                response = self.client.describe_repositories(repositoryNames=chunk)
+            except botocore.exceptions.ClientError as e:
+                if e.response.get('Error', {}).get('Code', '') != 'RepositoryNotFoundException':
+                    raise
+                self.logger.debug("Batch describe of %s ECR repositories hit a missing repository, listing all repositories", len(chunk))
+                self._list_repositories()
+                return
+            for repository in response.get('repositories', []):
+                self._repo_cache[repository['repositoryName']] = repository
+
+    def _list_repositories(self) -> None:
+        """
+        Lists every repository of the registry and caches them by name for the rest of the run.
+        """
+        paginator = self.client.get_paginator('describe_repositories')
+        for page in paginator.paginate():
+            for repository in page.get('repositories', []):
+                self._repo_cache[repository['repositoryName']] = repository
+        self._repos_listed = True
 
     def aws_ecr_repository(self, resource):
         """
@@ -39,12 +85,19 @@ class ECRService(BaseAWSService):
         """
         repository_name = None
         try:
-            repository_name = resource['change']['after'].get('name')
+            repository_name = self._after(resource).get('name')
             
             if not repository_name:
                 self.logger.warning("ECR repository name is missing in the resource data.")
                 return None
             
+            if repository_name in self._repo_cache:
+                return repository_name
+            # Once every repository has been listed, a name missing from the cache does not exist
+            if self._repos_listed:
+                self.logger.warning("ECR repository '%s' does not exist.", repository_name)
+                return None
+            
             # Check if the repository exists
             try:
                 response = self.client.describe_repositories(repositoryNames=[repository_name])
@@ -53,24 +106,24 @@ class ECRService(BaseAWSService):
                 if response.get('repositories'):
                     return repository_name
                 
-                self.logger.warning(f"ECR repository '{repository_name}' not found.")
+                self.logger.warning("ECR repository '%s' not found.", repository_name)
                 return None
                 
             except self.client.exceptions.RepositoryNotFoundException:
-                self.logger.warning(f"ECR repository '{repository_name}' does not exist.")
+                self.logger.warning("ECR repository '%s' does not exist.", repository_name)
                 return None
                 
         except KeyError as e:
-            self.logger.warning(f"Missing expected key in resource: {e}")
+            self.logger.warning("Missing expected key in resource: %s", e)
         except botocore.exceptions.ClientError as e:
             error_code = e.response.get('Error', {}).get('Code', '')
             if error_code == 'RepositoryNotFoundException':
                 repo_name = repository_name if repository_name else 'unknown'
-                self.logger.warning(f"ECR repository '{repo_name}' does not exist.")
+                self.logger.warning("ECR repository '%s' does not exist.", repo_name)
             else:
-                self.logger.warning(f"AWS ClientError while validating ECR repository: {e}")
+                self.logger.warning("AWS ClientError while validating ECR repository: %s", e)
         except Exception as e:
-            self.logger.error(f"Unexpected error occurred: {e}")
+            self.logger.error("Unexpected error occurred: %s", e)
         
         return None
 
@@ -86,7 +139,7 @@ class ECRService(BaseAWSService):
         """
         repository_name = None
         try:
-            repository_name = resource['change']['after'].get('repository')
+            repository_name = self._after(resource).get('repository')
             
             if not repository_name:
                 self.logger.warning("ECR lifecycle policy repository name is missing in the resource data.")
@@ -100,30 +153,30 @@ class ECRService(BaseAWSService):
                 if response:
                     return repository_name
                 
-                self.logger.warning(f"ECR lifecycle policy for repository '{repository_name}' not found.")
+                self.logger.warning("ECR lifecycle policy for repository '%s' not found.", repository_name)
                 return None
                 
             except self.client.exceptions.LifecyclePolicyNotFoundException:
-                self.logger.warning(f"ECR lifecycle policy for repository '{repository_name}' does not exist.")
+                self.logger.warning("ECR lifecycle policy for repository '%s' does not exist.", repository_name)
                 return None
             except self.client.exceptions.RepositoryNotFoundException:
-                self.logger.warning(f"ECR repository '{repository_name}' does not exist.")
+                self.logger.warning("ECR repository '%s' does not exist.", repository_name)
                 return None
                 
         except KeyError as e:
-            self.logger.warning(f"Missing expected key in resource: {e}")
+            self.logger.warning("Missing expected key in resource: %s", e)
         except botocore.exceptions.ClientError as e:
             error_code = e.response.get('Error', {}).get('Code', '')
             if error_code == 'LifecyclePolicyNotFoundException':
                 repo_name = repository_name if repository_name else 'unknown'
-                self.logger.warning(f"ECR lifecycle policy for repository '{repo_name}' does not exist.")
+                self.logger.warning("ECR lifecycle policy for repository '%s' does not exist.", repo_name)
             elif error_code == 'RepositoryNotFoundException':
                 repo_name = repository_name if repository_name else 'unknown'
-                self.logger.warning(f"ECR repository '{repo_name}' does not exist.")
+                self.logger.warning("ECR repository '%s' does not exist.", repo_name)
             else:
-                self.logger.warning(f"AWS ClientError while validating ECR lifecycle policy: {e}")
+                self.logger.warning("AWS ClientError while validating ECR lifecycle policy: %s", e)
         except Exception as e:
-            self.logger.error(f"Unexpected error occurred: {e}")
+            self.logger.error("Unexpected error occurred: %s", e)
         
         return None
 
@@ -146,12 +199,16 @@ class ECRService(BaseAWSService):
                 self.logger.warning("Missing expected key in resource: 'change' or 'change.after'")
                 return None
             
-            # ECR registry scanning configuration is account-level, so we check if it exists
+            # ECR registry scanning configuration is account-level, so it is checked only once
+            if self._registry_scanning_configured is not None:
+                return "default" if self._registry_scanning_configured else None
+
             try:
                 response = self.client.get_registry_scanning_configuration()
                 
                 # If we can get the registry scanning configuration, it exists
                 # Return a fixed identifier since there's only one per account
+                self._registry_scanning_configured = bool(response)
                 if response:
                     return "default"
                 
@@ -160,14 +217,14 @@ class ECRService(BaseAWSService):
             except botocore.exceptions.ClientError as e:
                 error_code = e.response.get('Error', {}).get('Code', '')
                 if error_code in ['AccessDeniedException', 'InvalidParameterException', 'ValidationException']:
-                    self.logger.warning(f"Unable to access ECR registry scanning configuration: {e}")
+                    self.logger.warning("Unable to access ECR registry scanning configuration: %s", e)
                 else:
-                    self.logger.warning(f"AWS ClientError while validating ECR registry scanning configuration: {e}")
+                    self.logger.warning("AWS ClientError while validating ECR registry scanning configuration: %s", e)
                 return None
                 
         except KeyError as e:
-            self.logger.warning(f"Missing expected key in resource: {e}")
+            self.logger.warning("Missing expected key in resource: %s", e)
         except Exception as e:
-            self.logger.error(f"Unexpected error occurred: {e}")
+            self.logger.error("Unexpected error occurred: %s", e)
         
         return None
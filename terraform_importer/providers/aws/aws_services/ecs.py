@@ -1,34 +1,123 @@
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
 from abc import ABC, abstractmethod
+from functools import cached_property
 import boto3
 import botocore.exceptions
 import logging
 from terraform_importer.providers.aws.aws_services.base import BaseAWSService
 
+logger = logging.getLogger(__name__)
+
+# Maximum number of services accepted by a single describe_services call
+DESCRIBE_SERVICES_LIMIT = 10
+
 class ECSService(BaseAWSService):
     """
     Handles EC2-related resources (e.g., instances, AMIs).
     """
     def __init__(self, session: boto3.Session):
         super().__init__(session)
-        self.logger = logging.getLogger(__name__)
+        self.logger = logger
         self.client = self.get_client("ecs")
-        self.sd_client = self.get_client("servicediscovery")
-        self._resources = [
+        self._resources = (
             "aws_ecs_service",
             "aws_ecs_task_definition",
             "aws_ecs_cluster_capacity_providers",
             "aws_service_discovery_service"
-        ]
+        )
+        # Describe responses, cached per identifier for the rest of the run
+        self._services: Dict[Tuple[str, str], Dict] = {}
+        self._task_definitions: Dict[str, Dict] = {}
+        self._clusters: Dict[str, Dict] = {}
+        # Service Discovery service IDs by name, listed once per namespace
+        self._sd_services_by_namespace: Dict[str, Dict[str, str]] = {}
+
+    def get_resource_list(self) -> Tuple[str, ...]:
+        """
+        Getter for the private ECS resources list.
+        Returns:
+            tuple: The ECS resources, immutable so no defensive copy is needed.
+        """
+        return self._resources
+
+    @cached_property
+    def sd_client(self):
+        """
+        The Service Discovery client, created on first use so plans without
+        aws_service_discovery_service resources never build it.
+        """
+        return self.get_client("servicediscovery")
+
+    def prefetch(self, resource_blocks: Dict[str, List[Dict]]) -> None:
+        """
+        Describes all planned ECS services cluster by cluster, in batches of up to 10 names.
+        Services missing from a batch response are looked up one by one by aws_ecs_service instead.
+
+        Args:
+            resource_blocks (dict): Resource blocks to be resolved, grouped by resource type.
+        """
+        names_by_cluster: Dict[str, set] = {}
+        for block in resource_blocks.get('aws_ecs_service', []):
+            after = self._after(block)
+            if after.get('cluster') and after.get('name'):
+                names_by_cluster.setdefault(after['cluster'], set()).add(after['name'])
+
+        for cluster_name, names in names_by_cluster.items():
+            names = sorted(names)
+            for i in range(0, len(names), DESCRIBE_SERVICES_LIMIT):
+                chunk = names[i:i + DESCRIBE_SERVICES_LIMIT]
+                response = self.client.describe_services(cluster=cluster_name, services=chunk)
+                for service in response.get('services', []):
+                    self._services[(cluster_name, service['serviceName'])] = {'services': [service]}
+
+    def _describe_service(self, cluster_name: str, service_name: str) -> Dict:
+        """
+        Describes an ECS service once and caches the response for the rest of the run.
+        """
+        response = self._services.get((cluster_name, service_name))
+        if response is None:
+            response = self.client.describe_services(cluster=cluster_name, services=[service_name])
+            self._services[(cluster_name, service_name)] = response
+        return response
+
+    def _describe_task_definition(self, family: str) -> Dict:
+        """
+        Describes an ECS task definition once and caches the response for the rest of the run.
+        """
+        response = self._task_definitions.get(family)
+        if response is None:
+            response = self.client.describe_task_definition(taskDefinition=family)
+            self._task_definitions[family] = response
+        return response
+
+    def _describe_cluster(self, cluster_name: str) -> Dict:
+        """
+        Describes an ECS cluster once and caches the response for the rest of the run.
+        """
+        response = self._clusters.get(cluster_name)
+        if response is None:
+            response = self.client.describe_clusters(clusters=[cluster_name])
+            self._clusters[cluster_name] = response
+        return response
 
-    def get_resource_list(self) -> List[str]:
+    def _get_sd_services(self, namespace_id: str) -> Dict[str, str]:
         """
-        Getter for the private EC2 resources list.
+        Lists the Service Discovery services of a namespace once and caches them for the rest of the run.
+
         Returns:
-            list: A copy of the EC2 resources list.
+            dict: Mapping of service name to service ID.
         """
-        # Return a copy to prevent external modification
-        return self._resources.copy()
+        services = self._sd_services_by_namespace.get(namespace_id)
+        if services is None:
+            services = {}
+            paginator = self.sd_client.get_paginator('list_services')
+            for page in paginator.paginate(Filters=[
+                {'Name': 'NAMESPACE_ID', 'Values': [namespace_id], 'Condition': 'EQ'}
+            ]):
+                for service in page.get('Services', []):
+                    services.setdefault(service.get('Name'), service.get('Id'))
+            self._sd_services_by_namespace[namespace_id] = services
+        return services
     
     
     def aws_ecs_service(self, resource):
@@ -41,38 +130,36 @@ class ECSService(BaseAWSService):
         Returns:
             str: The AWS ECS Service name if it exists, otherwise None.
         """
+        after = self._after(resource)
         try:
             # Extract cluster name and service name dynamically
-            cluster_name = resource['change']['after'].get('cluster')
-            service_name = resource['change']['after'].get('name')
+            cluster_name = after.get('cluster')
+            service_name = after.get('name')
     
             if not cluster_name or not service_name:
-                self.logger.warning(f"Missing 'cluster' or 'name' in resource data: {resource['change']['after']}")
+                self.logger.warning("Missing 'cluster' or 'name' in resource data: %s", after)
                 return None
     
             # **Validation Step**: Check if the ECS Service exists in AWS
             try:
-                response = self.client.describe_services(
-                    cluster=cluster_name,
-                    services=[service_name]
-                )
+                response = self._describe_service(cluster_name, service_name)
     
                 if response.get('services') and response['services'][0].get('status') != "INACTIVE":
                     return f"{cluster_name}/{service_name}"
     
-                self.logger.warning(f"ECS Service '{service_name}' not found in cluster '{cluster_name}' or is INACTIVE")
+                self.logger.warning("ECS Service '%s' not found in cluster '%s' or is INACTIVE", service_name, cluster_name)
                 return None
     
             except botocore.exceptions.ClientError as e:
-                self.logger.warning(f"AWS ClientError while validating ECS Service: {e}")
+                self.logger.warning("AWS ClientError while validating ECS Service: %s", e)
                 return None
     
         except KeyError as e:
-            self.logger.warning(f"Missing expected key in resource: {e}")
+            self.logger.warning("Missing expected key in resource: %s", e)
         except botocore.exceptions.BotoCoreError as e:
-            self.logger.warning(f"AWS BotoCoreError: {e}")
+            self.logger.warning("AWS BotoCoreError: %s", e)
         except Exception as e:
-            self.logger.error(f"Unexpected error occurred: {e}")
+            self.logger.error("Unexpected error occurred: %s", e)
     
         return None
 
@@ -89,7 +176,7 @@ class ECSService(BaseAWSService):
         """
         try:
             # Extract the task family name from Terraform resource data
-            name = resource['change']['after'].get('family')
+            name = self._after(resource).get('family')
             
             if not name:
                 self.logger.warning("Missing 'family' key in resource data.")
@@ -97,20 +184,20 @@ class ECSService(BaseAWSService):
     
             # **Validation Step**: Check if the ECS Task Definition exists
             try:
-                response = self.client.describe_task_definition(taskDefinition=name)
+                response = self._describe_task_definition(name)
                 return response['taskDefinition']['taskDefinitionArn']
     
             except botocore.exceptions.ClientError as e:
                 if e.response['Error']['Code'] == 'ClientException' or "not found" in str(e):
-                    self.logger.warning(f"ECS Task Definition '{name}' does not exist.")
+                    self.logger.warning("ECS Task Definition '%s' does not exist.", name)
                 else:
-                    self.logger.warning(f"AWS ClientError while checking ECS Task Definition: {e}")
+                    self.logger.warning("AWS ClientError while checking ECS Task Definition: %s", e)
                 return None
     
         except botocore.exceptions.BotoCoreError as e:
-            self.logger.warning(f"AWS BotoCoreError: {e}")
+            self.logger.warning("AWS BotoCoreError: %s", e)
         except Exception as e:
-            self.logger.error(f"Unexpected error occurred: {e}")
+            self.logger.error("Unexpected error occurred: %s", e)
     
         return None
 
@@ -125,7 +212,7 @@ class ECSService(BaseAWSService):
         Returns:
             str: The ECS Cluster name if it exists, otherwise None.
         """
-        cluster_name = resource['change']['after'].get('cluster_name')
+        cluster_name = self._after(resource).get('cluster_name')
     
         if not cluster_name:
             self.logger.warning("Cluster name is missing in the resource data.")
@@ -133,21 +220,21 @@ class ECSService(BaseAWSService):
     
         try:
             # Validate if the ECS Cluster exists
-            response = self.client.describe_clusters(clusters=[cluster_name])
+            response = self._describe_cluster(cluster_name)
     
             # Check if the cluster exists in the response
             if response['clusters']:
                 return cluster_name
             else:
-                self.logger.warning(f"ECS Cluster '{cluster_name}' does not exist.")
+                self.logger.warning("ECS Cluster '%s' does not exist.", cluster_name)
                 return None
     
         except botocore.exceptions.ClientError as e:
-            self.logger.warning(f"AWS ClientError while validating ECS Cluster: {e}")
+            self.logger.warning("AWS ClientError while validating ECS Cluster: %s", e)
         except botocore.exceptions.BotoCoreError as e:
-            self.logger.warning(f"AWS BotoCoreError: {e}")
+            self.logger.warning("AWS BotoCoreError: %s", e)
         except Exception as e:
-            self.logger.error(f"Unexpected error occurred: {e}")
+            self.logger.error("Unexpected error occurred: %s", e)
     
         return None
 
@@ -161,36 +248,32 @@ class ECSService(BaseAWSService):
         Returns:
             str: The Service Discovery service ID if it exists, otherwise None.
         """
+        after = self._after(resource)
         try:
             # Extract required values
-            namespace_id = resource['change']['after'].get('dns_config', [{}])[0].get('namespace_id')
-            service_name = resource['change']['after'].get('name')
+            namespace_id = after.get('dns_config', [{}])[0].get('namespace_id')
+            service_name = after.get('name')
     
             if not namespace_id or not service_name:
                 self.logger.warning("Missing required values: namespace_id or service_name.")
                 return None
     
-            # Use paginator to iterate through services in the given namespace
-            paginator = self.sd_client.get_paginator('list_services')
-    
-            for page in paginator.paginate(Filters=[
-                {'Name': 'NAMESPACE_ID', 'Values': [namespace_id], 'Condition': 'EQ'}
-            ]):
-                for service in page.get('Services', []):
-                    if service.get('Name') == service_name:
-                        return service.get('Id')
+            # Look the service up among the services listed for the given namespace
+            service_id = self._get_sd_services(namespace_id).get(service_name)
+            if service_id:
+                return service_id
     
             # If no match is found
-            self.logger.warning(f"Service Discovery service '{service_name}' not found in namespace '{namespace_id}'.")
+            self.logger.warning("Service Discovery service '%s' not found in namespace '%s'.", service_name, namespace_id)
             return None
     
         except botocore.exceptions.ClientError as e:
-            self.logger.warning(f"AWS ClientError while validating Service Discovery service: {e}")
+            self.logger.warning("AWS ClientError while validating Service Discovery service: %s", e)
         except botocore.exceptions.BotoCoreError as e:
-            self.logger.warning(f"AWS BotoCoreError: {e}")
+            self.logger.warning("AWS BotoCoreError: %s", e)
         except KeyError as e:
-            self.logger.warning(f"Missing key in resource data: {e}")
+            self.logger.warning("Missing key in resource data: %s", e)
         except Exception as e:
-            self.logger.error(f"Unexpected error occurred: {e}")
+            self.logger.error("Unexpected error occurred: %s", e)
     
         return None
\ No newline at end of file
@@ -1,23 +1,25 @@
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
 from abc import ABC, abstractmethod
 import boto3
 import botocore.exceptions
 import logging
 from terraform_importer.providers.aws.aws_services.base import BaseAWSService
 
+logger = logging.getLogger(__name__)
+
 class GENERALService(BaseAWSService):
     """
     Handles ECS-related resources (e.g., instances, AMIs).
     """
     def __init__(self, session: boto3.Session):
         super().__init__(session)
-        self.logger = logging.getLogger(__name__)
+        self.logger = logger
         self.sqs_client = self.get_client("sqs")
         self.sns_client = self.get_client("sns")
         self.acm_client = self.get_client("acm")
         self.cloudfront_client = self.get_client("cloudfront")
         self.codebuild_client = self.get_client("codebuild")
-        self._resources = [
+        self._resources = (
             "aws_sqs_queue",
             "aws_sns_topic",
             "aws_route53_record",
@@ -28,16 +30,15 @@ class GENERALService(BaseAWSService):
             "aws_codebuild_project",
             "aws_cloudfront_distribution",
             "aws_codebuild_source_credential"
-        ]
+        )
 
-    def get_resource_list(self) -> List[str]:
+    def get_resource_list(self) -> Tuple[str, ...]:
         """
-        Getter for the private EC2 resources list.
+        Getter for the private general resources list.
         Returns:
-            list: A copy of the EC2 resources list.
+            tuple: The general resources, immutable so no defensive copy is needed.
         """
-        # Return a copy to prevent external modification
-        return self._resources.copy()
+        return self._resources
 
     def aws_sqs_queue(self, resource):
         """
@@ -51,7 +52,7 @@ class GENERALService(BaseAWSService):
         """
         try:
             # Extract queue name
-            name = resource['change']['after'].get('name')
+            name = self._after(resource).get('name')
     
             if not name:
                 self.logger.warning("SQS queue name is missing in the resource data.")
@@ -64,19 +65,19 @@ class GENERALService(BaseAWSService):
             if queue_url:
                 return queue_url
     
-            self.logger.warning(f"SQS queue '{name}' not found.")
+            self.logger.warning("SQS queue '%s' not found.", name)
             return None
     
         except self.sqs_client.exceptions.QueueDoesNotExist:
-            self.logger.warning(f"The SQS queue '{name}' does not exist.")
+            self.logger.warning("The SQS queue '%s' does not exist.", name)
         except botocore.exceptions.ClientError as e:
-            self.logger.warning(f"AWS ClientError while validating SQS queue: {e}")
+            self.logger.warning("AWS ClientError while validating SQS queue: %s", e)
         except botocore.exceptions.BotoCoreError as e:
-            self.logger.warning(f"AWS BotoCoreError: {e}")
+            self.logger.warning("AWS BotoCoreError: %s", e)
         except KeyError as e:
-            self.logger.warning(f"Missing key in resource data: {e}")
+            self.logger.warning("Missing key in resource data: %s", e)
         except Exception as e:
-            self.logger.error(f"Unexpected error occurred: {e}")
+            self.logger.error("Unexpected error occurred: %s", e)
     
         return None
 
@@ -93,7 +94,7 @@ class GENERALService(BaseAWSService):
         """
         try:
             # Extract topic name
-            name = resource['change']['after'].get('name')
+            name = self._after(resource).get('name')
     
             if not name:
                 self.logger.warning("SNS topic name is missing in the resource data.")
@@ -112,17 +113,17 @@ class GENERALService(BaseAWSService):
                     if name == topic_arn.split(':')[-1]:
                         return topic_arn
     
-            self.logger.warning(f"The SNS topic '{name}' does not exist.")
+            self.logger.warning("The SNS topic '%s' does not exist.", name)
             return None
     
         except botocore.exceptions.ClientError as e:
-            self.logger.warning(f"AWS ClientError while validating SNS topic: {e}")
+            self.logger.warning("AWS ClientError while validating SNS topic: %s", e)
         except botocore.exceptions.BotoCoreError as e:
-            self.logger.warning(f"AWS BotoCoreError: {e}")
+            self.logger.warning("AWS BotoCoreError: %s", e)
         except KeyError as e:
-            self.logger.warning(f"Missing key in resource data: {e}")
+            self.logger.warning("Missing key in resource data: %s", e)
         except Exception as e:
-            self.logger.error(f"Unexpected error occurred: {e}")
+            self.logger.error("Unexpected error occurred: %s", e)
     
         return None
 
@@ -137,11 +138,12 @@ class GENERALService(BaseAWSService):
         Returns:
             str: The Route 53 record identifier if it exists, otherwise None.
         """
+        after = self._after(resource)
         try:
             # Extract required values
-            zone_id = resource['change']['after'].get('zone_id')
-            name = resource['change']['after'].get('name')
-            record_type = resource['change']['after'].get('type')
+            zone_id = after.get('zone_id')
+            name = after.get('name')
+            record_type = after.get('type')
     
             if not all([zone_id, name, record_type]):
                 self.logger.warning("Missing required Route 53 record attributes in resource data.")
@@ -154,17 +156,17 @@ class GENERALService(BaseAWSService):
                     if record.get('Name') == name and record.get('Type') == record_type:
                         return f"{zone_id}_{name}_{record_type}"
     
-            self.logger.warning(f"Route 53 record '{name}' of type '{record_type}' does not exist in zone '{zone_id}'.")
+            self.logger.warning("Route 53 record '%s' of type '%s' does not exist in zone '%s'.", name, record_type, zone_id)
             return None
     
         except botocore.exceptions.ClientError as e:
-            self.logger.warning(f"AWS ClientError while validating Route 53 record: {e}")
+            self.logger.warning("AWS ClientError while validating Route 53 record: %s", e)
         except botocore.exceptions.BotoCoreError as e:
-            self.logger.warning(f"AWS BotoCoreError: {e}")
+            self.logger.warning("AWS BotoCoreError: %s", e)
         except KeyError as e:
-            self.logger.warning(f"Missing key in resource data: {e}")
+            self.logger.warning("Missing key in resource data: %s", e)
         except Exception as e:
-            self.logger.error(f"Unexpected error occurred: {e}")
+            self.logger.error("Unexpected error occurred: %s", e)
     
         return None
 
@@ -181,7 +183,7 @@ class GENERALService(BaseAWSService):
         """
         try:
             # Extract domain name
-            domain_name = resource['change']['after'].get('domain_name')
+            domain_name = self._after(resource).get('domain_name')
             
             if not domain_name:
                 self.logger.warning("Missing required attribute: 'domain_name'.")
@@ -194,17 +196,17 @@ class GENERALService(BaseAWSService):
                     if cert.get('DomainName') == domain_name:
                         return cert.get('CertificateArn')
     
-            self.logger.warning(f"ACM certificate for domain '{domain_name}' does not exist or is not issued.")
+            self.logger.warning("ACM certificate for domain '%s' does not exist or is not issued.", domain_name)
             return None
     
         except botocore.exceptions.ClientError as e:
-            self.logger.warning(f"AWS ClientError while validating ACM certificate: {e}")
+            self.logger.warning("AWS ClientError while validating ACM certificate: %s", e)
         except botocore.exceptions.BotoCoreError as e:
-            self.logger.warning(f"AWS BotoCoreError: {e}")
+            self.logger.warning("AWS BotoCoreError: %s", e)
         except KeyError as e:
-            self.logger.warning(f"Missing key in resource data: {e}")
+            self.logger.warning("Missing key in resource data: %s", e)
         except Exception as e:
-            self.logger.error(f"Unexpected error occurred: {e}")
+            self.logger.error("Unexpected error occurred: %s", e)
     
         return None
 
@@ -220,7 +222,7 @@ class GENERALService(BaseAWSService):
         """
         try:
             # Extract application name
-            app_name = resource['change']['after'].get('name')
+            app_name = self._after(resource).get('name')
     
             if not app_name:
                 self.logger.warning("Missing required attribute: 'name'.")
@@ -232,17 +234,17 @@ class GENERALService(BaseAWSService):
             if response.get('Applications'):
                 return app_name
     
-            self.logger.warning(f"Elastic Beanstalk application '{app_name}' does not exist.")
+            self.logger.warning("Elastic Beanstalk application '%s' does not exist.", app_name)
             return None
     
         except botocore.exceptions.ClientError as e:
-            self.logger.warning(f"AWS ClientError while validating Elastic Beanstalk application: {e}")
+            self.logger.warning("AWS ClientError while validating Elastic Beanstalk application: %s", e)
         except botocore.exceptions.BotoCoreError as e:
-            self.logger.warning(f"AWS BotoCoreError: {e}")
+            self.logger.warning("AWS BotoCoreError: %s", e)
         except KeyError as e:
-            self.logger.warning(f"Missing key in resource data: {e}")
+            self.logger.warning("Missing key in resource data: %s", e)
         except Exception as e:
-            self.logger.error(f"Unexpected error occurred: {e}")
+            self.logger.error("Unexpected error occurred: %s", e)
     
         return None
 
@@ -259,7 +261,7 @@ class GENERALService(BaseAWSService):
         """
         try:
             # Extract cluster ID
-            cluster_id = resource['change']['after'].get('cluster_id')
+            cluster_id = self._after(resource).get('cluster_id')
      
             if not cluster_id:
                 self.logger.warning("Missing required attribute: 'cluster_id'.")
@@ -274,17 +276,17 @@ class GENERALService(BaseAWSService):
             if response.get('CacheClusters'):
                 return cluster_id
      
-            self.logger.warning(f"ElastiCache cluster '{cluster_id}' does not exist.")
+            self.logger.warning("ElastiCache cluster '%s' does not exist.", cluster_id)
             return None
      
         except botocore.exceptions.ClientError as e:
-            self.logger.warning(f"AWS ClientError while validating ElastiCache cluster: {e}")
+            self.logger.warning("AWS ClientError while validating ElastiCache cluster: %s", e)
         except botocore.exceptions.BotoCoreError as e:
-            self.logger.warning(f"AWS BotoCoreError: {e}")
+            self.logger.warning("AWS BotoCoreError: %s", e)
         except KeyError as e:
-            self.logger.warning(f"Missing key in resource data: {e}")
+            self.logger.warning("Missing key in resource data: %s", e)
         except Exception as e:
-            self.logger.error(f"Unexpected error occurred: {e}")
+            self.logger.error("Unexpected error occurred: %s", e)
      
         return None
 
@@ -301,7 +303,7 @@ class GENERALService(BaseAWSService):
         """
         try:
             # Extract subnet group name
-            subnet_group_name = resource['change']['after'].get('name')
+            subnet_group_name = self._after(resource).get('name')
     
             if not subnet_group_name:
                 self.logger.warning("Missing required attribute: 'name'.")
@@ -315,17 +317,17 @@ class GENERALService(BaseAWSService):
             if response.get('CacheSubnetGroups'):
                 return subnet_group_name
     
-            self.logger.warning(f"ElastiCache Subnet Group '{subnet_group_name}' does not exist.")
+            self.logger.warning("ElastiCache Subnet Group '%s' does not exist.", subnet_group_name)
             return None
     
         except botocore.exceptions.ClientError as e:
-            self.logger.warning(f"AWS ClientError while validating ElastiCache Subnet Group: {e}")
+            self.logger.warning("AWS ClientError while validating ElastiCache Subnet Group: %s", e)
         except botocore.exceptions.BotoCoreError as e:
-            self.logger.warning(f"AWS BotoCoreError: {e}")
+            self.logger.warning("AWS BotoCoreError: %s", e)
         except KeyError as e:
-            self.logger.warning(f"Missing key in resource data: {e}")
+            self.logger.warning("Missing key in resource data: %s", e)
         except Exception as e:
-            self.logger.error(f"Unexpected error occurred: {e}")
+            self.logger.error("Unexpected error occurred: %s", e)
     
         return None
     
@@ -341,7 +343,7 @@ class GENERALService(BaseAWSService):
         """
         try:
             # Extract project name
-            project_name = resource['change']['after'].get('name')
+            project_name = self._after(resource).get('name')
     
             if not project_name:
                 self.logger.warning("Missing required attribute: 'name'.")
@@ -355,17 +357,17 @@ class GENERALService(BaseAWSService):
             if response.get('projects'):
                 return project_name
     
-            self.logger.warning(f"CodeBuild project '{project_name}' does not exist.")
+            self.logger.warning("CodeBuild project '%s' does not exist.", project_name)
             return None
     
         except botocore.exceptions.ClientError as e:
-            self.logger.warning(f"AWS ClientError while validating CodeBuild project: {e}")
+            self.logger.warning("AWS ClientError while validating CodeBuild project: %s", e)
         except botocore.exceptions.BotoCoreError as e:
-            self.logger.warning(f"AWS BotoCoreError: {e}")
+            self.logger.warning("AWS BotoCoreError: %s", e)
         except KeyError as e:
-            self.logger.warning(f"Missing key in resource data: {e}")
+            self.logger.warning("Missing key in resource data: %s", e)
         except Exception as e:
-            self.logger.error(f"Unexpected error occurred: {e}")
+            self.logger.error("Unexpected error occurred: %s", e)
     
         return None
 
@@ -401,7 +403,7 @@ class GENERALService(BaseAWSService):
         """
         try:
             # Extract aliases from the resource
-            aliases = resource['change']['after'].get('aliases')
+            aliases = self._after(resource).get('aliases')
     
             if not aliases:
                 self.logger.warning("No aliases provided in the resource.")
@@ -422,17 +424,17 @@ class GENERALService(BaseAWSService):
                         return distribution['Id']
     
             # If no matching distribution is found
-            self.logger.warning(f"CloudFront distribution with aliases {aliases} does not exist.")
+            self.logger.warning("CloudFront distribution with aliases %s does not exist.", aliases)
             return None
     
         except botocore.exceptions.ClientError as e:
-            self.logger.warning(f"AWS ClientError while validating CloudFront distribution: {e}")
+            self.logger.warning("AWS ClientError while validating CloudFront distribution: %s", e)
         except botocore.exceptions.BotoCoreError as e:
-            self.logger.warning(f"AWS BotoCoreError: {e}")
+            self.logger.warning("AWS BotoCoreError: %s", e)
         except KeyError as e:
-            self.logger.warning(f"Missing key in resource data: {e}")
+            self.logger.warning("Missing key in resource data: %s", e)
         except Exception as e:
-            self.logger.error(f"Unexpected error occurred: {e}")
+            self.logger.error("Unexpected error occurred: %s", e)
     
         return None
 
@@ -449,10 +451,11 @@ class GENERALService(BaseAWSService):
             str: The ARN of the CodeBuild source credential if it exists,
                  otherwise None.
         """
+        after = self._after(resource)
         try:
             # Extract auth_type and server_type from the resource
-            auth_type = resource['change']['after'].get('auth_type')
-            server_type = resource['change']['after'].get('server_type')
+            auth_type = after.get('auth_type')
+            server_type = after.get('server_type')
     
             if not auth_type or not server_type:
                 self.logger.warning("Missing 'auth_type' or 'server_type' in the resource.")
@@ -467,17 +470,17 @@ class GENERALService(BaseAWSService):
                     return credential['arn']
     
             # Log if the credential doesn't exist
-            self.logger.warning(f"CodeBuild source credential with auth_type: {auth_type} and server_type: {server_type} does not exist.")
+            self.logger.warning("CodeBuild source credential with auth_type: %s and server_type: %s does not exist.", auth_type, server_type)
             return None
     
         except botocore.exceptions.ClientError as e:
-            self.logger.warning(f"AWS ClientError while validating CodeBuild source credential: {e}")
+            self.logger.warning("AWS ClientError while validating CodeBuild source credential: %s", e)
         except botocore.exceptions.BotoCoreError as e:
-            self.logger.warning(f"AWS BotoCoreError: {e}")
+            self.logger.warning("AWS BotoCoreError: %s", e)
         except KeyError as e:
-            self.logger.warning(f"Missing key in resource data: {e}")
+            self.logger.warning("Missing key in resource data: %s", e)
         except Exception as e:
-            self.logger.error(f"Unexpected error occurred: {e}")
+            self.logger.error("Unexpected error occurred: %s", e)
     
         return None
 
@@ -1,19 +1,31 @@
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
 from abc import ABC, abstractmethod
+from functools import cached_property
 import boto3
 import botocore
 import logging
 from terraform_importer.providers.aws.aws_services.base import BaseAWSService
 
+logger = logging.getLogger(__name__)
+
 class IAMService(BaseAWSService):
     """
     Handles ECS-related resources (e.g., instances, AMIs).
     """
+    LISTINGS = {
+        "aws_iam_role": ("list_roles", {}, "Roles", "RoleName"),
+        "aws_iam_policy": ("list_policies", {"Scope": "Local"}, "Policies", "Arn"),
+        "aws_iam_user": ("list_users", {}, "Users", "UserName"),
+        "aws_iam_group": ("list_groups", {}, "Groups", "GroupName"),
+        "aws_iam_instance_profile": ("list_instance_profiles", {}, "InstanceProfiles", "InstanceProfileName"),
+    }
+    LIST_PREFETCH_THRESHOLD = 5
+
     def __init__(self, session: boto3.Session):
         super().__init__(session)
-        self.logger = logging.getLogger(__name__)
+        self.logger = logger
         self.client = self.get_client("iam")
-        self._resources = [
+        self._resources = (
             "aws_iam_role",
             "aws_iam_policy",
             "aws_iam_role_policy",
@@ -22,37 +34,83 @@ class IAMService(BaseAWSService):
             "aws_iam_group",
             "aws_iam_instance_profile"
 
-        ]
+        )
+        # ARNs of the managed policies attached to each role, fetched once per role
+        self._attached_policies_by_role: Dict[str, set] = {}
     
-    def get_resource_list(self) -> List[str]:
+    def get_resource_list(self) -> Tuple[str, ...]:
+        """
+        Getter for the private IAM resources list.
+        Returns:
+            tuple: The IAM resources, immutable so no defensive copy is needed.
+        """
+        return self._resources
+
+    @cached_property
+    def account_id(self) -> str:
+        """
+        The AWS account ID of the session, looked up through STS on first use and reused afterwards.
+        """
+        return self.get_client('sts').get_caller_identity()['Account']
+
+    def prefetch(self, resource_blocks: Dict[str, List[Dict]]) -> None:
+        """
+        Lists IAM roles, customer managed policies, users, groups and instance profiles once for
+        every type with at least LIST_PREFETCH_THRESHOLD planned resources, so their handlers can
+        answer from the listing instead of issuing one lookup per resource. A listed type is answered
+        from its listing alone: an identifier missing from it is reported as not existing.
+
+        Args:
+            resource_blocks (dict): Resource blocks to be resolved, grouped by resource type.
+        """
+        self._prefetch_listings(self.client, resource_blocks)
+
+    def _get_attached_role_policies(self, role: str) -> set:
         """
-        Getter for the private EC2 resources list.
+        Returns the ARNs of the managed policies attached to a role.
+        Every page of attachments is listed once per role and cached for the rest of the run.
+
+        Args:
+            role (str): The name of the role.
+
         Returns:
-            list: A copy of the EC2 resources list.
+            set: ARNs of the attached policies.
         """
-        # Return a copy to prevent external modification
-        return self._resources.copy()
+        attached_policies = self._attached_policies_by_role.get(role)
+        if attached_policies is None:
+            paginator = self.client.get_paginator('list_attached_role_policies')
+            attached_policies = {
+                policy["PolicyArn"]
+                for page in paginator.paginate(RoleName=role)
+                for policy in page.get("AttachedPolicies", [])
+            }
+            self._attached_policies_by_role[role] = attached_policies
+        return attached_policies
 
     def aws_iam_role(self, resource):
-        role_name = resource['change']['after'].get('name')
+        role_name = self._after(resource).get('name')
         if not role_name:
             self.logger.warning("Missing role name.")
             return None
+        listed = self._check_listing("aws_iam_role", role_name, "IAM role")
+        if listed is not None:
+            return role_name if listed else None
         try:
             self.client.get_role(RoleName=role_name)
             return role_name
         except self.client.exceptions.NoSuchEntityException:
-            self.logger.warning(f"IAM role '{role_name}' does not exist.")
+            self.logger.warning("IAM role '%s' does not exist.", role_name)
         return None
 
     def aws_iam_policy(self, resource):
-        policy_name = resource['change']['after'].get('name')
+        after = self._after(resource)
+        policy_name = after.get('name')
         if not policy_name:
             self.logger.warning("Missing policy name.")
             return None
         
         # Get path, default to '/' if not specified
-        path = resource['change']['after'].get('path', '/')
+        path = after.get('path', '/')
         
         # Normalize path: ensure it starts with '/' and ends with '/' (unless it's just '/')
         if path == '/':
@@ -67,23 +125,27 @@ class IAMService(BaseAWSService):
             policy_path = path
         
         # Construct ARN: arn:aws:iam::{account}:policy{path}{name}
-        account_id = self.session.client('sts').get_caller_identity()['Account']
-        policy_arn = f"arn:aws:iam::{account_id}:policy{policy_path}{policy_name}"
+        policy_arn = f"arn:aws:iam::{self.account_id}:policy{policy_path}{policy_name}"
+        
+        listed = self._check_listing("aws_iam_policy", policy_arn, "IAM policy")
+        if listed is not None:
+            return policy_arn if listed else None
         
         try:
             self.client.get_policy(PolicyArn=policy_arn)
             return policy_arn
         except self.client.exceptions.NoSuchEntityException:
-            self.logger.warning(f"IAM policy '{policy_arn}' does not exist.")
+            self.logger.warning("IAM policy '%s' does not exist.", policy_arn)
         except botocore.exceptions.ClientError as e:
-            self.logger.warning(f"AWS ClientError while validating IAM policy: {e}")
+            self.logger.warning("AWS ClientError while validating IAM policy: %s", e)
         except Exception as e:
-            self.logger.error(f"Unexpected error occurred: {e}")
+            self.logger.error("Unexpected error occurred: %s", e)
         return None
 
     def aws_iam_role_policy(self, resource):
-        role_name = resource['change']['after'].get('role')
-        policy_name = resource['change']['after'].get('name')
+        after = self._after(resource)
+        role_name = after.get('role')
+        policy_name = after.get('name')
         if not role_name or not policy_name:
             self.logger.warning("Missing role or policy name.")
             return None
@@ -91,56 +153,65 @@ class IAMService(BaseAWSService):
             self.client.get_role_policy(RoleName=role_name, PolicyName=policy_name)
             return f"{role_name}:{policy_name}"
         except self.client.exceptions.NoSuchEntityException:
-            self.logger.warning(f"IAM role policy '{policy_name}' for role '{role_name}' does not exist.")
+            self.logger.warning("IAM role policy '%s' for role '%s' does not exist.", policy_name, role_name)
         return None
 
     def aws_iam_role_policy_attachment(self, resource):
-        role = resource['change']['after'].get('role')
-        policy_arn = resource['change']['after'].get('policy_arn')
+        after = self._after(resource)
+        role = after.get('role')
+        policy_arn = after.get('policy_arn')
         if not role or not policy_arn:
             self.logger.warning("Missing role or policy ARN.")
             return None
         try:
-            attached_policies = self.client.list_attached_role_policies(RoleName=role).get("AttachedPolicies", [])
-            if any(p["PolicyArn"] == policy_arn for p in attached_policies):
+            if policy_arn in self._get_attached_role_policies(role):
                 return f"{role}/{policy_arn}"
-            self.logger.warning(f"Policy '{policy_arn}' not attached to role '{role}'.")
+            self.logger.warning("Policy '%s' not attached to role '%s'.", policy_arn, role)
         except self.client.exceptions.NoSuchEntityException:
-            self.logger.warning(f"IAM role '{role}' does not exist.")
+            self.logger.warning("IAM role '%s' does not exist.", role)
         return None
 
     def aws_iam_user(self, resource):
-        user_name = resource['change']['after'].get('name')
+        user_name = self._after(resource).get('name')
         if not user_name:
             self.logger.warning("Missing user name.")
             return None
+        listed = self._check_listing("aws_iam_user", user_name, "IAM user")
+        if listed is not None:
+            return user_name if listed else None
         try:
             self.client.get_user(UserName=user_name)
             return user_name
         except self.client.exceptions.NoSuchEntityException:
-            self.logger.warning(f"IAM user '{user_name}' does not exist.")
+            self.logger.warning("IAM user '%s' does not exist.", user_name)
         return None
 
     def aws_iam_group(self, resource):
-        group_name = resource['change']['after'].get('name')
+        group_name = self._after(resource).get('name')
         if not group_name:
             self.logger.warning("Missing group name.")
             return None
+        listed = self._check_listing("aws_iam_group", group_name, "IAM group")
+        if listed is not None:
+            return group_name if listed else None
         try:
             self.client.get_group(GroupName=group_name)
             return group_name
         except self.client.exceptions.NoSuchEntityException:
-            self.logger.warning(f"IAM group '{group_name}' does not exist.")
+            self.logger.warning("IAM group '%s' does not exist.", group_name)
         return None
 
     def aws_iam_instance_profile(self, resource):
-        profile_name = resource['change']['after'].get('name')
+        profile_name = self._after(resource).get('name')
         if not profile_name:
             self.logger.warning("Missing instance profile name.")
             return None
+        listed = self._check_listing("aws_iam_instance_profile", profile_name, "IAM instance profile")
+        if listed is not None:
+            return profile_name if listed else None
         try:
             self.client.get_instance_profile(InstanceProfileName=profile_name)
             return profile_name
         except self.client.exceptions.NoSuchEntityException:
-            self.logger.warning(f"IAM instance profile '{profile_name}' does not exist.")
+            self.logger.warning("IAM instance profile '%s' does not exist.", profile_name)
         return None
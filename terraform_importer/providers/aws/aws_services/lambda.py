@@ -1,90 +1,154 @@
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
 from abc import ABC, abstractmethod
 import boto3
 import botocore
+import json
 import logging
+import threading
 from terraform_importer.providers.aws.aws_services.base import BaseAWSService
 
+logger = logging.getLogger(__name__)
+
+# Cached in place of a response when Lambda reported the function (or its sub-resource) as missing
+_NOT_FOUND = object()
+
 class LambdaService(BaseAWSService):
     """
     Handles ECS-related resources (e.g., instances, AMIs).
     """
     def __init__(self, session: boto3.Session):
         super().__init__(session)
-        self.logger = logging.getLogger(__name__)
+        self.logger = logger
         self.lambda_client = self.get_client("lambda")
-        self._resources = [
+        self._resources = (
             "aws_lambda_function",
             "aws_lambda_function_url",
             "aws_lambda_function_event_invoke_config",
             "aws_lambda_permission"
-        ]
+        )
+        # Responses of the per-function lookups, cached by (operation, function name) for the rest of the run;
+        # lookups Lambda answered with ResourceNotFoundException are cached as _NOT_FOUND
+        self._responses: Dict[Tuple[str, str], object] = {}
+        # One lock per (operation, function name) so concurrent lookups of the same function share a single request;
+        # the result, including not-found, is cached before the lock is released so waiting threads reuse it
+        self._response_locks: Dict[Tuple[str, str], threading.Lock] = {}
+        # Statement IDs of each function's resource-based policy, parsed once per function
+        self._policy_sids: Dict[str, frozenset] = {}
 
-    def get_resource_list(self) -> List[str]:
+    def get_resource_list(self) -> Tuple[str, ...]:
         """
-        Getter for the private EC2 resources list.
+        Getter for the private Lambda resources list.
         Returns:
-            list: A copy of the EC2 resources list.
+            tuple: The Lambda resources, immutable so no defensive copy is needed.
+        """
+        return self._resources
+
+    def _get_function_response(self, operation: str, function_name: str) -> Optional[Dict]:
         """
-        # Return a copy to prevent external modification
-        return self._resources.copy()
+        Calls a Lambda API operation for a function once and caches the response for the rest of the run,
+        so several resources of the same function share one request. A ResourceNotFoundException is cached
+        as well, so a missing function is asked about only once per operation. Threads asking for the same
+        response while it is in flight wait for it instead of sending their own request. Other errors are
+        raised and not cached.
+
+        Args:
+            operation (str): The client method to call (e.g., 'get_policy').
+            function_name (str): The name of the Lambda function.
+
+        Returns:
+            Optional[dict]: The API response, or None if Lambda reported the resource as not found.
+        """
+        key = (operation, function_name)
+        response = self._responses.get(key)
+        if response is None:
+            with self._response_locks.setdefault(key, threading.Lock()):
+                response = self._responses.get(key)
+                if response is None:
+                    try:
+                        response = getattr(self.lambda_client, operation)(FunctionName=function_name)
+                    except self.lambda_client.exceptions.ResourceNotFoundException:
+                        response = _NOT_FOUND
+                    self._responses[key] = response
+        return None if response is _NOT_FOUND else response
+
+    def _get_policy_statement_ids(self, function_name: str) -> Optional[frozenset]:
+        """
+        Returns the statement IDs (Sid) of a function's resource-based policy.
+        The policy is parsed once per function and the result cached for the rest of the run.
+
+        Args:
+            function_name (str): The name of the Lambda function.
+
+        Returns:
+            Optional[frozenset]: The statement IDs of the policy, or None if the function or its policy does not exist.
+        """
+        sids = self._policy_sids.get(function_name)
+        if sids is None:
+            response = self._get_function_response("get_policy", function_name)
+            if response is None:
+                return None
+            policy_doc = response.get('Policy')
+            statements = json.loads(policy_doc).get('Statement', []) if policy_doc else []
+            # A policy with a single statement may hold it as an object instead of a list
+            if isinstance(statements, dict):
+                statements = [statements]
+            sids = frozenset(statement.get('Sid') for statement in statements)
+            self._policy_sids[function_name] = sids
+        return sids
 
     def aws_lambda_function(self, resource):
-        function_name = resource['change']['after'].get('function_name')
+        function_name = self._after(resource).get('function_name')
         if not function_name:
             self.logger.warning("Missing Lambda function name.")
             return None
-        try:
-            self.lambda_client.get_function(FunctionName=function_name)
+        if self._get_function_response("get_function", function_name) is not None:
             return function_name
-        except self.lambda_client.exceptions.ResourceNotFoundException:
-            self.logger.warning(f"Lambda function '{function_name}' not found.")
+        self.logger.warning("Lambda function '%s' not found.", function_name)
         return None
 
     def aws_lambda_function_url(self, resource):
-        function_name = resource['change']['after'].get('function_name')
+        function_name = self._after(resource).get('function_name')
         if not function_name:
             self.logger.warning("Missing Lambda function name.")
             return None
-        try:
-            self.lambda_client.get_function_url_config(FunctionName=function_name)
+        if self._get_function_response("get_function_url_config", function_name) is not None:
             return function_name
-        except self.lambda_client.exceptions.ResourceNotFoundException:
-            self.logger.warning(f"Lambda function URL for '{function_name}' not found.")
+        self.logger.warning("Lambda function URL for '%s' not found.", function_name)
         return None
 
     def aws_lambda_function_event_invoke_config(self, resource):
-        function_name = resource['change']['after'].get('function_name')
+        function_name = self._after(resource).get('function_name')
         if not function_name:
             self.logger.warning("Missing Lambda function name.")
             return None
-        try:
-            self.lambda_client.get_function_event_invoke_config(FunctionName=function_name)
+        if self._get_function_response("get_function_event_invoke_config", function_name) is not None:
             return function_name
-        except self.lambda_client.exceptions.ResourceNotFoundException:
-            self.logger.warning(f"Event invoke config for Lambda function '{function_name}' not found.")
+        self.logger.warning("Event invoke config for Lambda function '%s' not found.", function_name)
         return None
 
     def aws_lambda_permission(self, resource):
-        function_name = resource['change']['after'].get('function_name')
-        statement_id = resource['change']['after'].get('statement_id')
+        after = self._after(resource)
+        function_name = after.get('function_name')
+        statement_id = after.get('statement_id')
         if not function_name or not statement_id:
             self.logger.warning("Missing function_name or statement_id.")
             return None
         try:
-            policy_response = self.lambda_client.get_policy(FunctionName=function_name)
-            policy_doc = policy_response.get('Policy')
-            if policy_doc and statement_id in policy_doc:
+            statement_ids = self._get_policy_statement_ids(function_name)
+            if statement_ids is None:
+                self.logger.warning("Lambda function '%s' or its policy not found.", function_name)
+            elif statement_id in statement_ids:
                 return f"{function_name}/{statement_id}"
-            self.logger.warning(f"Permission with statement_id '{statement_id}' not found in Lambda function '{function_name}'.")
-        except self.lambda_client.exceptions.ResourceNotFoundException:
-            self.logger.warning(f"Lambda function '{function_name}' not found.")
+            else:
+                self.logger.warning("Permission with statement_id '%s' not found in Lambda function '%s'.", statement_id, function_name)
         except botocore.exceptions.ClientError as e:
-            self.logger.warning(f"Error retrieving policy for Lambda function '{function_name}': {e}")
+            self.logger.warning("Error retrieving policy for Lambda function '%s': %s", function_name, e)
+        except ValueError as e:
+            self.logger.warning("Invalid policy document for Lambda function '%s': %s", function_name, e)
         return None
 
     def aws_lambda_layer_version(self, resource):
-        layer_name = resource['change']['after'].get('layer_name')
+        layer_name = self._after(resource).get('layer_name')
         if not layer_name:
             self.logger.warning("Missing layer name.")
             return None
@@ -93,11 +157,11 @@ class LambdaService(BaseAWSService):
             if 'LayerVersions' in response and response['LayerVersions']:
                 latest_layer = response['LayerVersions'][0]
                 return latest_layer['LayerVersionArn']
-            self.logger.warning(f"No versions found for layer: {layer_name}")
+            self.logger.warning("No versions found for layer: %s", layer_name)
         except self.lambda_client.exceptions.ResourceNotFoundException:
-            self.logger.warning(f"Layer '{layer_name}' not found.")
+            self.logger.warning("Layer '%s' not found.", layer_name)
         except botocore.exceptions.ClientError as e:
-            self.logger.warning(f"ClientError while fetching layer versions: {e}")
+            self.logger.warning("ClientError while fetching layer versions: %s", e)
         return None
 
  
\ No newline at end of file
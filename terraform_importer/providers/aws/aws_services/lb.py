@@ -1,80 +1,158 @@
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
 from abc import ABC, abstractmethod
 import boto3
 import botocore
 import logging
 from terraform_importer.providers.aws.aws_services.base import BaseAWSService
 
+logger = logging.getLogger(__name__)
+
+# Maximum number of names accepted by a single describe_target_groups call
+DESCRIBE_TARGET_GROUPS_LIMIT = 20
+# Largest page describe_target_groups returns when listing every target group
+DESCRIBE_TARGET_GROUPS_PAGE_SIZE = 400
+
 class LoadBalancerService(BaseAWSService):
     """
     Handles ECS-related resources (e.g., instances, AMIs).
     """
     def __init__(self, session: boto3.Session):
         super().__init__(session)
-        self.logger = logging.getLogger(__name__)
+        self.logger = logger
         self.client = self.get_client("elbv2")
-        self._resources = [
+        self._resources = (
             "aws_lb_target_group",
             "aws_lb_listener"
-        ]
+        )
+        # Target group ARNs by name, filled by prefetch()
+        self._tg_cache: Dict[str, str] = {}
+        self._tg_listed = False
+        # Listener ARNs of each load balancer by (port, protocol), described once per load balancer
+        self._listeners_by_lb: Dict[str, Dict[Tuple[int, str], str]] = {}
+
+    def get_resource_list(self) -> Tuple[str, ...]:
+        """
+        Getter for the private load balancer resources list.
+        Returns:
+            tuple: The load balancer resources, immutable so no defensive copy is needed.
+        """
+        return self._resources
+
+    def prefetch(self, resource_blocks: Dict[str, List[Dict]]) -> None:
+        """
+        Describes all planned target groups by name, in batches of up to 20 names.
+        If a batch names a missing target group, every target group is listed once instead.
 
-    def get_resource_list(self) -> List[str]:
+        Args:
+            resource_blocks (dict): Resource blocks to be resolved, grouped by resource type.
         """
-        Getter for the private EC2 resources list.
+        names = sorted({
+            self._after(block).get('name')
+            for block in resource_blocks.get('aws_lb_target_group', [])
+        } - {None})
+        for i in range(0, len(names), DESCRIBE_TARGET_GROUPS_LIMIT):
+            chunk = names[i:i + DESCRIBE_TARGET_GROUPS_LIMIT]
+            try:
+                response = self.client.describe_target_groups(Names=chunk)
+            except botocore.exceptions.ClientError as e:
+                if e.response.get('Error', {}).get('Code', '') != 'TargetGroupNotFound':
+                    raise
+                self.logger.debug("Batch describe of %s target groups hit a missing target group, listing all target groups", len(chunk))
+                self._list_target_groups()
+                return
+            self._tg_cache.update(
+                (target_group['TargetGroupName'], target_group['TargetGroupArn'])
+                for target_group in response.get('TargetGroups', [])
+            )
+
+    def _list_target_groups(self) -> None:
+        """
+        Lists every target group and caches their ARNs by name for the rest of the run.
+        """
+        paginator = self.client.get_paginator('describe_target_groups')
+        pages = paginator.paginate(PaginationConfig={'PageSize': DESCRIBE_TARGET_GROUPS_PAGE_SIZE})
+        self._tg_cache.update(
+            (target_group['TargetGroupName'], target_group['TargetGroupArn'])
+            for page in pages
+            for target_group in page.get('TargetGroups', [])
+        )
+        self._tg_listed = True
+
+    def _get_listeners(self, lb_arn: str) -> Dict[Tuple[int, str], str]:
+        """
+        Returns the listeners of a load balancer indexed by (port, protocol).
+        The listeners are described once per load balancer and cached for the rest of the run.
+
+        Args:
+            lb_arn (str): The ARN of the load balancer.
+
         Returns:
-            list: A copy of the EC2 resources list.
+            dict: Mapping of (port, protocol) to listener ARN.
         """
-        # Return a copy to prevent external modification
-        return self._resources.copy()
+        listeners = self._listeners_by_lb.get(lb_arn)
+        if listeners is None:
+            response = self.client.describe_listeners(LoadBalancerArn=lb_arn)
+            listeners = {}
+            for listener in response.get('Listeners', []):
+                listeners.setdefault((listener.get('Port'), listener.get('Protocol')), listener.get('ListenerArn'))
+            self._listeners_by_lb[lb_arn] = listeners
+        return listeners
 
     def aws_lb_target_group(self, resource):
         """
         Validates if the specified Load Balancer Target Group exists and returns its ARN.
         """
-        name = resource['change']['after'].get('name')
+        name = self._after(resource).get('name')
         if not name:
             self.logger.warning("Target group name is missing.")
             return None
+        arn = self._tg_cache.get(name)
+        if arn:
+            return arn
+        # Once every target group has been listed, a name missing from the cache does not exist
+        if self._tg_listed:
+            self.logger.warning("Target group '%s' not found.", name)
+            return None
         try:
-            paginator = self.client.get_paginator('describe_target_groups')
-            for page in paginator.paginate():
-                for target_group in page.get('TargetGroups', []):
-                    if target_group.get('TargetGroupName') == name:
-                        return target_group.get('TargetGroupArn')
-            self.logger.warning(f"Target group '{name}' not found.")
+            response = self.client.describe_target_groups(Names=[name])
+            self._tg_cache.update(
+                (target_group['TargetGroupName'], target_group['TargetGroupArn'])
+                for target_group in response.get('TargetGroups', [])
+            )
+            if name in self._tg_cache:
+                return self._tg_cache[name]
+            self.logger.warning("Target group '%s' not found.", name)
         except botocore.exceptions.ClientError as e:
-            self.logger.warning(f"Error retrieving target group '{name}': {e}")
+            if e.response.get('Error', {}).get('Code', '') == 'TargetGroupNotFound':
+                self.logger.warning("Target group '%s' not found.", name)
+            else:
+                self.logger.warning("Error retrieving target group '%s': %s", name, e)
         except Exception as e:
-            self.logger.error(f"Unexpected error while retrieving target group '{name}': {e}")
+            self.logger.error("Unexpected error while retrieving target group '%s': %s", name, e)
         return None
 
     def aws_lb_listener(self, resource):
         """
         Validates if the specified Load Balancer Listener exists and returns its ARN.
         """
+        after = self._after(resource)
+        lb_arn = after.get('load_balancer_arn')
+        port = after.get('port')
+        protocol = after.get('protocol')
+        if not lb_arn or port is None or not protocol:
+            self.logger.warning("Missing required values: load_balancer_arn, port, or protocol.")
+            return None
+
         try:
-            lb_arn = resource['change']['after'].get('load_balancer_arn')
-            port = resource['change']['after'].get('port')
-            protocol = resource['change']['after'].get('protocol')
-    
-            if not lb_arn or port is None or not protocol:
-                self.logger.warning("Missing required values: load_balancer_arn, port, or protocol.")
-                return None
-    
-            response = self.client.describe_listeners(LoadBalancerArn=lb_arn)
-            for listener in response.get('Listeners', []):
-                if listener.get('Port') == port and listener.get('Protocol') == protocol:
-                    return listener.get('ListenerArn')
-    
-            self.logger.warning(f"No matching listener found on Load Balancer '{lb_arn}' for port {port} and protocol '{protocol}'.")
-    
+            listeners = self._get_listeners(lb_arn)
         except botocore.exceptions.ClientError as e:
-            self.logger.warning(f"ClientError while retrieving listener for Load Balancer '{lb_arn}': {e}")
-        except KeyError as e:
-            self.logger.warning(f"Missing key in resource data: {e}")
-        except Exception as e:
-            self.logger.error(f"Unexpected error while retrieving listener: {e}")
-    
+            self.logger.warning("ClientError while retrieving listener for Load Balancer '%s': %s", lb_arn, e)
+            return None
+
+        listener_arn = listeners.get((port, protocol))
+        if listener_arn:
+            return listener_arn
+        self.logger.warning("No matching listener found on Load Balancer '%s' for port %s and protocol '%s'.", lb_arn, port, protocol)
         return None
 
     
@@ -1,72 +1,93 @@
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
 from abc import ABC, abstractmethod
 import boto3
 import botocore
 import logging
 from terraform_importer.providers.aws.aws_services.base import BaseAWSService
 
-class EC2Service(BaseAWSService):
+logger = logging.getLogger(__name__)
+
+class RDSService(BaseAWSService):
     """
-    Handles ECS-related resources (e.g., instances, AMIs).
+    Handles RDS-related resources (e.g., DB instances, DB subnet groups).
     """
+    LISTINGS = {
+        "aws_db_instance": ("describe_db_instances", {}, "DBInstances", "DBInstanceIdentifier"),
+        "aws_db_subnet_group": ("describe_db_subnet_groups", {}, "DBSubnetGroups", "DBSubnetGroupName"),
+    }
+    LIST_PREFETCH_THRESHOLD = 3
+
     def __init__(self, session: boto3.Session):
         super().__init__(session)
-        self.logger = logging.getLogger(__name__)
+        self.logger = logger
         self.client = self.get_client("rds")
-        self._resources = [
+        self._resources = (
             "aws_db_instance",
             "aws_db_subnet_group"
-        ]
+        )
 
-    def get_resource_list(self) -> List[str]:
+    def get_resource_list(self) -> Tuple[str, ...]:
         """
-        Getter for the private EC2 resources list.
+        Getter for the private RDS resources list.
         Returns:
-            list: A copy of the EC2 resources list.
+            tuple: The RDS resources, immutable so no defensive copy is needed.
+        """
+        return self._resources
+
+    def prefetch(self, resource_blocks: Dict[str, List[Dict]]) -> None:
+        """
+        Describes all DB instances or all DB subnet groups in the region when at least
+        LIST_PREFETCH_THRESHOLD of that type are planned. The handlers then resolve that type
+        from the listing only, so a planned instance or subnet group that is not yet created
+        costs no extra describe call.
+
+        Args:
+            resource_blocks (dict): Resource blocks to be resolved, grouped by resource type.
         """
-        # Return a copy to prevent external modification
-        return self._resources.copy()
+        self._prefetch_listings(self.client, resource_blocks)
 
     def aws_db_instance(self, resource):
         """
         Validates if the specified RDS DB instance exists and returns its identifier.
         """
-        db_identifier = resource['change']['after'].get('identifier')
+        db_identifier = self._after(resource).get('identifier')
         if not db_identifier:
             self.logger.warning("DB instance identifier is missing.")
             return None
+        listed = self._check_listing("aws_db_instance", db_identifier, "DB instance")
+        if listed is not None:
+            return db_identifier if listed else None
         try:
             response = self.client.describe_db_instances(DBInstanceIdentifier=db_identifier)
             if response.get('DBInstances'):
                 return db_identifier
             else:
-                self.logger.warning(f"DB instance '{db_identifier}' not found.")
+                self.logger.warning("DB instance '%s' not found.", db_identifier)
         except self.client.exceptions.DBInstanceNotFoundFault:
-            self.logger.warning(f"DB instance '{db_identifier}' does not exist.")
+            self.logger.warning("DB instance '%s' does not exist.", db_identifier)
         except botocore.exceptions.ClientError as e:
-            self.logger.warning(f"Error retrieving DB instance '{db_identifier}': {e}")
-        except Exception as e:
-            self.logger.error(f"Unexpected error while retrieving DB instance '{db_identifier}': {e}")
+            self.logger.warning("Error retrieving DB instance '%s': %s", db_identifier, e)
         return None
     
     def aws_db_subnet_group(self, resource):
         """
         Validates if the specified RDS DB subnet group exists and returns its name.
         """
-        subnet_group_name = resource['change']['after'].get('name')
+        subnet_group_name = self._after(resource).get('name')
         if not subnet_group_name:
             self.logger.warning("DB subnet group name is missing.")
             return None
+        listed = self._check_listing("aws_db_subnet_group", subnet_group_name, "DB subnet group")
+        if listed is not None:
+            return subnet_group_name if listed else None
         try:
             response = self.client.describe_db_subnet_groups(DBSubnetGroupName=subnet_group_name)
             if response.get('DBSubnetGroups'):
                 return subnet_group_name
             else:
-                self.logger.warning(f"DB subnet group '{subnet_group_name}' not found.")
+                self.logger.warning("DB subnet group '%s' not found.", subnet_group_name)
         except self.client.exceptions.DBSubnetGroupNotFoundFault:
-            self.logger.warning(f"DB subnet group '{subnet_group_name}' does not exist.")
+            self.logger.warning("DB subnet group '%s' does not exist.", subnet_group_name)
         except botocore.exceptions.ClientError as e:
-            self.logger.warning(f"Error retrieving DB subnet group '{subnet_group_name}': {e}")
-        except Exception as e:
-            self.logger.error(f"Unexpected error while retrieving DB subnet group '{subnet_group_name}': {e}")
+            self.logger.warning("Error retrieving DB subnet group '%s': %s", subnet_group_name, e)
         return None
@@ -1,19 +1,21 @@
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
 from abc import ABC, abstractmethod
 import boto3
 import botocore
 import logging
 from terraform_importer.providers.aws.aws_services.base import BaseAWSService
 
+logger = logging.getLogger(__name__)
+
 class S3Service(BaseAWSService):
     """
     Handles ECS-related resources (e.g., instances, AMIs).
     """
     def __init__(self, session: boto3.Session):
         super().__init__(session)
-        self.logger = logging.getLogger(__name__)
+        self.logger = logger
         self.client = self.get_client("s3")
-        self._resources = [
+        self._resources = (
             "aws_s3_bucket",
             "aws_s3_bucket_notification",
             "aws_s3_bucket_ownership_controls",
@@ -24,19 +26,18 @@ class S3Service(BaseAWSService):
             "aws_s3_bucket_versioning",
             "aws_s3_bucket_acl"
 
-        ]
+        )
 
-    def get_resource_list(self) -> List[str]:
+    def get_resource_list(self) -> Tuple[str, ...]:
         """
-        Getter for the private EC2 resources list.
+        Getter for the private S3 resources list.
         Returns:
-            list: A copy of the EC2 resources list.
+            tuple: The S3 resources, immutable so no defensive copy is needed.
         """
-        # Return a copy to prevent external modification
-        return self._resources.copy()
+        return self._resources
 
     def aws_s3_bucket(self, resource):
-        bucket = resource['change']['after'].get('bucket')
+        bucket = self._after(resource).get('bucket')
         if not bucket:
             self.logger.warning("Bucket name is missing.")
             return None
@@ -44,89 +45,90 @@ class S3Service(BaseAWSService):
             self.client.head_bucket(Bucket=bucket)
             return bucket
         except botocore.exceptions.ClientError as e:
-            self.logger.warning(f"S3 bucket '{bucket}' not found or inaccessible: {e}")
+            self.logger.warning("S3 bucket '%s' not found or inaccessible: %s", bucket, e)
         return None
     
     def aws_s3_bucket_notification(self, resource):
-        bucket = resource['change']['after'].get('bucket')
+        bucket = self._after(resource).get('bucket')
         try:
             self.client.head_bucket(Bucket=bucket)
             config = self.client.get_bucket_notification_configuration(Bucket=bucket)
             if any(config.get(k) for k in ['TopicConfigurations', 'QueueConfigurations', 'LambdaFunctionConfigurations']):
                 return bucket
-            self.logger.warning(f"No notification config found for bucket '{bucket}'.")
+            self.logger.warning("No notification config found for bucket '%s'.", bucket)
         except Exception as e:
-            self.logger.warning(f"Error checking notification config for bucket '{bucket}': {e}")
+            self.logger.warning("Error checking notification config for bucket '%s': %s", bucket, e)
         return None
     
     def aws_s3_bucket_ownership_controls(self, resource):
-        bucket = resource['change']['after'].get('bucket')
+        bucket = self._after(resource).get('bucket')
         try:
             self.client.head_bucket(Bucket=bucket)
             self.client.get_bucket_ownership_controls(Bucket=bucket)
             return bucket
         except Exception as e:
-            self.logger.warning(f"Error checking ownership controls for bucket '{bucket}': {e}")
+            self.logger.warning("Error checking ownership controls for bucket '%s': %s", bucket, e)
         return None
     
     def aws_s3_bucket_policy(self, resource):
-        bucket = resource['change']['after'].get('bucket')
+        bucket = self._after(resource).get('bucket')
         try:
             self.client.head_bucket(Bucket=bucket)
             self.client.get_bucket_policy(Bucket=bucket)
             return bucket
         except Exception as e:
-            self.logger.warning(f"Error checking policy for bucket '{bucket}': {e}")
+            self.logger.warning("Error checking policy for bucket '%s': %s", bucket, e)
         return None
     
     def aws_s3_bucket_public_access_block(self, resource):
-        bucket = resource['change']['after'].get('bucket')
+        bucket = self._after(resource).get('bucket')
         try:
             self.client.head_bucket(Bucket=bucket)
             self.client.get_public_access_block(Bucket=bucket)
             return bucket
         except Exception as e:
-            self.logger.warning(f"Error checking public access block for bucket '{bucket}': {e}")
+            self.logger.warning("Error checking public access block for bucket '%s': %s", bucket, e)
         return None
     
     def aws_s3_bucket_server_side_encryption_configuration(self, resource):
-        bucket = resource['change']['after'].get('bucket')
+        bucket = self._after(resource).get('bucket')
         try:
             self.client.head_bucket(Bucket=bucket)
             self.client.get_bucket_encryption(Bucket=bucket)
             return bucket
         except Exception as e:
-            self.logger.warning(f"Error checking encryption config for bucket '{bucket}': {e}")
+            self.logger.warning("Error checking encryption config for bucket '%s': %s", bucket, e)
         return None
     
     def aws_s3_bucket_lifecycle_configuration(self, resource):
-        bucket = resource['change']['after'].get('bucket')
+        bucket = self._after(resource).get('bucket')
         try:
             self.client.head_bucket(Bucket=bucket)
             config = self.client.get_bucket_lifecycle_configuration(Bucket=bucket)
             if config.get("Rules"):
                 return bucket
-            self.logger.warning(f"No lifecycle rules found for bucket '{bucket}'.")
+            self.logger.warning("No lifecycle rules found for bucket '%s'.", bucket)
         except Exception as e:
-            self.logger.warning(f"Error checking lifecycle config for bucket '{bucket}': {e}")
+            self.logger.warning("Error checking lifecycle config for bucket '%s': %s", bucket, e)
         return None
     
     def aws_s3_bucket_versioning(self, resource):
-        bucket = resource['change']['after'].get('bucket')
+        bucket = self._after(resource).get('bucket')
         try:
             self.client.head_bucket(Bucket=bucket)
             versioning = self.client.get_bucket_versioning(Bucket=bucket)
             if versioning.get("Status") in ("Enabled", "Suspended"):
                 return bucket
-            self.logger.warning(f"Versioning is not enabled or suspended for bucket '{bucket}'.")
+            self.logger.warning("Versioning is not enabled or suspended for bucket '%s'.", bucket)
         except Exception as e:
-            self.logger.warning(f"Error checking versioning for bucket '{bucket}': {e}")
+            self.logger.warning("Error checking versioning for bucket '%s': %s", bucket, e)
         return None
     
     def aws_s3_bucket_acl(self, resource):       
-        bucket = resource['change']['after'].get('bucket')
-        acl  = resource['change']['after'].get('acl')
-        expected_owner = resource['change']['after'].get('expected_bucket_owner')
+        after = self._after(resource)
+        bucket = after.get('bucket')
+        acl  = after.get('acl')
+        expected_owner = after.get('expected_bucket_owner')
     
         if not bucket:
             self.logger.warning("Bucket name is missing.")
@@ -144,7 +146,7 @@ class S3Service(BaseAWSService):
     
             return ",".join(parts)
         except Exception as e:
-            self.logger.warning(f"Error checking ACL for bucket '{bucket}': {e}")
+            self.logger.warning("Error checking ACL for bucket '%s': %s", bucket, e)
         return None
     
  
\ No newline at end of file
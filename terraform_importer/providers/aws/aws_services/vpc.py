@@ -1,32 +1,33 @@
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
 from abc import ABC, abstractmethod
 import boto3
 import botocore
 import logging
 from terraform_importer.providers.aws.aws_services.base import BaseAWSService
 
+logger = logging.getLogger(__name__)
+
 class VPCService(BaseAWSService):
     """
     Handles ECS-related resources (e.g., instances, AMIs).
     """
     def __init__(self, session: boto3.Session):
         super().__init__(session)
-        self.logger = logging.getLogger(__name__)
+        self.logger = logger
         self.client = self.get_client("ec2")
-        self._resources = [
+        self._resources = (
             "aws_subnet",
             "aws_route_table",
             "aws_route_table_association"
-        ]
+        )
 
-    def get_resource_list(self) -> List[str]:
+    def get_resource_list(self) -> Tuple[str, ...]:
         """
-        Getter for the private EC2 resources list.
+        Getter for the private VPC resources list.
         Returns:
-            list: A copy of the EC2 resources list.
+            tuple: The VPC resources, immutable so no defensive copy is needed.
         """
-        # Return a copy to prevent external modification
-        return self._resources.copy()
+        return self._resources
 
     def aws_route_table(self, resource):
         """
@@ -39,7 +40,7 @@ class VPCService(BaseAWSService):
             str: The RouteTableId if found, otherwise None.
         """
         try:
-            values = resource.get('change', {}).get('after', {})
+            values = self._after(resource)
             name_tag = values.get('tags', {}).get('Name')
     
             if not name_tag:
@@ -55,10 +56,10 @@ class VPCService(BaseAWSService):
             for route_table in response.get('RouteTables', []):
                 return route_table['RouteTableId']
     
-            self.logger.warning(f"No route table found with Name tag: {name_tag}")
+            self.logger.warning("No route table found with Name tag: %s", name_tag)
     
         except Exception as e:
-            self.logger.warning(f"Error retrieving route table: {e}")
+            self.logger.warning("Error retrieving route table: %s", e)
     
         return None
     
@@ -66,7 +67,7 @@ class VPCService(BaseAWSService):
         """
         Validates the route table association exists and returns the subnet_id/route_table_id key.
         """
-        values = resource.get('change', {}).get('after', {})
+        values = self._after(resource)
         route_table_id = values.get('route_table_id')
         subnet_id = values.get('subnet_id')
     
@@ -80,8 +81,8 @@ class VPCService(BaseAWSService):
                 for assoc in route_table.get('Associations', []):
                     if assoc.get('SubnetId') == subnet_id:
                         return f"{subnet_id}/{route_table_id}"
-            self.logger.warning(f"No association found for subnet '{subnet_id}' with route table '{route_table_id}'.")
+            self.logger.warning("No association found for subnet '%s' with route table '%s'.", subnet_id, route_table_id)
         except Exception as e:
-            self.logger.warning(f"Error checking route table association: {e}")
+            self.logger.warning("Error checking route table association: %s", e)
         return None
     
\ No newline at end of file
@@ -0,0 +1,6 @@
+"""Shared helpers for the AWS service tests."""
+
+
+def plan_resource(**after):
+    """Builds a plan resource block whose 'change.after' holds the given attributes"""
+    return {"change": {"after": after}}
@@ -1,8 +1,15 @@
 import unittest
+from types import SimpleNamespace
 from unittest.mock import Mock, MagicMock, patch
 import boto3
 import botocore.exceptions
 from terraform_importer.providers.aws.aws_services.apigateway import APIGatewayService
+from terraform_importer.providers.aws.aws_services.base import CLIENT_CONFIG
+from terraform_importer.providers.aws.tests.helpers import plan_resource
+
+
+class NotFoundException(Exception):
+    """Stands in for the modeled apigateway NotFoundException, which a MagicMock client does not provide"""
 
 
 class TestAPIGatewayService(unittest.TestCase):
@@ -11,21 +18,18 @@ class TestAPIGatewayService(unittest.TestCase):
         self.mock_client = MagicMock()
         self.mock_session.client.return_value = self.mock_client
         self.service = APIGatewayService(self.mock_session)
-        # Mock the exceptions attribute
-        self.service.client.exceptions = MagicMock()
-        self.service.client.exceptions.NotFoundException = type(
-            'NotFoundException', (Exception,), {}
-        )
+        # The service only catches NotFoundException, so a plain namespace is enough
+        self.service.client.exceptions = SimpleNamespace(NotFoundException=NotFoundException)
 
     def test_init(self):
         """Test APIGatewayService initialization"""
         self.assertEqual(self.service.session, self.mock_session)
-        self.mock_session.client.assert_called_with("apigateway")
+        self.mock_session.client.assert_called_with("apigateway", config=CLIENT_CONFIG)
 
     def test_get_resource_list(self):
         """Test get_resource_list returns correct resources"""
         resources = self.service.get_resource_list()
-        expected_resources = [
+        expected_resources = (
             "aws_api_gateway_rest_api",
             "aws_api_gateway_resource",
             "aws_api_gateway_method",
@@ -45,19 +49,12 @@ class TestAPIGatewayService(unittest.TestCase):
             "aws_apigatewayv2_integration",
             "aws_apigatewayv2_integration_response",
             "aws_apigatewayv2_route"
-        ]
+        )
         self.assertEqual(resources, expected_resources)
 
     def test_aws_api_gateway_rest_api_by_id(self):
         """Test aws_api_gateway_rest_api with ID"""
-        resource = {
-            "change": {
-                "after": {
-                    "id": "abc123",
-                    "name": "test-api"
-                }
-            }
-        }
+        resource = plan_resource(id="abc123", name="test-api")
         self.mock_client.get_rest_api.return_value = {
             "id": "abc123",
             "name": "test-api"
@@ -69,13 +66,7 @@ class TestAPIGatewayService(unittest.TestCase):
 
     def test_aws_api_gateway_rest_api_by_name(self):
         """Test aws_api_gateway_rest_api with name"""
-        resource = {
-            "change": {
-                "after": {
-                    "name": "test-api"
-                }
-            }
-        }
+        resource = plan_resource(name="test-api")
         self.mock_client.get_rest_apis.return_value = {
             "items": [{"id": "abc123", "name": "test-api"}]
         }
@@ -86,13 +77,7 @@ class TestAPIGatewayService(unittest.TestCase):
 
     def test_aws_api_gateway_rest_api_not_found(self):
         """Test aws_api_gateway_rest_api when API doesn't exist"""
-        resource = {
-            "change": {
-                "after": {
-                    "name": "test-api"
-                }
-            }
-        }
+        resource = plan_resource(name="test-api")
         self.mock_client.get_rest_apis.return_value = {
             "items": []
         }
@@ -103,14 +88,7 @@ class TestAPIGatewayService(unittest.TestCase):
 
     def test_aws_api_gateway_resource_by_id(self):
         """Test aws_api_gateway_resource with ID"""
-        resource = {
-            "change": {
-                "after": {
-                    "rest_api_id": "abc123",
-                    "id": "def456"
-                }
-            }
-        }
+        resource = plan_resource(rest_api_id="abc123", id="def456")
         self.mock_client.get_resource.return_value = {
             "id": "def456"
         }
@@ -121,14 +99,7 @@ class TestAPIGatewayService(unittest.TestCase):
 
     def test_aws_api_gateway_resource_by_path(self):
         """Test aws_api_gateway_resource with path"""
-        resource = {
-            "change": {
-                "after": {
-                    "rest_api_id": "abc123",
-                    "path": "/test"
-                }
-            }
-        }
+        resource = plan_resource(rest_api_id="abc123", path="/test")
         self.mock_client.get_resources.return_value = {
             "items": [{"id": "def456", "path": "/test"}]
         }
@@ -139,15 +110,7 @@ class TestAPIGatewayService(unittest.TestCase):
 
     def test_aws_api_gateway_method_success(self):
         """Test aws_api_gateway_method with successful response"""
-        resource = {
-            "change": {
-                "after": {
-                    "rest_api_id": "abc123",
-                    "resource_id": "def456",
-                    "http_method": "GET"
-                }
-            }
-        }
+        resource = plan_resource(rest_api_id="abc123", resource_id="def456", http_method="GET")
         self.mock_client.get_method.return_value = {
             "httpMethod": "GET"
         }
@@ -158,16 +121,8 @@ class TestAPIGatewayService(unittest.TestCase):
 
     def test_aws_api_gateway_method_not_found(self):
         """Test aws_api_gateway_method when method doesn't exist"""
-        resource = {
-            "change": {
-                "after": {
-                    "rest_api_id": "abc123",
-                    "resource_id": "def456",
-                    "http_method": "GET"
-                }
-            }
-        }
-        self.mock_client.get_method.side_effect = self.service.client.exceptions.NotFoundException()
+        resource = plan_resource(rest_api_id="abc123", resource_id="def456", http_method="GET")
+        self.mock_client.get_method.side_effect = NotFoundException()
         
         result = self.service.aws_api_gateway_method(resource)
         
@@ -175,15 +130,7 @@ class TestAPIGatewayService(unittest.TestCase):
 
     def test_aws_api_gateway_integration_success(self):
         """Test aws_api_gateway_integration with successful response"""
-        resource = {
-            "change": {
-                "after": {
-                    "rest_api_id": "abc123",
-                    "resource_id": "def456",
-                    "http_method": "GET"
-                }
-            }
-        }
+        resource = plan_resource(rest_api_id="abc123", resource_id="def456", http_method="GET")
         self.mock_client.get_integration.return_value = {
             "type": "HTTP"
         }
@@ -194,16 +141,8 @@ class TestAPIGatewayService(unittest.TestCase):
 
     def test_aws_api_gateway_integration_not_found(self):
         """Test aws_api_gateway_integration when integration doesn't exist"""
-        resource = {
-            "change": {
-                "after": {
-                    "rest_api_id": "abc123",
-                    "resource_id": "def456",
-                    "http_method": "GET"
-                }
-            }
-        }
-        self.mock_client.get_integration.side_effect = self.service.client.exceptions.NotFoundException()
+        resource = plan_resource(rest_api_id="abc123", resource_id="def456", http_method="GET")
+        self.mock_client.get_integration.side_effect = NotFoundException()
         
         result = self.service.aws_api_gateway_integration(resource)
         
@@ -211,14 +150,7 @@ class TestAPIGatewayService(unittest.TestCase):
 
     def test_aws_api_gateway_deployment_by_id(self):
         """Test aws_api_gateway_deployment with ID"""
-        resource = {
-            "change": {
-                "after": {
-                    "rest_api_id": "abc123",
-                    "id": "dep123"
-                }
-            }
-        }
+        resource = plan_resource(rest_api_id="abc123", id="dep123")
         self.mock_client.get_deployment.return_value = {
             "id": "dep123"
         }
@@ -229,13 +161,7 @@ class TestAPIGatewayService(unittest.TestCase):
 
     def test_aws_api_gateway_deployment_latest(self):
         """Test aws_api_gateway_deployment without ID (gets latest)"""
-        resource = {
-            "change": {
-                "after": {
-                    "rest_api_id": "abc123"
-                }
-            }
-        }
+        resource = plan_resource(rest_api_id="abc123")
         self.mock_client.get_deployments.return_value = {
             "items": [{"id": "dep123"}]
         }
@@ -246,14 +172,7 @@ class TestAPIGatewayService(unittest.TestCase):
 
     def test_aws_api_gateway_stage_success(self):
         """Test aws_api_gateway_stage with successful response"""
-        resource = {
-            "change": {
-                "after": {
-                    "rest_api_id": "abc123",
-                    "stage_name": "prod"
-                }
-            }
-        }
+        resource = plan_resource(rest_api_id="abc123", stage_name="prod")
         self.mock_client.get_stage.return_value = {
             "stageName": "prod"
         }
@@ -264,15 +183,8 @@ class TestAPIGatewayService(unittest.TestCase):
 
     def test_aws_api_gateway_stage_not_found(self):
         """Test aws_api_gateway_stage when stage doesn't exist"""
-        resource = {
-            "change": {
-                "after": {
-                    "rest_api_id": "abc123",
-                    "stage_name": "prod"
-                }
-            }
-        }
-        self.mock_client.get_stage.side_effect = self.service.client.exceptions.NotFoundException()
+        resource = plan_resource(rest_api_id="abc123", stage_name="prod")
+        self.mock_client.get_stage.side_effect = NotFoundException()
         
         result = self.service.aws_api_gateway_stage(resource)
         
@@ -280,13 +192,7 @@ class TestAPIGatewayService(unittest.TestCase):
 
     def test_aws_api_gateway_api_key_success(self):
         """Test aws_api_gateway_api_key with successful response"""
-        resource = {
-            "change": {
-                "after": {
-                    "name": "test-key"
-                }
-            }
-        }
+        resource = plan_resource(name="test-key")
         self.mock_client.get_api_keys.return_value = {
             "items": [{"id": "key123", "name": "test-key"}]
         }
@@ -297,13 +203,7 @@ class TestAPIGatewayService(unittest.TestCase):
 
     def test_aws_api_gateway_api_key_not_found(self):
         """Test aws_api_gateway_api_key when key doesn't exist"""
-        resource = {
-            "change": {
-                "after": {
-                    "name": "test-key"
-                }
-            }
-        }
+        resource = plan_resource(name="test-key")
         self.mock_client.get_api_keys.return_value = {
             "items": []
         }
@@ -314,13 +214,7 @@ class TestAPIGatewayService(unittest.TestCase):
 
     def test_aws_api_gateway_usage_plan_success(self):
         """Test aws_api_gateway_usage_plan with successful response"""
-        resource = {
-            "change": {
-                "after": {
-                    "name": "test-plan"
-                }
-            }
-        }
+        resource = plan_resource(name="test-plan")
         self.mock_client.get_usage_plans.return_value = {
             "items": [{"id": "plan123", "name": "test-plan"}]
         }
@@ -331,14 +225,7 @@ class TestAPIGatewayService(unittest.TestCase):
 
     def test_aws_api_gateway_authorizer_success(self):
         """Test aws_api_gateway_authorizer with successful response"""
-        resource = {
-            "change": {
-                "after": {
-                    "rest_api_id": "abc123",
-                    "name": "test-authorizer"
-                }
-            }
-        }
+        resource = plan_resource(rest_api_id="abc123", name="test-authorizer")
         self.mock_client.get_authorizers.return_value = {
             "items": [{"id": "auth123", "name": "test-authorizer"}]
         }
@@ -349,16 +236,12 @@ class TestAPIGatewayService(unittest.TestCase):
 
     def test_aws_api_gateway_method_response_success(self):
         """Test aws_api_gateway_method_response with successful response"""
-        resource = {
-            "change": {
-                "after": {
-                    "rest_api_id": "abc123",
-                    "resource_id": "def456",
-                    "http_method": "GET",
-                    "status_code": "200"
-                }
-            }
-        }
+        resource = plan_resource(
+            rest_api_id="abc123",
+            resource_id="def456",
+            http_method="GET",
+            status_code="200"
+        )
         self.mock_client.get_method_response.return_value = {
             "statusCode": "200"
         }
@@ -369,16 +252,12 @@ class TestAPIGatewayService(unittest.TestCase):
 
     def test_aws_api_gateway_integration_response_success(self):
         """Test aws_api_gateway_integration_response with successful response"""
-        resource = {
-            "change": {
-                "after": {
-                    "rest_api_id": "abc123",
-                    "resource_id": "def456",
-                    "http_method": "GET",
-                    "status_code": "200"
-                }
-            }
-        }
+        resource = plan_resource(
+            rest_api_id="abc123",
+            resource_id="def456",
+            http_method="GET",
+            status_code="200"
+        )
         self.mock_client.get_integration_response.return_value = {
             "statusCode": "200"
         }
@@ -389,11 +268,7 @@ class TestAPIGatewayService(unittest.TestCase):
 
     def test_aws_api_gateway_rest_api_missing_fields(self):
         """Test aws_api_gateway_rest_api with missing fields"""
-        resource = {
-            "change": {
-                "after": {}
-            }
-        }
+        resource = plan_resource()
         
         result = self.service.aws_api_gateway_rest_api(resource)
         
@@ -401,14 +276,7 @@ class TestAPIGatewayService(unittest.TestCase):
 
     def test_aws_apigatewayv2_api_by_id(self):
         """Test aws_apigatewayv2_api with ID"""
-        resource = {
-            "change": {
-                "after": {
-                    "id": "api123",
-                    "name": "test-v2-api"
-                }
-            }
-        }
+        resource = plan_resource(id="api123", name="test-v2-api")
         self.mock_client.get_api.return_value = {
             "ApiId": "api123",
             "Name": "test-v2-api"
@@ -420,13 +288,7 @@ class TestAPIGatewayService(unittest.TestCase):
 
     def test_aws_apigatewayv2_api_by_name(self):
         """Test aws_apigatewayv2_api with name"""
-        resource = {
-            "change": {
-                "after": {
-                    "name": "test-v2-api"
-                }
-            }
-        }
+        resource = plan_resource(name="test-v2-api")
         self.mock_client.get_apis.return_value = {
             "Items": [{"ApiId": "api123", "Name": "test-v2-api"}]
         }
@@ -437,13 +299,7 @@ class TestAPIGatewayService(unittest.TestCase):
 
     def test_aws_apigatewayv2_api_not_found(self):
         """Test aws_apigatewayv2_api when API doesn't exist"""
-        resource = {
-            "change": {
-                "after": {
-                    "name": "test-v2-api"
-                }
-            }
-        }
+        resource = plan_resource(name="test-v2-api")
         self.mock_client.get_apis.return_value = {
             "Items": []
         }
@@ -454,11 +310,7 @@ class TestAPIGatewayService(unittest.TestCase):
 
     def test_aws_apigatewayv2_api_missing_fields(self):
         """Test aws_apigatewayv2_api with missing id and name"""
-        resource = {
-            "change": {
-                "after": {}
-            }
-        }
+        resource = plan_resource()
         
         result = self.service.aws_apigatewayv2_api(resource)
         
@@ -466,13 +318,7 @@ class TestAPIGatewayService(unittest.TestCase):
 
     def test_aws_apigatewayv2_api_client_error(self):
         """Test aws_apigatewayv2_api with ClientError"""
-        resource = {
-            "change": {
-                "after": {
-                    "name": "test-v2-api"
-                }
-            }
-        }
+        resource = plan_resource(name="test-v2-api")
         self.mock_client.get_apis.side_effect = botocore.exceptions.ClientError(
             {"Error": {"Code": "UnauthorizedOperation"}}, "GetApis"
         )
@@ -493,13 +339,7 @@ class TestAPIGatewayService(unittest.TestCase):
 
     def test_aws_apigatewayv2_api_multiple_apis(self):
         """Test aws_apigatewayv2_api with multiple APIs, finding the correct one"""
-        resource = {
-            "change": {
-                "after": {
-                    "name": "test-v2-api"
-                }
-            }
-        }
+        resource = plan_resource(name="test-v2-api")
         self.mock_client.get_apis.return_value = {
             "Items": [
                 {"ApiId": "api123", "Name": "other-api"},
@@ -515,14 +355,7 @@ class TestAPIGatewayService(unittest.TestCase):
     # Tests for aws_apigatewayv2_authorizer
     def test_aws_apigatewayv2_authorizer_by_id(self):
         """Test aws_apigatewayv2_authorizer with ID"""
-        resource = {
-            "change": {
-                "after": {
-                    "api_id": "api123",
-                    "id": "auth456"
-                }
-            }
-        }
+        resource = plan_resource(api_id="api123", id="auth456")
         self.mock_client.get_authorizer.return_value = {
             "AuthorizerId": "auth456",
             "Name": "test-authorizer"
@@ -534,14 +367,7 @@ class TestAPIGatewayService(unittest.TestCase):
 
     def test_aws_apigatewayv2_authorizer_by_name(self):
         """Test aws_apigatewayv2_authorizer with name"""
-        resource = {
-            "change": {
-                "after": {
-                    "api_id": "api123",
-                    "name": "test-authorizer"
-                }
-            }
-        }
+        resource = plan_resource(api_id="api123", name="test-authorizer")
         self.mock_client.get_authorizers.return_value = {
             "Items": [{"AuthorizerId": "auth456", "Name": "test-authorizer"}]
         }
@@ -552,15 +378,8 @@ class TestAPIGatewayService(unittest.TestCase):
 
     def test_aws_apigatewayv2_authorizer_not_found_by_id(self):
         """Test aws_apigatewayv2_authorizer when authorizer ID doesn't exist"""
-        resource = {
-            "change": {
-                "after": {
-                    "api_id": "api123",
-                    "id": "auth456"
-                }
-            }
-        }
-        self.mock_client.get_authorizer.side_effect = self.service.client.exceptions.NotFoundException()
+        resource = plan_resource(api_id="api123", id="auth456")
+        self.mock_client.get_authorizer.side_effect = NotFoundException()
         
         result = self.service.aws_apigatewayv2_authorizer(resource)
         
@@ -568,14 +387,7 @@ class TestAPIGatewayService(unittest.TestCase):
 
     def test_aws_apigatewayv2_authorizer_not_found_by_name(self):
         """Test aws_apigatewayv2_authorizer when authorizer name doesn't exist"""
-        resource = {
-            "change": {
-                "after": {
-                    "api_id": "api123",
-                    "name": "test-authorizer"
-                }
-            }
-        }
+        resource = plan_resource(api_id="api123", name="test-authorizer")
         self.mock_client.get_authorizers.return_value = {
             "Items": []
         }
@@ -586,13 +398,7 @@ class TestAPIGatewayService(unittest.TestCase):
 
     def test_aws_apigatewayv2_authorizer_missing_api_id(self):
         """Test aws_apigatewayv2_authorizer with missing api_id"""
-        resource = {
-            "change": {
-                "after": {
-                    "name": "test-authorizer"
-                }
-            }
-        }
+        resource = plan_resource(name="test-authorizer")
         
         result = self.service.aws_apigatewayv2_authorizer(resource)
         
@@ -600,13 +406,7 @@ class TestAPIGatewayService(unittest.TestCase):
 
     def test_aws_apigatewayv2_authorizer_missing_id_and_name(self):
         """Test aws_apigatewayv2_authorizer with missing id and name"""
-        resource = {
-            "change": {
-                "after": {
-                    "api_id": "api123"
-                }
-            }
-        }
+        resource = plan_resource(api_id="api123")
         
         result = self.service.aws_apigatewayv2_authorizer(resource)
         
@@ -614,14 +414,7 @@ class TestAPIGatewayService(unittest.TestCase):
 
     def test_aws_apigatewayv2_authorizer_client_error(self):
         """Test aws_apigatewayv2_authorizer with ClientError"""
-        resource = {
-            "change": {
-                "after": {
-                    "api_id": "api123",
-                    "name": "test-authorizer"
-                }
-            }
-        }
+        resource = plan_resource(api_id="api123", name="test-authorizer")
         self.mock_client.get_authorizers.side_effect = botocore.exceptions.ClientError(
             {"Error": {"Code": "UnauthorizedOperation"}}, "GetAuthorizers"
         )
@@ -642,14 +435,7 @@ class TestAPIGatewayService(unittest.TestCase):
 
     def test_aws_apigatewayv2_authorizer_multiple_authorizers(self):
         """Test aws_apigatewayv2_authorizer with multiple authorizers, finding the correct one"""
-        resource = {
-            "change": {
-                "after": {
-                    "api_id": "api123",
-                    "name": "test-authorizer"
-                }
-            }
-        }
+        resource = plan_resource(api_id="api123", name="test-authorizer")
         self.mock_client.get_authorizers.return_value = {
             "Items": [
                 {"AuthorizerId": "auth123", "Name": "other-authorizer"},
@@ -665,14 +451,7 @@ class TestAPIGatewayService(unittest.TestCase):
     # Tests for aws_apigatewayv2_api_mapping
     def test_aws_apigatewayv2_api_mapping_by_id(self):
         """Test aws_apigatewayv2_api_mapping with ID"""
-        resource = {
-            "change": {
-                "after": {
-                    "id": "mapping123",
-                    "domain_name": "api.example.com"
-                }
-            }
-        }
+        resource = plan_resource(id="mapping123", domain_name="api.example.com")
         self.mock_client.get_api_mapping.return_value = {
             "ApiMappingId": "mapping123",
             "DomainName": "api.example.com"
@@ -684,14 +463,7 @@ class TestAPIGatewayService(unittest.TestCase):
 
     def test_aws_apigatewayv2_api_mapping_by_api_id(self):
         """Test aws_apigatewayv2_api_mapping with api_id"""
-        resource = {
-            "change": {
-                "after": {
-                    "domain_name": "api.example.com",
-                    "api_id": "api123"
-                }
-            }
-        }
+        resource = plan_resource(domain_name="api.example.com", api_id="api123")
         self.mock_client.get_api_mappings.return_value = {
             "Items": [{"ApiMappingId": "mapping123", "ApiId": "api123"}]
         }
@@ -702,15 +474,8 @@ class TestAPIGatewayService(unittest.TestCase):
 
     def test_aws_apigatewayv2_api_mapping_not_found(self):
         """Test aws_apigatewayv2_api_mapping when mapping doesn't exist"""
-        resource = {
-            "change": {
-                "after": {
-                    "id": "mapping123",
-                    "domain_name": "api.example.com"
-                }
-            }
-        }
-        self.mock_client.get_api_mapping.side_effect = self.service.client.exceptions.NotFoundException()
+        resource = plan_resource(id="mapping123", domain_name="api.example.com")
+        self.mock_client.get_api_mapping.side_effect = NotFoundException()
         
         result = self.service.aws_apigatewayv2_api_mapping(resource)
         
@@ -718,13 +483,7 @@ class TestAPIGatewayService(unittest.TestCase):
 
     def test_aws_apigatewayv2_api_mapping_missing_domain_name(self):
         """Test aws_apigatewayv2_api_mapping with missing domain_name"""
-        resource = {
-            "change": {
-                "after": {
-                    "api_id": "api123"
-                }
-            }
-        }
+        resource = plan_resource(api_id="api123")
         
         result = self.service.aws_apigatewayv2_api_mapping(resource)
         
@@ -732,13 +491,7 @@ class TestAPIGatewayService(unittest.TestCase):
 
     def test_aws_apigatewayv2_api_mapping_missing_id_and_api_id(self):
         """Test aws_apigatewayv2_api_mapping with missing id and api_id"""
-        resource = {
-            "change": {
-                "after": {
-                    "domain_name": "api.example.com"
-                }
-            }
-        }
+        resource = plan_resource(domain_name="api.example.com")
         
         result = self.service.aws_apigatewayv2_api_mapping(resource)
         
@@ -747,14 +500,7 @@ class TestAPIGatewayService(unittest.TestCase):
     # Tests for aws_apigatewayv2_deployment
     def test_aws_apigatewayv2_deployment_by_id(self):
         """Test aws_apigatewayv2_deployment with ID"""
-        resource = {
-            "change": {
-                "after": {
-                    "api_id": "api123",
-                    "id": "dep456"
-                }
-            }
-        }
+        resource = plan_resource(api_id="api123", id="dep456")
         self.mock_client.get_deployment.return_value = {
             "DeploymentId": "dep456"
         }
@@ -765,13 +511,7 @@ class TestAPIGatewayService(unittest.TestCase):
 
     def test_aws_apigatewayv2_deployment_latest(self):
         """Test aws_apigatewayv2_deployment without ID (gets latest)"""
-        resource = {
-            "change": {
-                "after": {
-                    "api_id": "api123"
-                }
-            }
-        }
+        resource = plan_resource(api_id="api123")
         self.mock_client.get_deployments.return_value = {
             "Items": [{"DeploymentId": "dep456"}]
         }
@@ -782,15 +522,8 @@ class TestAPIGatewayService(unittest.TestCase):
 
     def test_aws_apigatewayv2_deployment_not_found(self):
         """Test aws_apigatewayv2_deployment when deployment doesn't exist"""
-        resource = {
-            "change": {
-                "after": {
-                    "api_id": "api123",
-                    "id": "dep456"
-                }
-            }
-        }
-        self.mock_client.get_deployment.side_effect = self.service.client.exceptions.NotFoundException()
+        resource = plan_resource(api_id="api123", id="dep456")
+        self.mock_client.get_deployment.side_effect = NotFoundException()
         
         result = self.service.aws_apigatewayv2_deployment(resource)
         
@@ -798,13 +531,7 @@ class TestAPIGatewayService(unittest.TestCase):
 
     def test_aws_apigatewayv2_deployment_missing_api_id(self):
         """Test aws_apigatewayv2_deployment with missing api_id"""
-        resource = {
-            "change": {
-                "after": {
-                    "id": "dep456"
-                }
-            }
-        }
+        resource = plan_resource(id="dep456")
         
         result = self.service.aws_apigatewayv2_deployment(resource)
         
@@ -812,13 +539,7 @@ class TestAPIGatewayService(unittest.TestCase):
 
     def test_aws_apigatewayv2_deployment_no_deployments(self):
         """Test aws_apigatewayv2_deployment when no deployments exist"""
-        resource = {
-            "change": {
-                "after": {
-                    "api_id": "api123"
-                }
-            }
-        }
+        resource = plan_resource(api_id="api123")
         self.mock_client.get_deployments.return_value = {
             "Items": []
         }
@@ -830,13 +551,7 @@ class TestAPIGatewayService(unittest.TestCase):
     # Tests for aws_apigatewayv2_domain_name
     def test_aws_apigatewayv2_domain_name_success(self):
         """Test aws_apigatewayv2_domain_name with successful response"""
-        resource = {
-            "change": {
-                "after": {
-                    "domain_name": "api.example.com"
-                }
-            }
-        }
+        resource = plan_resource(domain_name="api.example.com")
         self.mock_client.get_domain_name.return_value = {
             "DomainName": "api.example.com"
         }
@@ -847,14 +562,8 @@ class TestAPIGatewayService(unittest.TestCase):
 
     def test_aws_apigatewayv2_domain_name_not_found(self):
         """Test aws_apigatewayv2_domain_name when domain doesn't exist"""
-        resource = {
-            "change": {
-                "after": {
-                    "domain_name": "api.example.com"
-                }
-            }
-        }
-        self.mock_client.get_domain_name.side_effect = self.service.client.exceptions.NotFoundException()
+        resource = plan_resource(domain_name="api.example.com")
+        self.mock_client.get_domain_name.side_effect = NotFoundException()
         
         result = self.service.aws_apigatewayv2_domain_name(resource)
         
@@ -862,11 +571,7 @@ class TestAPIGatewayService(unittest.TestCase):
 
     def test_aws_apigatewayv2_domain_name_missing_field(self):
         """Test aws_apigatewayv2_domain_name with missing domain_name"""
-        resource = {
-            "change": {
-                "after": {}
-            }
-        }
+        resource = plan_resource()
         
         result = self.service.aws_apigatewayv2_domain_name(resource)
         
@@ -874,13 +579,7 @@ class TestAPIGatewayService(unittest.TestCase):
 
     def test_aws_apigatewayv2_domain_name_client_error(self):
         """Test aws_apigatewayv2_domain_name with ClientError"""
-        resource = {
-            "change": {
-                "after": {
-                    "domain_name": "api.example.com"
-                }
-            }
-        }
+        resource = plan_resource(domain_name="api.example.com")
         self.mock_client.get_domain_name.side_effect = botocore.exceptions.ClientError(
             {"Error": {"Code": "UnauthorizedOperation"}}, "GetDomainName"
         )
@@ -892,14 +591,7 @@ class TestAPIGatewayService(unittest.TestCase):
     # Tests for aws_apigatewayv2_integration
     def test_aws_apigatewayv2_integration_by_id(self):
         """Test aws_apigatewayv2_integration with ID"""
-        resource = {
-            "change": {
-                "after": {
-                    "api_id": "api123",
-                    "id": "int456"
-                }
-            }
-        }
+        resource = plan_resource(api_id="api123", id="int456")
         self.mock_client.get_integration.return_value = {
             "IntegrationId": "int456"
         }
@@ -910,13 +602,7 @@ class TestAPIGatewayService(unittest.TestCase):
 
     def test_aws_apigatewayv2_integration_first_integration(self):
         """Test aws_apigatewayv2_integration without ID (gets first)"""
-        resource = {
-            "change": {
-                "after": {
-                    "api_id": "api123"
-                }
-            }
-        }
+        resource = plan_resource(api_id="api123")
         self.mock_client.get_integrations.return_value = {
             "Items": [{"IntegrationId": "int456"}]
         }
@@ -927,15 +613,8 @@ class TestAPIGatewayService(unittest.TestCase):
 
     def test_aws_apigatewayv2_integration_not_found(self):
         """Test aws_apigatewayv2_integration when integration doesn't exist"""
-        resource = {
-            "change": {
-                "after": {
-                    "api_id": "api123",
-                    "id": "int456"
-                }
-            }
-        }
-        self.mock_client.get_integration.side_effect = self.service.client.exceptions.NotFoundException()
+        resource = plan_resource(api_id="api123", id="int456")
+        self.mock_client.get_integration.side_effect = NotFoundException()
         
         result = self.service.aws_apigatewayv2_integration(resource)
         
@@ -943,13 +622,7 @@ class TestAPIGatewayService(unittest.TestCase):
 
     def test_aws_apigatewayv2_integration_missing_api_id(self):
         """Test aws_apigatewayv2_integration with missing api_id"""
-        resource = {
-            "change": {
-                "after": {
-                    "id": "int456"
-                }
-            }
-        }
+        resource = plan_resource(id="int456")
         
         result = self.service.aws_apigatewayv2_integration(resource)
         
@@ -957,13 +630,7 @@ class TestAPIGatewayService(unittest.TestCase):
 
     def test_aws_apigatewayv2_integration_no_integrations(self):
         """Test aws_apigatewayv2_integration when no integrations exist"""
-        resource = {
-            "change": {
-                "after": {
-                    "api_id": "api123"
-                }
-            }
-        }
+        resource = plan_resource(api_id="api123")
         self.mock_client.get_integrations.return_value = {
             "Items": []
         }
@@ -974,14 +641,7 @@ class TestAPIGatewayService(unittest.TestCase):
 
     def test_aws_apigatewayv2_integration_client_error(self):
         """Test aws_apigatewayv2_integration with ClientError"""
-        resource = {
-            "change": {
-                "after": {
-                    "api_id": "api123",
-                    "id": "int456"
-                }
-            }
-        }
+        resource = plan_resource(api_id="api123", id="int456")
         self.mock_client.get_integration.side_effect = botocore.exceptions.ClientError(
             {"Error": {"Code": "UnauthorizedOperation"}}, "GetIntegration"
         )
@@ -992,14 +652,7 @@ class TestAPIGatewayService(unittest.TestCase):
 
     def test_aws_apigatewayv2_integration_websocket_connect(self):
         """Test aws_apigatewayv2_integration with WebSocket connect integration_uri"""
-        resource = {
-            "change": {
-                "after": {
-                    "api_id": "api123",
-                    "integration_uri": "https://example.com/websocket/connect"
-                }
-            }
-        }
+        resource = plan_resource(api_id="api123", integration_uri="https://example.com/websocket/connect")
         self.mock_client.get_routes.return_value = {
             "Items": [
                 {"RouteKey": "$connect", "RouteId": "route123", "Target": "integrations/int456"},
@@ -1014,14 +667,7 @@ class TestAPIGatewayService(unittest.TestCase):
 
     def test_aws_apigatewayv2_integration_websocket_disconnect(self):
         """Test aws_apigatewayv2_integration with WebSocket disconnect integration_uri"""
-        resource = {
-            "change": {
-                "after": {
-                    "api_id": "api123",
-                    "integration_uri": "https://example.com/websocket/disconnect"
-                }
-            }
-        }
+        resource = plan_resource(api_id="api123", integration_uri="https://example.com/websocket/disconnect")
         self.mock_client.get_routes.return_value = {
             "Items": [
                 {"RouteKey": "$connect", "RouteId": "route123", "Target": "integrations/int456"},
@@ -1036,14 +682,7 @@ class TestAPIGatewayService(unittest.TestCase):
 
     def test_aws_apigatewayv2_integration_websocket_message(self):
         """Test aws_apigatewayv2_integration with WebSocket message integration_uri"""
-        resource = {
-            "change": {
-                "after": {
-                    "api_id": "api123",
-                    "integration_uri": "https://example.com/websocket/message"
-                }
-            }
-        }
+        resource = plan_resource(api_id="api123", integration_uri="https://example.com/websocket/message")
         self.mock_client.get_routes.return_value = {
             "Items": [
                 {"RouteKey": "$connect", "RouteId": "route123", "Target": "integrations/int456"},
@@ -1058,14 +697,7 @@ class TestAPIGatewayService(unittest.TestCase):
 
     def test_aws_apigatewayv2_integration_websocket_route_not_found(self):
         """Test aws_apigatewayv2_integration when WebSocket route doesn't exist"""
-        resource = {
-            "change": {
-                "after": {
-                    "api_id": "api123",
-                    "integration_uri": "https://example.com/websocket/connect"
-                }
-            }
-        }
+        resource = plan_resource(api_id="api123", integration_uri="https://example.com/websocket/connect")
         self.mock_client.get_routes.return_value = {
             "Items": [
                 {"RouteKey": "$disconnect", "RouteId": "route789", "Target": "integrations/int999"}
@@ -1076,48 +708,24 @@ class TestAPIGatewayService(unittest.TestCase):
         
         self.assertIsNone(result)
 
-    def test_get_websocket_route_key_from_uri_connect(self):
-        """Test _get_websocket_route_key_from_uri with connect URI"""
-        result = self.service._get_websocket_route_key_from_uri("https://example.com/websocket/connect")
-        self.assertEqual(result, "$connect")
-
-    def test_get_websocket_route_key_from_uri_disconnect(self):
-        """Test _get_websocket_route_key_from_uri with disconnect URI"""
-        result = self.service._get_websocket_route_key_from_uri("https://example.com/websocket/disconnect")
-        self.assertEqual(result, "$disconnect")
-
-    def test_get_websocket_route_key_from_uri_message(self):
-        """Test _get_websocket_route_key_from_uri with message URI"""
-        result = self.service._get_websocket_route_key_from_uri("https://example.com/websocket/message")
-        self.assertEqual(result, "$default")
-
-    def test_get_websocket_route_key_from_uri_default(self):
-        """Test _get_websocket_route_key_from_uri with default URI"""
-        result = self.service._get_websocket_route_key_from_uri("https://example.com/websocket/default")
-        self.assertEqual(result, "$default")
-
-    def test_get_websocket_route_key_from_uri_none(self):
-        """Test _get_websocket_route_key_from_uri with None"""
-        result = self.service._get_websocket_route_key_from_uri(None)
-        self.assertIsNone(result)
-
-    def test_get_websocket_route_key_from_uri_unknown(self):
-        """Test _get_websocket_route_key_from_uri with unknown URI"""
-        result = self.service._get_websocket_route_key_from_uri("https://example.com/api/endpoint")
-        self.assertIsNone(result)
+    def test_get_websocket_route_key_from_uri(self):
+        """Test _get_websocket_route_key_from_uri maps integration URIs to WebSocket route keys"""
+        cases = [
+            ("https://example.com/websocket/connect", "$connect"),
+            ("https://example.com/websocket/disconnect", "$disconnect"),
+            ("https://example.com/websocket/message", "$default"),
+            ("https://example.com/websocket/default", "$default"),
+            (None, None),
+            ("https://example.com/api/endpoint", None)
+        ]
+        for uri, expected in cases:
+            with self.subTest(uri=uri):
+                self.assertEqual(self.service._get_websocket_route_key_from_uri(uri), expected)
 
     # Tests for aws_apigatewayv2_integration_response
     def test_aws_apigatewayv2_integration_response_by_id(self):
         """Test aws_apigatewayv2_integration_response with ID"""
-        resource = {
-            "change": {
-                "after": {
-                    "api_id": "api123",
-                    "integration_id": "int456",
-                    "id": "resp789"
-                }
-            }
-        }
+        resource = plan_resource(api_id="api123", integration_id="int456", id="resp789")
         self.mock_client.get_integration_response.return_value = {
             "IntegrationResponseId": "resp789"
         }
@@ -1128,15 +736,7 @@ class TestAPIGatewayService(unittest.TestCase):
 
     def test_aws_apigatewayv2_integration_response_by_key(self):
         """Test aws_apigatewayv2_integration_response with integration_response_key"""
-        resource = {
-            "change": {
-                "after": {
-                    "api_id": "api123",
-                    "integration_id": "int456",
-                    "integration_response_key": "/200"
-                }
-            }
-        }
+        resource = plan_resource(api_id="api123", integration_id="int456", integration_response_key="/200")
         self.mock_client.get_integration_responses.return_value = {
             "Items": [
                 {"IntegrationResponseId": "resp111", "IntegrationResponseKey": "/default"},
@@ -1150,16 +750,8 @@ class TestAPIGatewayService(unittest.TestCase):
 
     def test_aws_apigatewayv2_integration_response_not_found(self):
         """Test aws_apigatewayv2_integration_response when response doesn't exist"""
-        resource = {
-            "change": {
-                "after": {
-                    "api_id": "api123",
-                    "integration_id": "int456",
-                    "id": "resp789"
-                }
-            }
-        }
-        self.mock_client.get_integration_response.side_effect = self.service.client.exceptions.NotFoundException()
+        resource = plan_resource(api_id="api123", integration_id="int456", id="resp789")
+        self.mock_client.get_integration_response.side_effect = NotFoundException()
         
         result = self.service.aws_apigatewayv2_integration_response(resource)
         
@@ -1167,13 +759,7 @@ class TestAPIGatewayService(unittest.TestCase):
 
     def test_aws_apigatewayv2_integration_response_missing_fields(self):
         """Test aws_apigatewayv2_integration_response with missing required fields"""
-        resource = {
-            "change": {
-                "after": {
-                    "api_id": "api123"
-                }
-            }
-        }
+        resource = plan_resource(api_id="api123")
         
         result = self.service.aws_apigatewayv2_integration_response(resource)
         
@@ -1181,15 +767,7 @@ class TestAPIGatewayService(unittest.TestCase):
 
     def test_aws_apigatewayv2_integration_response_key_not_found(self):
         """Test aws_apigatewayv2_integration_response when key doesn't exist"""
-        resource = {
-            "change": {
-                "after": {
-                    "api_id": "api123",
-                    "integration_id": "int456",
-                    "integration_response_key": "/404"
-                }
-            }
-        }
+        resource = plan_resource(api_id="api123", integration_id="int456", integration_response_key="/404")
         self.mock_client.get_integration_responses.return_value = {
             "Items": [
                 {"IntegrationResponseId": "resp111", "IntegrationResponseKey": "/200"}
@@ -1202,14 +780,7 @@ class TestAPIGatewayService(unittest.TestCase):
 
     def test_aws_apigatewayv2_integration_response_missing_id_and_key(self):
         """Test aws_apigatewayv2_integration_response when neither id nor key provided"""
-        resource = {
-            "change": {
-                "after": {
-                    "api_id": "api123",
-                    "integration_id": "int456"
-                }
-            }
-        }
+        resource = plan_resource(api_id="api123", integration_id="int456")
         
         result = self.service.aws_apigatewayv2_integration_response(resource)
         
@@ -1217,15 +788,7 @@ class TestAPIGatewayService(unittest.TestCase):
 
     def test_aws_apigatewayv2_integration_response_client_error(self):
         """Test aws_apigatewayv2_integration_response with ClientError"""
-        resource = {
-            "change": {
-                "after": {
-                    "api_id": "api123",
-                    "integration_id": "int456",
-                    "id": "resp789"
-                }
-            }
-        }
+        resource = plan_resource(api_id="api123", integration_id="int456", id="resp789")
         self.mock_client.get_integration_response.side_effect = botocore.exceptions.ClientError(
             {"Error": {"Code": "UnauthorizedOperation"}}, "GetIntegrationResponse"
         )
@@ -1237,14 +800,7 @@ class TestAPIGatewayService(unittest.TestCase):
     # Tests for aws_apigatewayv2_route
     def test_aws_apigatewayv2_route_by_id(self):
         """Test aws_apigatewayv2_route with ID"""
-        resource = {
-            "change": {
-                "after": {
-                    "api_id": "api123",
-                    "id": "route456"
-                }
-            }
-        }
+        resource = plan_resource(api_id="api123", id="route456")
         self.mock_client.get_route.return_value = {
             "RouteId": "route456"
         }
@@ -1255,14 +811,7 @@ class TestAPIGatewayService(unittest.TestCase):
 
     def test_aws_apigatewayv2_route_by_route_key(self):
         """Test aws_apigatewayv2_route with route_key"""
-        resource = {
-            "change": {
-                "after": {
-                    "api_id": "api123",
-                    "route_key": "GET /users"
-                }
-            }
-        }
+        resource = plan_resource(api_id="api123", route_key="GET /users")
         self.mock_client.get_routes.return_value = {
             "Items": [{"RouteId": "route456", "RouteKey": "GET /users"}]
         }
@@ -1273,15 +822,8 @@ class TestAPIGatewayService(unittest.TestCase):
 
     def test_aws_apigatewayv2_route_not_found(self):
         """Test aws_apigatewayv2_route when route doesn't exist"""
-        resource = {
-            "change": {
-                "after": {
-                    "api_id": "api123",
-                    "id": "route456"
-                }
-            }
-        }
-        self.mock_client.get_route.side_effect = self.service.client.exceptions.NotFoundException()
+        resource = plan_resource(api_id="api123", id="route456")
+        self.mock_client.get_route.side_effect = NotFoundException()
         
         result = self.service.aws_apigatewayv2_route(resource)
         
@@ -1289,14 +831,7 @@ class TestAPIGatewayService(unittest.TestCase):
 
     def test_aws_apigatewayv2_route_not_found_by_key(self):
         """Test aws_apigatewayv2_route when route_key doesn't match"""
-        resource = {
-            "change": {
-                "after": {
-                    "api_id": "api123",
-                    "route_key": "GET /users"
-                }
-            }
-        }
+        resource = plan_resource(api_id="api123", route_key="GET /users")
         self.mock_client.get_routes.return_value = {
             "Items": []
         }
@@ -1307,13 +842,7 @@ class TestAPIGatewayService(unittest.TestCase):
 
     def test_aws_apigatewayv2_route_missing_api_id(self):
         """Test aws_apigatewayv2_route with missing api_id"""
-        resource = {
-            "change": {
-                "after": {
-                    "id": "route456"
-                }
-            }
-        }
+        resource = plan_resource(id="route456")
         
         result = self.service.aws_apigatewayv2_route(resource)
         
@@ -1321,13 +850,7 @@ class TestAPIGatewayService(unittest.TestCase):
 
     def test_aws_apigatewayv2_route_missing_id_and_route_key(self):
         """Test aws_apigatewayv2_route with missing id and route_key"""
-        resource = {
-            "change": {
-                "after": {
-                    "api_id": "api123"
-                }
-            }
-        }
+        resource = plan_resource(api_id="api123")
         
         result = self.service.aws_apigatewayv2_route(resource)
         
@@ -1335,14 +858,7 @@ class TestAPIGatewayService(unittest.TestCase):
 
     def test_aws_apigatewayv2_route_client_error(self):
         """Test aws_apigatewayv2_route with ClientError"""
-        resource = {
-            "change": {
-                "after": {
-                    "api_id": "api123",
-                    "id": "route456"
-                }
-            }
-        }
+        resource = plan_resource(api_id="api123", id="route456")
         self.mock_client.get_route.side_effect = botocore.exceptions.ClientError(
             {"Error": {"Code": "UnauthorizedOperation"}}, "GetRoute"
         )
@@ -1353,14 +869,7 @@ class TestAPIGatewayService(unittest.TestCase):
 
     def test_aws_apigatewayv2_route_multiple_routes(self):
         """Test aws_apigatewayv2_route with multiple routes, finding the correct one"""
-        resource = {
-            "change": {
-                "after": {
-                    "api_id": "api123",
-                    "route_key": "GET /users"
-                }
-            }
-        }
+        resource = plan_resource(api_id="api123", route_key="GET /users")
         self.mock_client.get_routes.return_value = {
             "Items": [
                 {"RouteId": "route111", "RouteKey": "POST /users"},
@@ -1383,6 +892,34 @@ class TestAPIGatewayService(unittest.TestCase):
         
         self.assertIsNone(result)
 
+    def test_aws_apigatewayv2_route_skip_validation(self):
+        """Test aws_apigatewayv2_route returns the known ID without an AWS call when skip_validation is set"""
+        self.service.skip_validation = True
+        resource = plan_resource(api_id="api123", id="route456")
+        
+        result = self.service.aws_apigatewayv2_route(resource)
+        
+        self.assertEqual(result, "api123/route456")
+        self.mock_client.get_route.assert_not_called()
+
+    def test_aws_apigatewayv2_integration_response_skip_validation(self):
+        """Test aws_apigatewayv2_integration_response skips the AWS call when skip_validation is set"""
+        self.service.skip_validation = True
+        resource = plan_resource(api_id="api123", integration_id="int456", id="resp789")
+        
+        result = self.service.aws_apigatewayv2_integration_response(resource)
+        
+        self.assertEqual(result, "api123/int456/resp789")
+        self.mock_client.get_integration_response.assert_not_called()
+
+    def test_skip_validation_from_environment(self):
+        """Test skip_validation is enabled by the TF_IMPORTER_SKIP_VALIDATION environment variable"""
+        with patch.dict("os.environ", {"TF_IMPORTER_SKIP_VALIDATION": "1"}):
+            service = APIGatewayService(self.mock_session)
+        
+        self.assertTrue(service.skip_validation)
+        self.assertFalse(self.service.skip_validation)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -2,6 +2,7 @@ import unittest
 from unittest.mock import Mock, MagicMock, patch
 import boto3
 from terraform_importer.providers.aws.aws_services.base import BaseAWSService
+from terraform_importer.providers.aws.aws_services.base import CLIENT_CONFIG, REQUEST_LIMITER, TokenBucket, ClientCache
 
 
 class ConcreteAWSService(BaseAWSService):
@@ -25,8 +26,56 @@ class TestBaseAWSService(unittest.TestCase):
     def test_get_client(self):
         """Test get_client method"""
         client = self.service.get_client("ec2")
-        self.mock_session.client.assert_called_once_with("ec2")
+        self.mock_session.client.assert_called_once_with("ec2", config=CLIENT_CONFIG)
         self.assertEqual(client, self.mock_client)
+        self.mock_client.meta.events.register.assert_called_once_with(
+            'before-send', REQUEST_LIMITER.acquire, unique_id='terraform-importer-rate-limit'
+        )
+
+    def test_get_client_shared_between_services(self):
+        """Test services built from the same session share their clients"""
+        other_service = ConcreteAWSService(self.mock_session)
+
+        first = self.service.get_client("ec2")
+        second = other_service.get_client("ec2")
+
+        self.assertIs(first, second)
+        self.mock_session.client.assert_called_once_with("ec2", config=CLIENT_CONFIG)
+
+    def test_client_cache_keys_by_session_and_service(self):
+        """Test ClientCache creates a separate client per session and per service"""
+        cache = ClientCache()
+        other_session = MagicMock(spec=boto3.Session)
+
+        cache.get(self.mock_session, "ec2")
+        cache.get(self.mock_session, "iam")
+        cache.get(other_session, "ec2")
+
+        self.assertEqual(self.mock_session.client.call_count, 2)
+        other_session.client.assert_called_once_with("ec2", config=CLIENT_CONFIG)
+
+    @patch("terraform_importer.providers.aws.aws_services.base.time")
+    def test_token_bucket_waits_when_empty(self, mock_time):
+        """Test TokenBucket allows a burst and then sleeps until a token is refilled"""
+        clock = [100.0]
+        mock_time.monotonic.side_effect = lambda: clock[0]
+        mock_time.sleep.side_effect = lambda seconds: clock.__setitem__(0, clock[0] + seconds)
+        bucket = TokenBucket(rate=2, capacity=2)
+        
+        bucket.acquire()
+        bucket.acquire()
+        mock_time.sleep.assert_not_called()
+        bucket.acquire()
+        
+        mock_time.sleep.assert_called_once_with(0.5)
+
+    def test_client_config(self):
+        """Test clients are created with bounded timeouts and adaptive retries"""
+        self.assertEqual(CLIENT_CONFIG.connect_timeout, 3)
+        self.assertEqual(CLIENT_CONFIG.read_timeout, 10)
+        self.assertTrue(CLIENT_CONFIG.tcp_keepalive)
+        self.assertEqual(CLIENT_CONFIG.max_pool_connections, 50)
+        self.assertEqual(CLIENT_CONFIG.retries, {'mode': 'adaptive', 'max_attempts': 5})
 
     def test_get_resource_list(self):
         """Test get_resource_list returns correct list"""
@@ -51,6 +100,57 @@ class TestBaseAWSService(unittest.TestCase):
         
         self.assertIsNone(result)
 
+    def test_get_id_ignores_unlisted_method(self):
+        """Test get_id only dispatches resource types returned by get_resource_list"""
+        mock_resource = {"change": {"after": {"name": "test"}}}
+        self.service.other_resource = Mock(return_value="other-id")
+        
+        result = self.service.get_id("other_resource", mock_resource)
+        
+        self.assertIsNone(result)
+        self.service.other_resource.assert_not_called()
+
+    def test_get_id_builds_dispatch_table_once(self):
+        """Test get_id reuses the dispatch table across calls"""
+        mock_resource = {"change": {"after": {"name": "test"}}}
+        self.service.test_resource = Mock(return_value="test-id")
+        
+        self.service.get_id("test_resource", mock_resource)
+        dispatch = self.service._dispatch
+        self.service.get_id("test_resource", mock_resource)
+        
+        self.assertIs(self.service._dispatch, dispatch)
+        self.assertEqual(self.service.test_resource.call_count, 2)
+
+    def test_prefetch_listings(self):
+        """Test listed types are answered from the listing and unlisted types are left to the handler"""
+        self.service.LISTINGS = {
+            "test_resource": ("list_things", {"Scope": "Local"}, "Things", "Name"),
+            "other_resource": ("list_others", {}, "Others", "Name"),
+        }
+        self.service.LIST_PREFETCH_THRESHOLD = 2
+        paginator = MagicMock()
+        paginator.paginate.return_value = [{"Things": [{"Name": "a"}]}, {"Things": [{"Name": "b"}]}]
+        self.mock_client.get_paginator.return_value = paginator
+        
+        self.service._prefetch_listings(self.mock_client, {
+            "test_resource": [{"change": {"after": {"name": name}}} for name in ("a", "c")],
+            "other_resource": [{"change": {"after": {"name": "x"}}}]
+        })
+        
+        self.mock_client.get_paginator.assert_called_once_with("list_things")
+        paginator.paginate.assert_called_once_with(Scope="Local")
+        self.assertTrue(self.service._check_listing("test_resource", "b", "Thing"))
+        self.assertFalse(self.service._check_listing("test_resource", "c", "Thing"))
+        self.assertIsNone(self.service._check_listing("other_resource", "x", "Other"))
+
+    def test_after(self):
+        """Test _after returns the planned attributes and tolerates missing or null sections"""
+        self.assertEqual(BaseAWSService._after({"change": {"after": {"name": "test"}}}), {"name": "test"})
+        self.assertEqual(BaseAWSService._after({"change": {"after": None}}), {})
+        self.assertEqual(BaseAWSService._after({"change": None}), {})
+        self.assertEqual(BaseAWSService._after({}), {})
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -3,6 +3,7 @@ from unittest.mock import Mock, MagicMock, patch
 import boto3
 import botocore.exceptions
 from terraform_importer.providers.aws.aws_services.cloudwatch import CloudWatchService
+from terraform_importer.providers.aws.tests.helpers import plan_resource
 
 
 class TestCloudWatchService(unittest.TestCase):
@@ -13,7 +14,7 @@ class TestCloudWatchService(unittest.TestCase):
         self.mock_events_client = MagicMock()
         self.mock_sts_client = MagicMock()
         
-        def client_side_effect(service):
+        def client_side_effect(service, **kwargs):
             clients = {
                 "logs": self.mock_logs_client,
                 "events": self.mock_events_client,
@@ -34,27 +35,19 @@ class TestCloudWatchService(unittest.TestCase):
     def test_get_resource_list(self):
         """Test get_resource_list returns correct resources"""
         resources = self.service.get_resource_list()
-        expected_resources = [
+        expected_resources = (
             "aws_cloudwatch_query_definition",
             "aws_cloudwatch_event_target",
             "aws_cloudwatch_log_group",
             "aws_cloudwatch_metric_alarm",
             "aws_cloudwatch_event_rule",
-            "aws_cloudwatch_log_metric_filter",
-            "aws_cloudwatch_query_definition"
-        ]
+            "aws_cloudwatch_log_metric_filter"
+        )
         self.assertEqual(resources, expected_resources)
 
     def test_aws_cloudwatch_event_target_success(self):
         """Test aws_cloudwatch_event_target with successful response"""
-        resource = {
-            "change": {
-                "after": {
-                    "rule": "test-rule",
-                    "target_id": "test-target"
-                }
-            }
-        }
+        resource = plan_resource(rule="test-rule", target_id="test-target")
         self.mock_events_client.list_targets_by_rule.return_value = {
             "Targets": [{"Id": "test-target"}]
         }
@@ -65,14 +58,7 @@ class TestCloudWatchService(unittest.TestCase):
 
     def test_aws_cloudwatch_event_target_not_found(self):
         """Test aws_cloudwatch_event_target when target doesn't exist"""
-        resource = {
-            "change": {
-                "after": {
-                    "rule": "test-rule",
-                    "target_id": "test-target"
-                }
-            }
-        }
+        resource = plan_resource(rule="test-rule", target_id="test-target")
         self.mock_events_client.list_targets_by_rule.return_value = {
             "Targets": []
         }
@@ -83,13 +69,7 @@ class TestCloudWatchService(unittest.TestCase):
 
     def test_aws_cloudwatch_log_group_success(self):
         """Test aws_cloudwatch_log_group with successful response"""
-        resource = {
-            "change": {
-                "after": {
-                    "name": "/aws/lambda/test-function"
-                }
-            }
-        }
+        resource = plan_resource(name="/aws/lambda/test-function")
         self.mock_logs_client.describe_log_groups.return_value = {
             "logGroups": [{"logGroupName": "/aws/lambda/test-function"}]
         }
@@ -100,13 +80,7 @@ class TestCloudWatchService(unittest.TestCase):
 
     def test_aws_cloudwatch_log_group_not_found(self):
         """Test aws_cloudwatch_log_group when log group doesn't exist"""
-        resource = {
-            "change": {
-                "after": {
-                    "name": "/aws/lambda/test-function"
-                }
-            }
-        }
+        resource = plan_resource(name="/aws/lambda/test-function")
         self.mock_logs_client.describe_log_groups.return_value = {
             "logGroups": []
         }
@@ -117,13 +91,7 @@ class TestCloudWatchService(unittest.TestCase):
 
     def test_aws_cloudwatch_event_rule_success(self):
         """Test aws_cloudwatch_event_rule with successful response"""
-        resource = {
-            "change": {
-                "after": {
-                    "name": "test-rule"
-                }
-            }
-        }
+        resource = plan_resource(name="test-rule")
         self.mock_events_client.list_rules.return_value = {
             "Rules": [{"Name": "test-rule"}]
         }
@@ -134,13 +102,7 @@ class TestCloudWatchService(unittest.TestCase):
 
     def test_aws_cloudwatch_event_rule_not_found(self):
         """Test aws_cloudwatch_event_rule when rule doesn't exist"""
-        resource = {
-            "change": {
-                "after": {
-                    "name": "test-rule"
-                }
-            }
-        }
+        resource = plan_resource(name="test-rule")
         self.mock_events_client.list_rules.return_value = {
             "Rules": []
         }
@@ -151,14 +113,7 @@ class TestCloudWatchService(unittest.TestCase):
 
     def test_aws_cloudwatch_log_metric_filter_success(self):
         """Test aws_cloudwatch_log_metric_filter with successful response"""
-        resource = {
-            "change": {
-                "after": {
-                    "name": "test-filter",
-                    "log_group_name": "/aws/lambda/test-function"
-                }
-            }
-        }
+        resource = plan_resource(name="test-filter", log_group_name="/aws/lambda/test-function")
         self.mock_logs_client.describe_metric_filters.return_value = {
             "metricFilters": [{"filterName": "test-filter"}]
         }
@@ -169,14 +124,7 @@ class TestCloudWatchService(unittest.TestCase):
 
     def test_aws_cloudwatch_log_metric_filter_not_found(self):
         """Test aws_cloudwatch_log_metric_filter when filter doesn't exist"""
-        resource = {
-            "change": {
-                "after": {
-                    "name": "test-filter",
-                    "log_group_name": "/aws/lambda/test-function"
-                }
-            }
-        }
+        resource = plan_resource(name="test-filter", log_group_name="/aws/lambda/test-function")
         self.mock_logs_client.describe_metric_filters.return_value = {
             "metricFilters": []
         }
@@ -187,13 +135,7 @@ class TestCloudWatchService(unittest.TestCase):
 
     def test_aws_cloudwatch_query_definition_success(self):
         """Test aws_cloudwatch_query_definition with successful response"""
-        resource = {
-            "change": {
-                "after": {
-                    "name": "test-query"
-                }
-            }
-        }
+        resource = plan_resource(name="test-query")
         self.mock_logs_client.describe_query_definitions.return_value = {
             "queryDefinitions": [{
                 "name": "test-query",
@@ -208,13 +150,7 @@ class TestCloudWatchService(unittest.TestCase):
 
     def test_aws_cloudwatch_query_definition_not_found(self):
         """Test aws_cloudwatch_query_definition when query doesn't exist"""
-        resource = {
-            "change": {
-                "after": {
-                    "name": "test-query"
-                }
-            }
-        }
+        resource = plan_resource(name="test-query")
         self.mock_logs_client.describe_query_definitions.return_value = {
             "queryDefinitions": []
         }
@@ -225,14 +161,7 @@ class TestCloudWatchService(unittest.TestCase):
 
     def test_aws_cloudwatch_event_target_exception(self):
         """Test aws_cloudwatch_event_target exception handling"""
-        resource = {
-            "change": {
-                "after": {
-                    "rule": "test-rule",
-                    "target_id": "test-target"
-                }
-            }
-        }
+        resource = plan_resource(rule="test-rule", target_id="test-target")
         self.mock_events_client.list_targets_by_rule.side_effect = Exception("Test error")
         
         result = self.service.aws_cloudwatch_event_target(resource)
@@ -241,11 +170,7 @@ class TestCloudWatchService(unittest.TestCase):
 
     def test_aws_cloudwatch_log_group_missing_name(self):
         """Test aws_cloudwatch_log_group with missing name"""
-        resource = {
-            "change": {
-                "after": {}
-            }
-        }
+        resource = plan_resource()
         
         result = self.service.aws_cloudwatch_log_group(resource)
         
@@ -3,6 +3,8 @@ from unittest.mock import Mock, MagicMock, patch
 import boto3
 import botocore.exceptions
 from terraform_importer.providers.aws.aws_services.ec2 import EC2Service
+from terraform_importer.providers.aws.aws_services.base import CLIENT_CONFIG
+from terraform_importer.providers.aws.tests.helpers import plan_resource
 
 
 class TestEC2Service(unittest.TestCase):
@@ -15,28 +17,22 @@ class TestEC2Service(unittest.TestCase):
     def test_init(self):
         """Test EC2Service initialization"""
         self.assertEqual(self.service.session, self.mock_session)
-        self.mock_session.client.assert_called_with("ec2")
+        self.mock_session.client.assert_called_with("ec2", config=CLIENT_CONFIG)
 
     def test_get_resource_list(self):
         """Test get_resource_list returns correct resources"""
         resources = self.service.get_resource_list()
-        expected_resources = [
+        expected_resources = (
             "aws_security_group",
             "aws_security_group_rule",
             "aws_autoscaling_group",
             "aws_key_pair"
-        ]
+        )
         self.assertEqual(resources, expected_resources)
 
     def test_aws_security_group_success(self):
         """Test aws_security_group with successful response"""
-        resource = {
-            "change": {
-                "after": {
-                    "name": "test-sg"
-                }
-            }
-        }
+        resource = plan_resource(name="test-sg")
         self.mock_client.describe_security_groups.return_value = {
             "SecurityGroups": [{"GroupId": "sg-12345678"}]
         }
@@ -48,13 +44,7 @@ class TestEC2Service(unittest.TestCase):
 
     def test_aws_security_group_not_found(self):
         """Test aws_security_group when security group doesn't exist"""
-        resource = {
-            "change": {
-                "after": {
-                    "name": "test-sg"
-                }
-            }
-        }
+        resource = plan_resource(name="test-sg")
         self.mock_client.describe_security_groups.return_value = {
             "SecurityGroups": []
         }
@@ -65,11 +55,7 @@ class TestEC2Service(unittest.TestCase):
 
     def test_aws_security_group_missing_name(self):
         """Test aws_security_group with missing name"""
-        resource = {
-            "change": {
-                "after": {}
-            }
-        }
+        resource = plan_resource()
         
         result = self.service.aws_security_group(resource)
         
@@ -77,18 +63,14 @@ class TestEC2Service(unittest.TestCase):
 
     def test_aws_security_group_rule_success(self):
         """Test aws_security_group_rule with successful response"""
-        resource = {
-            "change": {
-                "after": {
-                    "security_group_id": "sg-12345678",
-                    "type": "ingress",
-                    "protocol": "tcp",
-                    "from_port": 80,
-                    "to_port": 80,
-                    "cidr_blocks": ["0.0.0.0/0"]
-                }
-            }
-        }
+        resource = plan_resource(
+            security_group_id="sg-12345678",
+            type="ingress",
+            protocol="tcp",
+            from_port=80,
+            to_port=80,
+            cidr_blocks=["0.0.0.0/0"]
+        )
         self.mock_client.describe_security_group_rules.return_value = {
             "SecurityGroupRules": [
                 {
@@ -103,18 +85,87 @@ class TestEC2Service(unittest.TestCase):
         
         result = self.service.aws_security_group_rule(resource)
         
-        self.assertIsNotNone(result)
+        self.assertEqual(result, "sg-12345678_ingress_tcp_80_80")
 
-    def test_aws_security_group_rule_missing_security_group_id(self):
-        """Test aws_security_group_rule with missing security_group_id"""
-        resource = {
-            "change": {
-                "after": {
-                    "type": "ingress",
-                    "protocol": "tcp"
+    def test_aws_security_group_rule_matches_cidr_blocks(self):
+        """Test aws_security_group_rule picks the rule whose CIDR blocks match"""
+        resource = plan_resource(
+            security_group_id="sg-12345678",
+            type="ingress",
+            protocol="tcp",
+            from_port=22,
+            to_port=22,
+            cidr_blocks=["10.0.0.0/8", "192.168.0.0/16"]
+        )
+        self.mock_client.describe_security_group_rules.return_value = {
+            "SecurityGroupRules": [
+                {
+                    "SecurityGroupRuleId": "sgr-other",
+                    "IsEgress": False,
+                    "IpProtocol": "tcp",
+                    "FromPort": 22,
+                    "ToPort": 22,
+                    "CidrIpv4Ranges": [{"CidrIpv4": "172.16.0.0/12"}]
+                },
+                {
+                    "SecurityGroupRuleId": "sgr-match",
+                    "IsEgress": False,
+                    "IpProtocol": "tcp",
+                    "FromPort": 22,
+                    "ToPort": 22,
+                    "CidrIpv4Ranges": [{"CidrIpv4": "192.168.0.0/16"}, {"CidrIpv4": "10.0.0.0/8"}]
                 }
-            }
+            ]
         }
+
+        result = self.service.aws_security_group_rule(resource)
+
+        self.assertEqual(result, "sgr-match")
+
+    def test_aws_security_group_rule_describes_group_once(self):
+        """Test aws_security_group_rule describes each security group only once"""
+        self.mock_client.describe_security_group_rules.return_value = {
+            "SecurityGroupRules": [
+                {
+                    "SecurityGroupRuleId": "sgr-ingress",
+                    "GroupId": "sg-12345678",
+                    "IsEgress": False,
+                    "IpProtocol": "tcp",
+                    "FromPort": 443,
+                    "ToPort": 443
+                },
+                {
+                    "SecurityGroupRuleId": "sgr-egress",
+                    "GroupId": "sg-12345678",
+                    "IsEgress": True,
+                    "IpProtocol": "-1",
+                    "FromPort": 0,
+                    "ToPort": 0
+                }
+            ]
+        }
+        ingress = plan_resource(
+            security_group_id="sg-12345678",
+            type="ingress",
+            protocol="tcp",
+            from_port=443,
+            to_port=443
+        )
+        egress = plan_resource(
+            security_group_id="sg-12345678",
+            type="egress",
+            protocol="-1",
+            from_port=0,
+            to_port=0
+        )
+
+        self.assertEqual(self.service.aws_security_group_rule(ingress), "sgr-ingress")
+        self.assertEqual(self.service.aws_security_group_rule(egress), "sgr-egress")
+        self.mock_client.describe_security_group_rules.assert_called_once()
+
+    def test_aws_security_group_rule_missing_security_group_id(self):
+        """Test aws_security_group_rule with missing security_group_id"""
+        resource = plan_resource(type="ingress", protocol="tcp")
         
         result = self.service.aws_security_group_rule(resource)
         
@@ -122,13 +173,7 @@ class TestEC2Service(unittest.TestCase):
 
     def test_aws_autoscaling_group_success(self):
         """Test aws_autoscaling_group with successful response"""
-        resource = {
-            "change": {
-                "after": {
-                    "name": "test-asg"
-                }
-            }
-        }
+        resource = plan_resource(name="test-asg")
         self.mock_client.describe_auto_scaling_groups.return_value = {
             "AutoScalingGroups": [{"AutoScalingGroupName": "test-asg"}]
         }
@@ -139,13 +184,7 @@ class TestEC2Service(unittest.TestCase):
 
     def test_aws_autoscaling_group_not_found(self):
         """Test aws_autoscaling_group when ASG doesn't exist"""
-        resource = {
-            "change": {
-                "after": {
-                    "name": "test-asg"
-                }
-            }
-        }
+        resource = plan_resource(name="test-asg")
         self.mock_client.describe_auto_scaling_groups.return_value = {
             "AutoScalingGroups": []
         }
@@ -156,13 +195,7 @@ class TestEC2Service(unittest.TestCase):
 
     def test_aws_key_pair_success(self):
         """Test aws_key_pair with successful response"""
-        resource = {
-            "change": {
-                "after": {
-                    "key_name": "test-key"
-                }
-            }
-        }
+        resource = plan_resource(key_name="test-key")
         self.mock_client.describe_key_pairs.return_value = {
             "KeyPairs": [{"KeyName": "test-key"}]
         }
@@ -173,13 +206,7 @@ class TestEC2Service(unittest.TestCase):
 
     def test_aws_key_pair_not_found(self):
         """Test aws_key_pair when key pair doesn't exist"""
-        resource = {
-            "change": {
-                "after": {
-                    "key_name": "test-key"
-                }
-            }
-        }
+        resource = plan_resource(key_name="test-key")
         self.mock_client.describe_key_pairs.return_value = {
             "KeyPairs": []
         }
@@ -190,13 +217,7 @@ class TestEC2Service(unittest.TestCase):
 
     def test_aws_key_pair_client_error(self):
         """Test aws_key_pair with ClientError"""
-        resource = {
-            "change": {
-                "after": {
-                    "key_name": "test-key"
-                }
-            }
-        }
+        resource = plan_resource(key_name="test-key")
         self.mock_client.describe_key_pairs.side_effect = botocore.exceptions.ClientError(
             {"Error": {"Code": "InvalidKeyPair.NotFound"}}, "DescribeKeyPairs"
         )
@@ -205,6 +226,84 @@ class TestEC2Service(unittest.TestCase):
         
         self.assertIsNone(result)
 
+    def test_prefetch_resolves_from_cache(self):
+        """Test prefetch batches lookups so the handlers need no further AWS calls"""
+        sg_paginator = MagicMock()
+        sg_paginator.paginate.return_value = [
+            {"SecurityGroups": [{"GroupName": "web", "GroupId": "sg-web"}]}
+        ]
+        rules_paginator = MagicMock()
+        rules_paginator.paginate.return_value = [
+            {"SecurityGroupRules": [
+                {
+                    "SecurityGroupRuleId": "sgr-web",
+                    "GroupId": "sg-web",
+                    "IsEgress": False,
+                    "IpProtocol": "tcp",
+                    "FromPort": 443,
+                    "ToPort": 443
+                }
+            ]}
+        ]
+        self.mock_client.get_paginator.side_effect = lambda name: {
+            "describe_security_groups": sg_paginator,
+            "describe_security_group_rules": rules_paginator
+        }[name]
+        self.mock_client.describe_key_pairs.return_value = {"KeyPairs": [{"KeyName": "deploy"}]}
+        security_group = plan_resource(name="web")
+        rule = plan_resource(
+            security_group_id="sg-web",
+            type="ingress",
+            protocol="tcp",
+            from_port=443,
+            to_port=443
+        )
+        key_pair = plan_resource(key_name="deploy")
+
+        self.service.prefetch({
+            "aws_security_group": [security_group],
+            "aws_security_group_rule": [rule],
+            "aws_key_pair": [key_pair]
+        })
+
+        self.assertEqual(self.service.aws_security_group(security_group), "sg-web")
+        self.assertEqual(self.service.aws_security_group_rule(rule), "sgr-web")
+        self.assertEqual(self.service.aws_key_pair(key_pair), "deploy")
+        rules_paginator.paginate.assert_called_once_with(
+            Filters=[{"Name": "group-id", "Values": ["sg-web"]}]
+        )
+        self.mock_client.describe_key_pairs.assert_called_once_with(
+            Filters=[{"Name": "key-name", "Values": ["deploy"]}]
+        )
+        self.mock_client.describe_security_groups.assert_not_called()
+        self.mock_client.describe_security_group_rules.assert_not_called()
+
+    def test_prefetch_miss_is_not_found(self):
+        """Test names covered by prefetch but missing from its results are not described again"""
+        self.mock_client.describe_key_pairs.return_value = {"KeyPairs": []}
+        sg_paginator = MagicMock()
+        sg_paginator.paginate.return_value = [{"SecurityGroups": []}]
+        self.mock_client.get_paginator.return_value = sg_paginator
+        security_group = plan_resource(name="new-sg")
+        key_pair = plan_resource(key_name="new-key")
+
+        self.service.prefetch({"aws_security_group": [security_group], "aws_key_pair": [key_pair]})
+
+        self.assertIsNone(self.service.aws_security_group(security_group))
+        self.assertIsNone(self.service.aws_key_pair(key_pair))
+        self.mock_client.describe_security_groups.assert_not_called()
+        self.mock_client.describe_key_pairs.assert_called_once_with(
+            Filters=[{"Name": "key-name", "Values": ["new-key"]}]
+        )
+
+    def test_unprefetched_name_is_looked_up(self):
+        """Test handlers still query AWS for names prefetch did not cover"""
+        self.mock_client.describe_key_pairs.return_value = {"KeyPairs": [{"KeyName": "late-key"}]}
+
+        result = self.service.aws_key_pair(plan_resource(key_name="late-key"))
+
+        self.assertEqual(result, "late-key")
+        self.mock_client.describe_key_pairs.assert_called_once_with(KeyNames=["late-key"])
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,8 +1,19 @@
 import unittest
+from types import SimpleNamespace
 from unittest.mock import Mock, MagicMock, patch
 import boto3
 import botocore.exceptions
 from terraform_importer.providers.aws.aws_services.ecr import ECRService
+from terraform_importer.providers.aws.aws_services.base import CLIENT_CONFIG
+from terraform_importer.providers.aws.tests.helpers import plan_resource
+
+
+class RepositoryNotFoundException(Exception):
+    """Stands in for the modeled ECR RepositoryNotFoundException, which a MagicMock client does not provide"""
+
+
+class LifecyclePolicyNotFoundException(Exception):
+    """Stands in for the modeled ECR LifecyclePolicyNotFoundException, which a MagicMock client does not provide"""
 
 
 class TestECRService(unittest.TestCase):
@@ -11,39 +22,29 @@ class TestECRService(unittest.TestCase):
         self.mock_client = MagicMock()
         self.mock_session.client.return_value = self.mock_client
         self.service = ECRService(self.mock_session)
-        # Mock the exceptions attribute
-        self.service.client.exceptions = MagicMock()
-        self.service.client.exceptions.RepositoryNotFoundException = type(
-            'RepositoryNotFoundException', (Exception,), {}
-        )
-        self.service.client.exceptions.LifecyclePolicyNotFoundException = type(
-            'LifecyclePolicyNotFoundException', (Exception,), {}
+        self.service.client.exceptions = SimpleNamespace(
+            RepositoryNotFoundException=RepositoryNotFoundException,
+            LifecyclePolicyNotFoundException=LifecyclePolicyNotFoundException
         )
 
     def test_init(self):
         """Test ECRService initialization"""
         self.assertEqual(self.service.session, self.mock_session)
-        self.mock_session.client.assert_called_with("ecr")
+        self.mock_session.client.assert_called_with("ecr", config=CLIENT_CONFIG)
 
     def test_get_resource_list(self):
         """Test get_resource_list returns correct resources"""
         resources = self.service.get_resource_list()
-        expected_resources = [
+        expected_resources = (
             "aws_ecr_repository",
             "aws_ecr_lifecycle_policy",
             "aws_ecr_registry_scanning_configuration"
-        ]
+        )
         self.assertEqual(resources, expected_resources)
 
     def test_aws_ecr_repository_success(self):
         """Test aws_ecr_repository with successful response"""
-        resource = {
-            "change": {
-                "after": {
-                    "name": "test-repo"
-                }
-            }
-        }
+        resource = plan_resource(name="test-repo")
         self.mock_client.describe_repositories.return_value = {
             "repositories": [{"repositoryName": "test-repo"}]
         }
@@ -57,13 +58,7 @@ class TestECRService(unittest.TestCase):
 
     def test_aws_ecr_repository_not_found(self):
         """Test aws_ecr_repository when repository doesn't exist"""
-        resource = {
-            "change": {
-                "after": {
-                    "name": "test-repo"
-                }
-            }
-        }
+        resource = plan_resource(name="test-repo")
         self.mock_client.describe_repositories.side_effect = botocore.exceptions.ClientError(
             {"Error": {"Code": "RepositoryNotFoundException"}}, "DescribeRepositories"
         )
@@ -74,14 +69,8 @@ class TestECRService(unittest.TestCase):
 
     def test_aws_ecr_repository_not_found_exception(self):
         """Test aws_ecr_repository when repository doesn't exist using exception"""
-        resource = {
-            "change": {
-                "after": {
-                    "name": "test-repo"
-                }
-            }
-        }
-        self.mock_client.describe_repositories.side_effect = self.service.client.exceptions.RepositoryNotFoundException()
+        resource = plan_resource(name="test-repo")
+        self.mock_client.describe_repositories.side_effect = RepositoryNotFoundException()
         
         result = self.service.aws_ecr_repository(resource)
         
@@ -89,11 +78,7 @@ class TestECRService(unittest.TestCase):
 
     def test_aws_ecr_repository_missing_name(self):
         """Test aws_ecr_repository when name is missing"""
-        resource = {
-            "change": {
-                "after": {}
-            }
-        }
+        resource = plan_resource()
         
         result = self.service.aws_ecr_repository(resource)
         
@@ -101,13 +86,7 @@ class TestECRService(unittest.TestCase):
 
     def test_aws_ecr_repository_empty_response(self):
         """Test aws_ecr_repository when response is empty"""
-        resource = {
-            "change": {
-                "after": {
-                    "name": "test-repo"
-                }
-            }
-        }
+        resource = plan_resource(name="test-repo")
         self.mock_client.describe_repositories.return_value = {
             "repositories": []
         }
@@ -118,13 +97,7 @@ class TestECRService(unittest.TestCase):
 
     def test_aws_ecr_repository_client_error(self):
         """Test aws_ecr_repository with other ClientError"""
-        resource = {
-            "change": {
-                "after": {
-                    "name": "test-repo"
-                }
-            }
-        }
+        resource = plan_resource(name="test-repo")
         self.mock_client.describe_repositories.side_effect = botocore.exceptions.ClientError(
             {"Error": {"Code": "AccessDeniedException"}}, "DescribeRepositories"
         )
@@ -145,13 +118,7 @@ class TestECRService(unittest.TestCase):
 
     def test_aws_ecr_repository_unexpected_error(self):
         """Test aws_ecr_repository with unexpected error"""
-        resource = {
-            "change": {
-                "after": {
-                    "name": "test-repo"
-                }
-            }
-        }
+        resource = plan_resource(name="test-repo")
         self.mock_client.describe_repositories.side_effect = Exception("Unexpected error")
         
         result = self.service.aws_ecr_repository(resource)
@@ -160,13 +127,7 @@ class TestECRService(unittest.TestCase):
 
     def test_aws_ecr_lifecycle_policy_success(self):
         """Test aws_ecr_lifecycle_policy with successful response"""
-        resource = {
-            "change": {
-                "after": {
-                    "repository": "test-repo"
-                }
-            }
-        }
+        resource = plan_resource(repository="test-repo")
         self.mock_client.get_lifecycle_policy.return_value = {
             "repositoryName": "test-repo",
             "lifecyclePolicyText": "{\"rules\":[]}"
@@ -181,13 +142,7 @@ class TestECRService(unittest.TestCase):
 
     def test_aws_ecr_lifecycle_policy_not_found(self):
         """Test aws_ecr_lifecycle_policy when lifecycle policy doesn't exist"""
-        resource = {
-            "change": {
-                "after": {
-                    "repository": "test-repo"
-                }
-            }
-        }
+        resource = plan_resource(repository="test-repo")
         self.mock_client.get_lifecycle_policy.side_effect = botocore.exceptions.ClientError(
             {"Error": {"Code": "LifecyclePolicyNotFoundException"}}, "GetLifecyclePolicy"
         )
@@ -198,14 +153,8 @@ class TestECRService(unittest.TestCase):
 
     def test_aws_ecr_lifecycle_policy_not_found_exception(self):
         """Test aws_ecr_lifecycle_policy when lifecycle policy doesn't exist using exception"""
-        resource = {
-            "change": {
-                "after": {
-                    "repository": "test-repo"
-                }
-            }
-        }
-        self.mock_client.get_lifecycle_policy.side_effect = self.service.client.exceptions.LifecyclePolicyNotFoundException()
+        resource = plan_resource(repository="test-repo")
+        self.mock_client.get_lifecycle_policy.side_effect = LifecyclePolicyNotFoundException()
         
         result = self.service.aws_ecr_lifecycle_policy(resource)
         
@@ -213,13 +162,7 @@ class TestECRService(unittest.TestCase):
 
     def test_aws_ecr_lifecycle_policy_repository_not_found(self):
         """Test aws_ecr_lifecycle_policy when repository doesn't exist"""
-        resource = {
-            "change": {
-                "after": {
-                    "repository": "test-repo"
-                }
-            }
-        }
+        resource = plan_resource(repository="test-repo")
         self.mock_client.get_lifecycle_policy.side_effect = botocore.exceptions.ClientError(
             {"Error": {"Code": "RepositoryNotFoundException"}}, "GetLifecyclePolicy"
         )
@@ -230,14 +173,8 @@ class TestECRService(unittest.TestCase):
 
     def test_aws_ecr_lifecycle_policy_repository_not_found_exception(self):
         """Test aws_ecr_lifecycle_policy when repository doesn't exist using exception"""
-        resource = {
-            "change": {
-                "after": {
-                    "repository": "test-repo"
-                }
-            }
-        }
-        self.mock_client.get_lifecycle_policy.side_effect = self.service.client.exceptions.RepositoryNotFoundException()
+        resource = plan_resource(repository="test-repo")
+        self.mock_client.get_lifecycle_policy.side_effect = RepositoryNotFoundException()
         
         result = self.service.aws_ecr_lifecycle_policy(resource)
         
@@ -245,11 +182,7 @@ class TestECRService(unittest.TestCase):
 
     def test_aws_ecr_lifecycle_policy_missing_repository(self):
         """Test aws_ecr_lifecycle_policy when repository is missing"""
-        resource = {
-            "change": {
-                "after": {}
-            }
-        }
+        resource = plan_resource()
         
         result = self.service.aws_ecr_lifecycle_policy(resource)
         
@@ -257,13 +190,7 @@ class TestECRService(unittest.TestCase):
 
     def test_aws_ecr_lifecycle_policy_empty_response(self):
         """Test aws_ecr_lifecycle_policy when response is empty"""
-        resource = {
-            "change": {
-                "after": {
-                    "repository": "test-repo"
-                }
-            }
-        }
+        resource = plan_resource(repository="test-repo")
         self.mock_client.get_lifecycle_policy.return_value = {}
         
         result = self.service.aws_ecr_lifecycle_policy(resource)
@@ -272,13 +199,7 @@ class TestECRService(unittest.TestCase):
 
     def test_aws_ecr_lifecycle_policy_client_error(self):
         """Test aws_ecr_lifecycle_policy with other ClientError"""
-        resource = {
-            "change": {
-                "after": {
-                    "repository": "test-repo"
-                }
-            }
-        }
+        resource = plan_resource(repository="test-repo")
         self.mock_client.get_lifecycle_policy.side_effect = botocore.exceptions.ClientError(
             {"Error": {"Code": "AccessDeniedException"}}, "GetLifecyclePolicy"
         )
@@ -299,13 +220,7 @@ class TestECRService(unittest.TestCase):
 
     def test_aws_ecr_lifecycle_policy_unexpected_error(self):
         """Test aws_ecr_lifecycle_policy with unexpected error"""
-        resource = {
-            "change": {
-                "after": {
-                    "repository": "test-repo"
-                }
-            }
-        }
+        resource = plan_resource(repository="test-repo")
         self.mock_client.get_lifecycle_policy.side_effect = Exception("Unexpected error")
         
         result = self.service.aws_ecr_lifecycle_policy(resource)
@@ -314,11 +229,7 @@ class TestECRService(unittest.TestCase):
 
     def test_aws_ecr_registry_scanning_configuration_success(self):
         """Test aws_ecr_registry_scanning_configuration with successful response"""
-        resource = {
-            "change": {
-                "after": {}
-            }
-        }
+        resource = plan_resource()
         self.mock_client.get_registry_scanning_configuration.return_value = {
             "registryId": "123456789012",
             "scanningConfiguration": {
@@ -331,13 +242,25 @@ class TestECRService(unittest.TestCase):
         self.assertEqual(result, "default")
         self.mock_client.get_registry_scanning_configuration.assert_called_once()
 
-    def test_aws_ecr_registry_scanning_configuration_access_denied(self):
-        """Test aws_ecr_registry_scanning_configuration with AccessDeniedException"""
-        resource = {
-            "change": {
-                "after": {}
+    def test_aws_ecr_registry_scanning_configuration_checked_once(self):
+        """Test aws_ecr_registry_scanning_configuration queries the account-level configuration only once"""
+        resource = plan_resource()
+        self.mock_client.get_registry_scanning_configuration.return_value = {
+            "registryId": "123456789012",
+            "scanningConfiguration": {
+                "scanType": "BASIC"
             }
         }
+
+        self.service.aws_ecr_registry_scanning_configuration(resource)
+        result = self.service.aws_ecr_registry_scanning_configuration(resource)
+
+        self.assertEqual(result, "default")
+        self.mock_client.get_registry_scanning_configuration.assert_called_once()
+
+    def test_aws_ecr_registry_scanning_configuration_access_denied(self):
+        """Test aws_ecr_registry_scanning_configuration with AccessDeniedException"""
+        resource = plan_resource()
         self.mock_client.get_registry_scanning_configuration.side_effect = botocore.exceptions.ClientError(
             {"Error": {"Code": "AccessDeniedException"}}, "GetRegistryScanningConfiguration"
         )
@@ -348,11 +271,7 @@ class TestECRService(unittest.TestCase):
 
     def test_aws_ecr_registry_scanning_configuration_invalid_parameter(self):
         """Test aws_ecr_registry_scanning_configuration with InvalidParameterException"""
-        resource = {
-            "change": {
-                "after": {}
-            }
-        }
+        resource = plan_resource()
         self.mock_client.get_registry_scanning_configuration.side_effect = botocore.exceptions.ClientError(
             {"Error": {"Code": "InvalidParameterException"}}, "GetRegistryScanningConfiguration"
         )
@@ -363,11 +282,7 @@ class TestECRService(unittest.TestCase):
 
     def test_aws_ecr_registry_scanning_configuration_validation_exception(self):
         """Test aws_ecr_registry_scanning_configuration with ValidationException"""
-        resource = {
-            "change": {
-                "after": {}
-            }
-        }
+        resource = plan_resource()
         self.mock_client.get_registry_scanning_configuration.side_effect = botocore.exceptions.ClientError(
             {"Error": {"Code": "ValidationException"}}, "GetRegistryScanningConfiguration"
         )
@@ -378,11 +293,7 @@ class TestECRService(unittest.TestCase):
 
     def test_aws_ecr_registry_scanning_configuration_other_client_error(self):
         """Test aws_ecr_registry_scanning_configuration with other ClientError"""
-        resource = {
-            "change": {
-                "after": {}
-            }
-        }
+        resource = plan_resource()
         self.mock_client.get_registry_scanning_configuration.side_effect = botocore.exceptions.ClientError(
             {"Error": {"Code": "ServiceException"}}, "GetRegistryScanningConfiguration"
         )
@@ -403,17 +314,60 @@ class TestECRService(unittest.TestCase):
 
     def test_aws_ecr_registry_scanning_configuration_unexpected_error(self):
         """Test aws_ecr_registry_scanning_configuration with unexpected error"""
-        resource = {
-            "change": {
-                "after": {}
-            }
-        }
+        resource = plan_resource()
         self.mock_client.get_registry_scanning_configuration.side_effect = Exception("Unexpected error")
         
         result = self.service.aws_ecr_registry_scanning_configuration(resource)
         
         self.assertIsNone(result)
 
+    def test_prefetch_batches_repositories(self):
+        """Test prefetch describes repositories in one call and the handler answers from the cache"""
+        resources = [
+            plan_resource(name=f"repo-{i}") for i in range(3)
+        ]
+        self.mock_client.describe_repositories.return_value = {
+            "repositories": [{"repositoryName": f"repo-{i}"} for i in range(3)]
+        }
+        
+        self.service.prefetch({"aws_ecr_repository": resources})
+        results = [self.service.aws_ecr_repository(resource) for resource in resources]
+        
+        self.assertEqual(results, ["repo-0", "repo-1", "repo-2"])
+        self.mock_client.describe_repositories.assert_called_once_with(
+            repositoryNames=["repo-0", "repo-1", "repo-2"]
+        )
+
+    def test_prefetch_chunks_large_batches(self):
+        """Test prefetch splits repository names into batches of 100"""
+        resources = [
+            plan_resource(name=f"repo-{i:03d}") for i in range(150)
+        ]
+        self.mock_client.describe_repositories.return_value = {"repositories": []}
+        
+        self.service.prefetch({"aws_ecr_repository": resources})
+        
+        self.assertEqual(self.mock_client.describe_repositories.call_count, 2)
+        first_call = self.mock_client.describe_repositories.call_args_list[0]
+        self.assertEqual(len(first_call.kwargs["repositoryNames"]), 100)
+
+    def test_prefetch_missing_repository_lists_registry(self):
+        """Test a batch with a missing repository lists the registry and answers every repository from it"""
+        existing = plan_resource(name="test-repo")
+        missing = plan_resource(name="gone")
+        self.mock_client.describe_repositories.side_effect = botocore.exceptions.ClientError(
+            {"Error": {"Code": "RepositoryNotFoundException"}}, "DescribeRepositories"
+        )
+        paginator = MagicMock()
+        paginator.paginate.return_value = [{"repositories": [{"repositoryName": "test-repo"}]}]
+        self.mock_client.get_paginator.return_value = paginator
+
+        self.service.prefetch({"aws_ecr_repository": [existing, missing]})
+
+        self.assertEqual(self.service.aws_ecr_repository(existing), "test-repo")
+        self.assertIsNone(self.service.aws_ecr_repository(missing))
+        self.mock_client.get_paginator.assert_called_once_with("describe_repositories")
+        self.mock_client.describe_repositories.assert_called_once_with(repositoryNames=["gone", "test-repo"])
 
 if __name__ == "__main__":
     unittest.main()
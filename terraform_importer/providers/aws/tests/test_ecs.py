@@ -3,6 +3,7 @@ from unittest.mock import Mock, MagicMock, patch
 import boto3
 import botocore.exceptions
 from terraform_importer.providers.aws.aws_services.ecs import ECSService
+from terraform_importer.providers.aws.tests.helpers import plan_resource
 
 
 class TestECSService(unittest.TestCase):
@@ -10,7 +11,7 @@ class TestECSService(unittest.TestCase):
         self.mock_session = MagicMock(spec=boto3.Session)
         self.mock_client = MagicMock()
         self.mock_sd_client = MagicMock()
-        self.mock_session.client.side_effect = lambda service: {
+        self.mock_session.client.side_effect = lambda service, **kwargs: {
             "ecs": self.mock_client,
             "servicediscovery": self.mock_sd_client
         }.get(service, MagicMock())
@@ -20,27 +21,27 @@ class TestECSService(unittest.TestCase):
         """Test ECSService initialization"""
         self.assertEqual(self.service.session, self.mock_session)
 
+    def test_sd_client_created_on_first_use(self):
+        """Test the Service Discovery client is only created when it is needed"""
+        created = [call.args[0] for call in self.mock_session.client.call_args_list]
+        self.assertNotIn("servicediscovery", created)
+
+        self.assertIs(self.service.sd_client, self.mock_sd_client)
+
     def test_get_resource_list(self):
         """Test get_resource_list returns correct resources"""
         resources = self.service.get_resource_list()
-        expected_resources = [
+        expected_resources = (
             "aws_ecs_service",
             "aws_ecs_task_definition",
             "aws_ecs_cluster_capacity_providers",
             "aws_service_discovery_service"
-        ]
+        )
         self.assertEqual(resources, expected_resources)
 
     def test_aws_ecs_service_success(self):
         """Test aws_ecs_service with successful response"""
-        resource = {
-            "change": {
-                "after": {
-                    "cluster": "test-cluster",
-                    "name": "test-service"
-                }
-            }
-        }
+        resource = plan_resource(cluster="test-cluster", name="test-service")
         self.mock_client.describe_services.return_value = {
             "services": [{
                 "serviceName": "test-service",
@@ -58,14 +59,7 @@ class TestECSService(unittest.TestCase):
 
     def test_aws_ecs_service_inactive(self):
         """Test aws_ecs_service when service is INACTIVE"""
-        resource = {
-            "change": {
-                "after": {
-                    "cluster": "test-cluster",
-                    "name": "test-service"
-                }
-            }
-        }
+        resource = plan_resource(cluster="test-cluster", name="test-service")
         self.mock_client.describe_services.return_value = {
             "services": [{
                 "serviceName": "test-service",
@@ -79,13 +73,7 @@ class TestECSService(unittest.TestCase):
 
     def test_aws_ecs_service_missing_cluster(self):
         """Test aws_ecs_service with missing cluster"""
-        resource = {
-            "change": {
-                "after": {
-                    "name": "test-service"
-                }
-            }
-        }
+        resource = plan_resource(name="test-service")
         
         result = self.service.aws_ecs_service(resource)
         
@@ -93,13 +81,7 @@ class TestECSService(unittest.TestCase):
 
     def test_aws_ecs_task_definition_success(self):
         """Test aws_ecs_task_definition with successful response"""
-        resource = {
-            "change": {
-                "after": {
-                    "family": "test-family"
-                }
-            }
-        }
+        resource = plan_resource(family="test-family")
         self.mock_client.describe_task_definition.return_value = {
             "taskDefinition": {
                 "taskDefinitionArn": "arn:aws:ecs:us-east-1:123456789012:task-definition/test-family:1"
@@ -112,13 +94,7 @@ class TestECSService(unittest.TestCase):
 
     def test_aws_ecs_task_definition_not_found(self):
         """Test aws_ecs_task_definition when task definition doesn't exist"""
-        resource = {
-            "change": {
-                "after": {
-                    "family": "test-family"
-                }
-            }
-        }
+        resource = plan_resource(family="test-family")
         self.mock_client.describe_task_definition.side_effect = botocore.exceptions.ClientError(
             {"Error": {"Code": "ClientException"}}, "DescribeTaskDefinition"
         )
@@ -129,11 +105,7 @@ class TestECSService(unittest.TestCase):
 
     def test_aws_ecs_task_definition_missing_family(self):
         """Test aws_ecs_task_definition with missing family"""
-        resource = {
-            "change": {
-                "after": {}
-            }
-        }
+        resource = plan_resource()
         
         result = self.service.aws_ecs_task_definition(resource)
         
@@ -141,13 +113,7 @@ class TestECSService(unittest.TestCase):
 
     def test_aws_ecs_cluster_capacity_providers_success(self):
         """Test aws_ecs_cluster_capacity_providers with successful response"""
-        resource = {
-            "change": {
-                "after": {
-                    "cluster_name": "test-cluster"
-                }
-            }
-        }
+        resource = plan_resource(cluster_name="test-cluster")
         self.mock_client.describe_clusters.return_value = {
             "clusters": [{"clusterName": "test-cluster"}]
         }
@@ -158,13 +124,7 @@ class TestECSService(unittest.TestCase):
 
     def test_aws_ecs_cluster_capacity_providers_not_found(self):
         """Test aws_ecs_cluster_capacity_providers when cluster doesn't exist"""
-        resource = {
-            "change": {
-                "after": {
-                    "cluster_name": "test-cluster"
-                }
-            }
-        }
+        resource = plan_resource(cluster_name="test-cluster")
         self.mock_client.describe_clusters.return_value = {
             "clusters": []
         }
@@ -175,11 +135,7 @@ class TestECSService(unittest.TestCase):
 
     def test_aws_ecs_cluster_capacity_providers_missing_name(self):
         """Test aws_ecs_cluster_capacity_providers with missing cluster_name"""
-        resource = {
-            "change": {
-                "after": {}
-            }
-        }
+        resource = plan_resource()
         
         result = self.service.aws_ecs_cluster_capacity_providers(resource)
         
@@ -187,16 +143,12 @@ class TestECSService(unittest.TestCase):
 
     def test_aws_service_discovery_service_success(self):
         """Test aws_service_discovery_service with successful response"""
-        resource = {
-            "change": {
-                "after": {
-                    "name": "test-service",
-                    "dns_config": [{
-                        "namespace_id": "ns-12345678"
-                    }]
-                }
-            }
-        }
+        resource = plan_resource(
+            name="test-service",
+            dns_config=[{
+                "namespace_id": "ns-12345678"
+            }]
+        )
         mock_paginator = MagicMock()
         self.mock_sd_client.get_paginator.return_value = mock_paginator
         mock_paginator.paginate.return_value = [{
@@ -212,16 +164,12 @@ class TestECSService(unittest.TestCase):
 
     def test_aws_service_discovery_service_not_found(self):
         """Test aws_service_discovery_service when service doesn't exist"""
-        resource = {
-            "change": {
-                "after": {
-                    "name": "test-service",
-                    "dns_config": [{
-                        "namespace_id": "ns-12345678"
-                    }]
-                }
-            }
-        }
+        resource = plan_resource(
+            name="test-service",
+            dns_config=[{
+                "namespace_id": "ns-12345678"
+            }]
+        )
         mock_paginator = MagicMock()
         self.mock_sd_client.get_paginator.return_value = mock_paginator
         mock_paginator.paginate.return_value = [{
@@ -234,18 +182,95 @@ class TestECSService(unittest.TestCase):
 
     def test_aws_service_discovery_service_missing_fields(self):
         """Test aws_service_discovery_service with missing fields"""
-        resource = {
-            "change": {
-                "after": {
-                    "name": "test-service"
-                }
-            }
-        }
+        resource = plan_resource(name="test-service")
         
         result = self.service.aws_service_discovery_service(resource)
         
         self.assertIsNone(result)
 
 
+    def test_aws_ecs_task_definition_describes_family_once(self):
+        """Test aws_ecs_task_definition reuses the response for a repeated family"""
+        resource = plan_resource(family="test-family")
+        self.mock_client.describe_task_definition.return_value = {
+            "taskDefinition": {
+                "taskDefinitionArn": "arn:aws:ecs:us-east-1:123456789012:task-definition/test-family:1"
+            }
+        }
+
+        self.service.aws_ecs_task_definition(resource)
+        result = self.service.aws_ecs_task_definition(resource)
+
+        self.assertEqual(result, "arn:aws:ecs:us-east-1:123456789012:task-definition/test-family:1")
+        self.mock_client.describe_task_definition.assert_called_once_with(taskDefinition="test-family")
+
+    def test_aws_ecs_cluster_capacity_providers_describes_cluster_once(self):
+        """Test aws_ecs_cluster_capacity_providers reuses the response for a repeated cluster"""
+        resource = plan_resource(cluster_name="test-cluster")
+        self.mock_client.describe_clusters.return_value = {
+            "clusters": [{"clusterName": "test-cluster"}]
+        }
+
+        self.service.aws_ecs_cluster_capacity_providers(resource)
+        result = self.service.aws_ecs_cluster_capacity_providers(resource)
+
+        self.assertEqual(result, "test-cluster")
+        self.mock_client.describe_clusters.assert_called_once_with(clusters=["test-cluster"])
+
+    def test_aws_service_discovery_service_lists_namespace_once(self):
+        """Test aws_service_discovery_service lists each namespace only once"""
+        mock_paginator = MagicMock()
+        self.mock_sd_client.get_paginator.return_value = mock_paginator
+        mock_paginator.paginate.return_value = [{
+            "Services": [
+                {"Id": "srv-1", "Name": "service-1"},
+                {"Id": "srv-2", "Name": "service-2"}
+            ]
+        }]
+        resources = [
+            plan_resource(name=name, dns_config=[{"namespace_id": "ns-12345678"}])
+            for name in ("service-1", "service-2")
+        ]
+
+        results = [self.service.aws_service_discovery_service(resource) for resource in resources]
+
+        self.assertEqual(results, ["srv-1", "srv-2"])
+        mock_paginator.paginate.assert_called_once()
+
+
+    def test_prefetch_batches_services_per_cluster(self):
+        """Test prefetch describes services in batches per cluster so the handler needs no further calls"""
+        self.mock_client.describe_services.side_effect = lambda cluster, services: {
+            "services": [{"serviceName": name, "status": "ACTIVE"} for name in services]
+        }
+        resources = [
+            plan_resource(cluster="cluster-a", name=f"service-{i}")
+            for i in range(12)
+        ] + [plan_resource(cluster="cluster-b", name="service-0")]
+
+        self.service.prefetch({"aws_ecs_service": resources})
+        calls_after_prefetch = self.mock_client.describe_services.call_count
+        results = [self.service.aws_ecs_service(resource) for resource in resources]
+
+        self.assertEqual(calls_after_prefetch, 3)
+        self.assertEqual(self.mock_client.describe_services.call_count, 3)
+        self.assertEqual(results[0], "cluster-a/service-0")
+        self.assertEqual(results[-1], "cluster-b/service-0")
+
+    def test_prefetch_miss_falls_back_to_lookup(self):
+        """Test aws_ecs_service still describes services missing from the batch response"""
+        self.mock_client.describe_services.side_effect = [
+            {"services": [], "failures": [{"reason": "MISSING"}]},
+            {"services": [{"serviceName": "late-service", "status": "ACTIVE"}]}
+        ]
+        resource = plan_resource(cluster="test-cluster", name="late-service")
+
+        self.service.prefetch({"aws_ecs_service": [resource]})
+        result = self.service.aws_ecs_service(resource)
+
+        self.assertEqual(result, "test-cluster/late-service")
+        self.assertEqual(self.mock_client.describe_services.call_count, 2)
+
+
 if __name__ == "__main__":
     unittest.main()
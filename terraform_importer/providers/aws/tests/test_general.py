@@ -17,7 +17,7 @@ class TestGENERALService(unittest.TestCase):
         self.mock_elasticbeanstalk_client = MagicMock()
         self.mock_elasticache_client = MagicMock()
         
-        def client_side_effect(service):
+        def client_side_effect(service, **kwargs):
             clients = {
                 "sqs": self.mock_sqs_client,
                 "sns": self.mock_sns_client,
@@ -50,7 +50,7 @@ class TestGENERALService(unittest.TestCase):
     def test_get_resource_list(self):
         """Test get_resource_list returns correct resources"""
         resources = self.service.get_resource_list()
-        expected_resources = [
+        expected_resources = (
             "aws_sqs_queue",
             "aws_sns_topic",
             "aws_route53_record",
@@ -61,7 +61,7 @@ class TestGENERALService(unittest.TestCase):
             "aws_codebuild_project",
             "aws_cloudfront_distribution",
             "aws_codebuild_source_credential"
-        ]
+        )
         self.assertEqual(resources, expected_resources)
 
     def test_aws_sqs_queue_success(self):
@@ -10,7 +10,7 @@ class TestIAMService(unittest.TestCase):
         self.mock_session = MagicMock(spec=boto3.Session)
         self.mock_client = MagicMock()
         self.mock_sts_client = MagicMock()
-        self.mock_session.client.side_effect = lambda service: {
+        self.mock_session.client.side_effect = lambda service, **kwargs: {
             "iam": self.mock_client,
             "sts": self.mock_sts_client
         }.get(service, MagicMock())
@@ -30,7 +30,7 @@ class TestIAMService(unittest.TestCase):
     def test_get_resource_list(self):
         """Test get_resource_list returns correct resources"""
         resources = self.service.get_resource_list()
-        expected_resources = [
+        expected_resources = (
             "aws_iam_role",
             "aws_iam_policy",
             "aws_iam_role_policy",
@@ -38,7 +38,7 @@ class TestIAMService(unittest.TestCase):
             "aws_iam_user",
             "aws_iam_group",
             "aws_iam_instance_profile"
-        ]
+        )
         self.assertEqual(resources, expected_resources)
 
     def test_aws_iam_role_success(self):
@@ -104,6 +104,15 @@ class TestIAMService(unittest.TestCase):
         
         self.assertEqual(result, policy_arn)
 
+    def test_aws_iam_policy_looks_up_account_once(self):
+        """Test aws_iam_policy calls STS only once across several policies"""
+        self.mock_client.get_policy.return_value = {"Policy": {}}
+        
+        for name in ("policy-a", "policy-b", "policy-c"):
+            self.service.aws_iam_policy({"change": {"after": {"name": name}}})
+        
+        self.mock_sts_client.get_caller_identity.assert_called_once()
+
     def test_aws_iam_policy_not_found(self):
         """Test aws_iam_policy when policy doesn't exist"""
         resource = {
@@ -222,11 +231,11 @@ class TestIAMService(unittest.TestCase):
                 }
             }
         }
-        self.mock_client.list_attached_role_policies.return_value = {
+        self.mock_client.get_paginator.return_value.paginate.return_value = [{
             "AttachedPolicies": [
                 {"PolicyArn": "arn:aws:iam::aws:policy/ReadOnlyAccess"}
             ]
-        }
+        }]
         
         result = self.service.aws_iam_role_policy_attachment(resource)
         
@@ -242,14 +251,35 @@ class TestIAMService(unittest.TestCase):
                 }
             }
         }
-        self.mock_client.list_attached_role_policies.return_value = {
+        self.mock_client.get_paginator.return_value.paginate.return_value = [{
             "AttachedPolicies": []
-        }
+        }]
         
         result = self.service.aws_iam_role_policy_attachment(resource)
         
         self.assertIsNone(result)
 
+    def test_aws_iam_role_policy_attachment_lists_role_once(self):
+        """Test aws_iam_role_policy_attachment lists every page of a role's attachments only once"""
+        paginator = self.mock_client.get_paginator.return_value
+        paginator.paginate.return_value = [
+            {"AttachedPolicies": [{"PolicyArn": "arn:aws:iam::aws:policy/ReadOnlyAccess"}]},
+            {"AttachedPolicies": [{"PolicyArn": "arn:aws:iam::aws:policy/AmazonS3FullAccess"}]}
+        ]
+        attachments = [
+            {"change": {"after": {"role": "test-role", "policy_arn": policy_arn}}}
+            for policy_arn in ("arn:aws:iam::aws:policy/ReadOnlyAccess", "arn:aws:iam::aws:policy/AmazonS3FullAccess")
+        ]
+
+        results = [self.service.aws_iam_role_policy_attachment(attachment) for attachment in attachments]
+
+        self.assertEqual(results, [
+            "test-role/arn:aws:iam::aws:policy/ReadOnlyAccess",
+            "test-role/arn:aws:iam::aws:policy/AmazonS3FullAccess"
+        ])
+        self.mock_client.get_paginator.assert_called_once_with("list_attached_role_policies")
+        paginator.paginate.assert_called_once_with(RoleName="test-role")
+
     def test_aws_iam_user_success(self):
         """Test aws_iam_user with successful response"""
         resource = {
@@ -346,6 +376,57 @@ class TestIAMService(unittest.TestCase):
         
         self.assertIsNone(result)
 
+    def test_prefetch_lists_roles_once(self):
+        """Test prefetch lists roles once so the handler needs no per-role lookup"""
+        paginator = MagicMock()
+        paginator.paginate.return_value = [
+            {"Roles": [{"RoleName": f"role-{i}"} for i in range(IAMService.LIST_PREFETCH_THRESHOLD)]}
+        ]
+        self.mock_client.get_paginator.return_value = paginator
+        roles = [{"change": {"after": {"name": f"role-{i}"}}} for i in range(IAMService.LIST_PREFETCH_THRESHOLD)]
+
+        self.service.prefetch({"aws_iam_role": roles})
+        results = [self.service.aws_iam_role(role) for role in roles]
+
+        self.assertEqual(results, [f"role-{i}" for i in range(IAMService.LIST_PREFETCH_THRESHOLD)])
+        self.mock_client.get_paginator.assert_called_once_with("list_roles")
+        self.mock_client.get_role.assert_not_called()
+
+    def test_prefetch_lists_local_policies(self):
+        """Test prefetch lists only customer managed policies and matches them by ARN"""
+        self.mock_sts_client.get_caller_identity.return_value = {"Account": "123456789012"}
+        paginator = MagicMock()
+        paginator.paginate.return_value = [
+            {"Policies": [{"Arn": f"arn:aws:iam::123456789012:policy/policy-{i}"} for i in range(IAMService.LIST_PREFETCH_THRESHOLD)]}
+        ]
+        self.mock_client.get_paginator.return_value = paginator
+        policies = [{"change": {"after": {"name": f"policy-{i}"}}} for i in range(IAMService.LIST_PREFETCH_THRESHOLD)]
+
+        self.service.prefetch({"aws_iam_policy": policies})
+        result = self.service.aws_iam_policy(policies[0])
+
+        self.assertEqual(result, "arn:aws:iam::123456789012:policy/policy-0")
+        paginator.paginate.assert_called_once_with(Scope="Local")
+        self.mock_client.get_policy.assert_not_called()
+
+    def test_prefetch_skips_small_batches(self):
+        """Test prefetch does not list a resource type with only a few planned resources"""
+        self.service.prefetch({"aws_iam_user": [{"change": {"after": {"name": "test-user"}}}]})
+
+        self.mock_client.get_paginator.assert_not_called()
+
+    def test_prefetch_miss_is_not_found(self):
+        """Test handlers report resources missing from a completed listing without querying IAM again"""
+        paginator = MagicMock()
+        paginator.paginate.return_value = [{"Groups": []}]
+        self.mock_client.get_paginator.return_value = paginator
+        groups = [{"change": {"after": {"name": f"group-{i}"}}} for i in range(IAMService.LIST_PREFETCH_THRESHOLD)]
+
+        self.service.prefetch({"aws_iam_group": groups})
+        result = self.service.aws_iam_group(groups[0])
+
+        self.assertIsNone(result)
+        self.mock_client.get_group.assert_not_called()
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,7 +1,10 @@
+import time
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import Mock, MagicMock, patch
 import boto3
 import botocore.exceptions
+from terraform_importer.providers.aws.aws_services.base import CLIENT_CONFIG
 import importlib
 lambda_module = importlib.import_module('terraform_importer.providers.aws.aws_services.lambda')
 LambdaService = lambda_module.LambdaService
@@ -22,17 +25,17 @@ class TestLambdaService(unittest.TestCase):
     def test_init(self):
         """Test LambdaService initialization"""
         self.assertEqual(self.service.session, self.mock_session)
-        self.mock_session.client.assert_called_with("lambda")
+        self.mock_session.client.assert_called_with("lambda", config=CLIENT_CONFIG)
 
     def test_get_resource_list(self):
         """Test get_resource_list returns correct resources"""
         resources = self.service.get_resource_list()
-        expected_resources = [
+        expected_resources = (
             "aws_lambda_function",
             "aws_lambda_function_url",
             "aws_lambda_function_event_invoke_config",
             "aws_lambda_permission"
-        ]
+        )
         self.assertEqual(resources, expected_resources)
 
     def test_aws_lambda_function_success(self):
@@ -162,6 +165,81 @@ class TestLambdaService(unittest.TestCase):
         
         self.assertEqual(result, "test-function/test-statement")
 
+    def test_aws_lambda_permission_fetches_policy_once(self):
+        """Test aws_lambda_permission fetches a function's policy once for several permissions"""
+        self.mock_client.get_policy.return_value = {
+            "Policy": '{"Statement": [{"Sid": "allow-s3"}, {"Sid": "allow-sns"}]}'
+        }
+        resources = [
+            {"change": {"after": {"function_name": "test-function", "statement_id": statement_id}}}
+            for statement_id in ("allow-s3", "allow-sns")
+        ]
+
+        results = [self.service.aws_lambda_permission(resource) for resource in resources]
+
+        self.assertEqual(results, ["test-function/allow-s3", "test-function/allow-sns"])
+        self.mock_client.get_policy.assert_called_once_with(FunctionName="test-function")
+
+    def test_missing_function_is_looked_up_once(self):
+        """Test a function Lambda reports as missing is not requested again for later resources"""
+        not_found = self.service.lambda_client.exceptions.ResourceNotFoundException
+        self.mock_client.get_function.side_effect = not_found()
+        self.mock_client.get_policy.side_effect = not_found()
+        function = {"change": {"after": {"function_name": "missing-function"}}}
+        permissions = [
+            {"change": {"after": {"function_name": "missing-function", "statement_id": statement_id}}}
+            for statement_id in ("allow-s3", "allow-sns")
+        ]
+
+        self.assertIsNone(self.service.aws_lambda_function(function))
+        self.assertIsNone(self.service.aws_lambda_function(function))
+        self.assertEqual([self.service.aws_lambda_permission(p) for p in permissions], [None, None])
+        self.mock_client.get_function.assert_called_once_with(FunctionName="missing-function")
+        self.mock_client.get_policy.assert_called_once_with(FunctionName="missing-function")
+
+    def test_aws_lambda_permission_concurrent_lookups_fetch_policy_once(self):
+        """Test concurrent aws_lambda_permission lookups of one function share a single get_policy call"""
+        def get_policy(FunctionName):
+            time.sleep(0.05)
+            return {"Policy": '{"Statement": [{"Sid": "allow-s3"}]}'}
+        self.mock_client.get_policy.side_effect = get_policy
+        resource = {"change": {"after": {"function_name": "test-function", "statement_id": "allow-s3"}}}
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(self.service.aws_lambda_permission, [resource] * 8))
+
+        self.assertEqual(results, ["test-function/allow-s3"] * 8)
+        self.mock_client.get_policy.assert_called_once_with(FunctionName="test-function")
+
+    def test_concurrent_lookups_of_missing_function_request_once(self):
+        """Test threads waiting on an in-flight lookup reuse its not-found result instead of retrying"""
+        not_found = self.service.lambda_client.exceptions.ResourceNotFoundException
+        def get_function(FunctionName):
+            time.sleep(0.05)
+            raise not_found()
+        self.mock_client.get_function.side_effect = get_function
+        resource = {"change": {"after": {"function_name": "missing-function"}}}
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(self.service.aws_lambda_function, [resource] * 8))
+
+        self.assertEqual(results, [None] * 8)
+        self.mock_client.get_function.assert_called_once_with(FunctionName="missing-function")
+
+    def test_aws_lambda_permission_matches_sid_exactly(self):
+        """Test aws_lambda_permission does not match a statement_id that only appears inside the policy text"""
+        self.mock_client.get_policy.return_value = {
+            "Policy": '{"Statement": [{"Sid": "AllowS3Invoke", "Effect": "Allow"}]}'
+        }
+        resources = [
+            {"change": {"after": {"function_name": "test-function", "statement_id": statement_id}}}
+            for statement_id in ("Allow", "AllowS3Invoke")
+        ]
+
+        results = [self.service.aws_lambda_permission(resource) for resource in resources]
+
+        self.assertEqual(results, [None, "test-function/AllowS3Invoke"])
+
     def test_aws_lambda_permission_not_found(self):
         """Test aws_lambda_permission when permission doesn't exist"""
         resource = {
@@ -3,6 +3,7 @@ from unittest.mock import Mock, MagicMock, patch
 import boto3
 import botocore.exceptions
 from terraform_importer.providers.aws.aws_services.lb import LoadBalancerService
+from terraform_importer.providers.aws.aws_services.base import CLIENT_CONFIG
 
 
 class TestLoadBalancerService(unittest.TestCase):
@@ -15,15 +16,15 @@ class TestLoadBalancerService(unittest.TestCase):
     def test_init(self):
         """Test LoadBalancerService initialization"""
         self.assertEqual(self.service.session, self.mock_session)
-        self.mock_session.client.assert_called_with("elbv2")
+        self.mock_session.client.assert_called_with("elbv2", config=CLIENT_CONFIG)
 
     def test_get_resource_list(self):
         """Test get_resource_list returns correct resources"""
         resources = self.service.get_resource_list()
-        expected_resources = [
+        expected_resources = (
             "aws_lb_target_group",
             "aws_lb_listener"
-        ]
+        )
         self.assertEqual(resources, expected_resources)
 
     def test_aws_lb_target_group_success(self):
@@ -35,18 +36,21 @@ class TestLoadBalancerService(unittest.TestCase):
                 }
             }
         }
-        mock_paginator = MagicMock()
-        self.mock_client.get_paginator.return_value = mock_paginator
-        mock_paginator.paginate.return_value = [{
+        self.mock_client.describe_target_groups.return_value = {
             "TargetGroups": [{
                 "TargetGroupName": "test-tg",
                 "TargetGroupArn": "arn:aws:elasticloadbalancing:us-east-1:123456789012:targetgroup/test-tg/1234567890123456"
             }]
-        }]
+        }
         
         result = self.service.aws_lb_target_group(resource)
         
         self.assertEqual(result, "arn:aws:elasticloadbalancing:us-east-1:123456789012:targetgroup/test-tg/1234567890123456")
+        self.mock_client.describe_target_groups.assert_called_once_with(Names=["test-tg"])
+        self.mock_client.get_paginator.assert_not_called()
+
+        self.assertEqual(self.service.aws_lb_target_group(resource), result)
+        self.mock_client.describe_target_groups.assert_called_once()
 
     def test_aws_lb_target_group_not_found(self):
         """Test aws_lb_target_group when target group doesn't exist"""
@@ -57,11 +61,9 @@ class TestLoadBalancerService(unittest.TestCase):
                 }
             }
         }
-        mock_paginator = MagicMock()
-        self.mock_client.get_paginator.return_value = mock_paginator
-        mock_paginator.paginate.return_value = [{
-            "TargetGroups": []
-        }]
+        self.mock_client.describe_target_groups.side_effect = botocore.exceptions.ClientError(
+            {"Error": {"Code": "TargetGroupNotFound"}}, "DescribeTargetGroups"
+        )
         
         result = self.service.aws_lb_target_group(resource)
         
@@ -88,16 +90,46 @@ class TestLoadBalancerService(unittest.TestCase):
                 }
             }
         }
-        mock_paginator = MagicMock()
-        self.mock_client.get_paginator.return_value = mock_paginator
-        mock_paginator.paginate.side_effect = botocore.exceptions.ClientError(
-            {"Error": {"Code": "TargetGroupNotFound"}}, "DescribeTargetGroups"
+        self.mock_client.describe_target_groups.side_effect = botocore.exceptions.ClientError(
+            {"Error": {"Code": "AccessDenied"}}, "DescribeTargetGroups"
         )
         
         result = self.service.aws_lb_target_group(resource)
         
         self.assertIsNone(result)
 
+    def test_prefetch_batches_target_group_names(self):
+        """Test prefetch describes target groups 20 names at a time so the handler needs no listing"""
+        self.mock_client.describe_target_groups.side_effect = lambda Names: {
+            "TargetGroups": [{"TargetGroupName": name, "TargetGroupArn": f"arn:{name}"} for name in Names]
+        }
+        resources = [{"change": {"after": {"name": f"tg-{i:02d}"}}} for i in range(25)]
+
+        self.service.prefetch({"aws_lb_target_group": resources})
+        result = self.service.aws_lb_target_group(resources[24])
+
+        self.assertEqual(result, "arn:tg-24")
+        self.assertEqual(self.mock_client.describe_target_groups.call_count, 2)
+        self.mock_client.get_paginator.assert_not_called()
+
+    def test_prefetch_missing_target_group_lists_all(self):
+        """Test prefetch lists every target group once when a batch names a missing one"""
+        self.mock_client.describe_target_groups.side_effect = botocore.exceptions.ClientError(
+            {"Error": {"Code": "TargetGroupNotFound"}}, "DescribeTargetGroups"
+        )
+        mock_paginator = MagicMock()
+        self.mock_client.get_paginator.return_value = mock_paginator
+        mock_paginator.paginate.return_value = [{
+            "TargetGroups": [{"TargetGroupName": "tg-1", "TargetGroupArn": "arn:tg-1"}]
+        }]
+        resources = [{"change": {"after": {"name": name}}} for name in ("tg-1", "missing")]
+
+        self.service.prefetch({"aws_lb_target_group": resources})
+        results = [self.service.aws_lb_target_group(resource) for resource in resources]
+
+        self.assertEqual(results, ["arn:tg-1", None])
+        mock_paginator.paginate.assert_called_once_with(PaginationConfig={"PageSize": 400})
+
     def test_aws_lb_listener_success(self):
         """Test aws_lb_listener with successful response"""
         resource = {
@@ -122,6 +154,24 @@ class TestLoadBalancerService(unittest.TestCase):
         self.assertIsNotNone(result)
         self.assertEqual(result, "arn:aws:elasticloadbalancing:us-east-1:123456789012:listener/app/test-lb/1234567890123456/1234567890123456")
 
+    def test_aws_lb_listener_describes_load_balancer_once(self):
+        """Test aws_lb_listener describes each load balancer's listeners only once"""
+        self.mock_client.describe_listeners.return_value = {
+            "Listeners": [
+                {"Port": 80, "Protocol": "HTTP", "ListenerArn": "arn:listener/http"},
+                {"Port": 443, "Protocol": "HTTPS", "ListenerArn": "arn:listener/https"}
+            ]
+        }
+        resources = [
+            {"change": {"after": {"load_balancer_arn": "arn:lb", "port": port, "protocol": protocol}}}
+            for port, protocol in ((80, "HTTP"), (443, "HTTPS"), (8080, "HTTP"))
+        ]
+
+        results = [self.service.aws_lb_listener(resource) for resource in resources]
+
+        self.assertEqual(results, ["arn:listener/http", "arn:listener/https", None])
+        self.mock_client.describe_listeners.assert_called_once_with(LoadBalancerArn="arn:lb")
+
     def test_aws_lb_listener_not_found(self):
         """Test aws_lb_listener when listener doesn't exist"""
         resource = {
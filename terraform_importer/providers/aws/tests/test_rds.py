@@ -2,7 +2,8 @@ import unittest
 from unittest.mock import Mock, MagicMock, patch
 import boto3
 import botocore.exceptions
-from terraform_importer.providers.aws.aws_services.rds import EC2Service as RDSService
+from terraform_importer.providers.aws.aws_services.rds import RDSService
+from terraform_importer.providers.aws.aws_services.base import CLIENT_CONFIG
 
 
 class TestRDSService(unittest.TestCase):
@@ -23,15 +24,15 @@ class TestRDSService(unittest.TestCase):
     def test_init(self):
         """Test RDSService initialization"""
         self.assertEqual(self.service.session, self.mock_session)
-        self.mock_session.client.assert_called_with("rds")
+        self.mock_session.client.assert_called_with("rds", config=CLIENT_CONFIG)
 
     def test_get_resource_list(self):
         """Test get_resource_list returns correct resources"""
         resources = self.service.get_resource_list()
-        expected_resources = [
+        expected_resources = (
             "aws_db_instance",
             "aws_db_subnet_group"
-        ]
+        )
         self.assertEqual(resources, expected_resources)
 
     def test_aws_db_instance_success(self):
@@ -193,5 +194,40 @@ class TestRDSService(unittest.TestCase):
         self.assertIsNone(result)
 
 
+    def test_prefetch_lists_db_instances_once(self):
+        """Test prefetch lists DB instances once so the handler needs no per-instance lookup"""
+        paginator = MagicMock()
+        paginator.paginate.return_value = [
+            {"DBInstances": [{"DBInstanceIdentifier": f"db-{i}"} for i in range(RDSService.LIST_PREFETCH_THRESHOLD)]}
+        ]
+        self.mock_client.get_paginator.return_value = paginator
+        instances = [{"change": {"after": {"identifier": f"db-{i}"}}} for i in range(RDSService.LIST_PREFETCH_THRESHOLD)]
+
+        self.service.prefetch({"aws_db_instance": instances})
+        results = [self.service.aws_db_instance(instance) for instance in instances]
+
+        self.assertEqual(results, [f"db-{i}" for i in range(RDSService.LIST_PREFETCH_THRESHOLD)])
+        self.mock_client.get_paginator.assert_called_once_with("describe_db_instances")
+        self.mock_client.describe_db_instances.assert_not_called()
+
+    def test_prefetch_skips_small_batches(self):
+        """Test prefetch does not list a resource type with only a few planned resources"""
+        self.service.prefetch({"aws_db_subnet_group": [{"change": {"after": {"name": "test-subnet-group"}}}]})
+
+        self.mock_client.get_paginator.assert_not_called()
+
+    def test_prefetch_miss_is_not_found(self):
+        """Test handlers report subnet groups missing from a completed listing without describing them again"""
+        paginator = MagicMock()
+        paginator.paginate.return_value = [{"DBSubnetGroups": []}]
+        self.mock_client.get_paginator.return_value = paginator
+        groups = [{"change": {"after": {"name": f"group-{i}"}}} for i in range(RDSService.LIST_PREFETCH_THRESHOLD)]
+
+        self.service.prefetch({"aws_db_subnet_group": groups})
+        result = self.service.aws_db_subnet_group(groups[0])
+
+        self.assertIsNone(result)
+        self.mock_client.describe_db_subnet_groups.assert_not_called()
+
 if __name__ == "__main__":
     unittest.main()
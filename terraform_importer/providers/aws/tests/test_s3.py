@@ -3,6 +3,7 @@ from unittest.mock import Mock, MagicMock, patch
 import boto3
 import botocore.exceptions
 from terraform_importer.providers.aws.aws_services.s3 import S3Service
+from terraform_importer.providers.aws.aws_services.base import CLIENT_CONFIG
 
 
 class TestS3Service(unittest.TestCase):
@@ -15,12 +16,12 @@ class TestS3Service(unittest.TestCase):
     def test_init(self):
         """Test S3Service initialization"""
         self.assertEqual(self.service.session, self.mock_session)
-        self.mock_session.client.assert_called_with("s3")
+        self.mock_session.client.assert_called_with("s3", config=CLIENT_CONFIG)
 
     def test_get_resource_list(self):
         """Test get_resource_list returns correct resources"""
         resources = self.service.get_resource_list()
-        expected_resources = [
+        expected_resources = (
             "aws_s3_bucket",
             "aws_s3_bucket_notification",
             "aws_s3_bucket_ownership_controls",
@@ -30,7 +31,7 @@ class TestS3Service(unittest.TestCase):
             "aws_s3_bucket_lifecycle_configuration",
             "aws_s3_bucket_versioning",
             "aws_s3_bucket_acl"
-        ]
+        )
         self.assertEqual(resources, expected_resources)
 
     def test_aws_s3_bucket_success(self):
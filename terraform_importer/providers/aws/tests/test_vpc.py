@@ -3,6 +3,7 @@ from unittest.mock import Mock, MagicMock, patch
 import boto3
 import botocore.exceptions
 from terraform_importer.providers.aws.aws_services.vpc import VPCService
+from terraform_importer.providers.aws.aws_services.base import CLIENT_CONFIG
 
 
 class TestVPCService(unittest.TestCase):
@@ -15,16 +16,16 @@ class TestVPCService(unittest.TestCase):
     def test_init(self):
         """Test VPCService initialization"""
         self.assertEqual(self.service.session, self.mock_session)
-        self.mock_session.client.assert_called_with("ec2")
+        self.mock_session.client.assert_called_with("ec2", config=CLIENT_CONFIG)
 
     def test_get_resource_list(self):
         """Test get_resource_list returns correct resources"""
         resources = self.service.get_resource_list()
-        expected_resources = [
+        expected_resources = (
             "aws_subnet",
             "aws_route_table",
             "aws_route_table_association"
-        ]
+        )
         self.assertEqual(resources, expected_resources)
 
     def test_aws_route_table_success(self):
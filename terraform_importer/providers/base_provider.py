@@ -13,6 +13,15 @@ class BaseProvider(ABC):
         self._resources_dict = {}
         self.logger = logging.getLogger(__name__)
     
+    def prefetch(self, resource_blocks: List[Dict]) -> None:
+        """
+        Optional hook called with all resource blocks of this provider before they are
+        resolved, so lookups can be batched. The default implementation does nothing.
+        Args:
+            resource_blocks (List[Dict]): The resource blocks that will be resolved.
+        """
+        pass
+
     def get_id(self, resource_type: str, resource_block: Dict) -> Optional[str]:
         """
         Fetches the ID for a specific resource type and resource block.
@@ -26,6 +35,6 @@ class BaseProvider(ABC):
             method = getattr(self, resource_type)
             return method(resource_block)
         else:
-            self.logger.info(f"No such resource_type: {resource_type}")
+            self.logger.info("No such resource_type: %s", resource_type)
             return None
     
\ No newline at end of file
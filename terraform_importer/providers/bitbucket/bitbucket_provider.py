@@ -130,7 +130,7 @@ class BitbucketDfraustProvider(BaseProvider):
                 if item.get("key") == variable:
                     return item["uuid"]
         except KeyError: ##TODO: fix for better exception
-            self.logger.warning(f"Response doesn't have values and has:")
+            self.logger.warning("Response doesn't have values and has:")
             self.logger.warning(json.dumps(json.loads(envs), sort_keys=True, indent=4, separators=(",", ": ")))
         return None
 
@@ -151,7 +151,7 @@ class BitbucketDfraustProvider(BaseProvider):
         resp_json = None
 
         if not url:
-            self.logger.debug(f"url: {url}")
+            self.logger.debug("url: %s", url)
             if deployment_uuid:
                 self.logger.debug("Get deployment variable")
                 url = f"{self.base_url}{repository_name}/deployments_config/environments/{deployment_uuid}/variables?page=0"
@@ -167,10 +167,10 @@ class BitbucketDfraustProvider(BaseProvider):
                self.logger.debug("Get Variables")
                resp_json = response.json()
             else:
-                self.logger.warning(f"Request failed: {response.status_code} - {response.reason}")
+                self.logger.warning("Request failed: %s - %s", response.status_code, response.reason)
                 return None, None
         except requests.RequestException as e:
-            self.logger.warning(f"Request failed: {e}")
+            self.logger.warning("Request failed: %s", e)
         
         self.logger.debug(json.dumps(resp_json, sort_keys=True, indent=4, separators=(",", ": ")))
         return resp_json, url
@@ -201,10 +201,10 @@ class BitbucketDfraustProvider(BaseProvider):
                self.logger.debug("Get Variables")
                resp_json = response.json()
             else:
-                self.logger.warning(f"Request failed: {response.status_code} - {response.reason}")
+                self.logger.warning("Request failed: %s - %s", response.status_code, response.reason)
                 return None
         except requests.RequestException as e:
-            self.logger.warning(f"Request failed: {e}")
+            self.logger.warning("Request failed: %s", e)
         
         if 'resp_json' in locals():
             self.logger.debug(json.dumps(resp_json, sort_keys=True, indent=4, separators=(",", ": ")))
@@ -217,7 +217,7 @@ class BitbucketDfraustProvider(BaseProvider):
                     if item.get("slug") == deployment:
                         return item["uuid"]
             except KeyError:
-                self.logger.warning(f"Response doesn't have values and has:")
+                self.logger.warning("Response doesn't have values and has:")
                 self.logger.warning(json.dumps(json.loads(envs), sort_keys=True, indent=4, separators=(",", ": ")))
         return None
 
@@ -257,7 +257,7 @@ class BitbucketDfraustProvider(BaseProvider):
             id = self.get_variable_uuid(repository_name, variable_name, deployment_id)
             return f"{deployment}/{id}"
         except KeyError:
-            self.logger.debug(f"Deployment not creates")
+            self.logger.debug("Deployment not creates")
         return None    
 
     def bitbucket_repository_variable(self, resource_block: Dict[str, Any]) -> str:
@@ -88,19 +88,21 @@ class KubernetesProvider(BaseProvider):
             # Validate context is a string or None
             if context is not None and not isinstance(context, str):
                 self.logger.warning(
-                    f"Invalid Kubernetes context type: expected string or None, got {type(context).__name__}. "
-                    f"Context value: {context}. Using None instead. "
-                    f"Please ensure 'config_context' is explicitly set to a string value (e.g., "
-                    f"'arn:aws:eks:us-east-1:********:cluster/cluster-name') or null."
+                    "Invalid Kubernetes context type: expected string or None, got %s. "
+                    "Context value: %s. Using None instead. "
+                    "Please ensure 'config_context' is explicitly set to a string value (e.g., "
+                    "'arn:aws:eks:us-east-1:********:cluster/cluster-name') or null.",
+                    type(context).__name__, context
                 )
                 context = None
             
             # Validate config_path is a string or None
             if config_path is not None and not isinstance(config_path, str):
                 self.logger.warning(
-                    f"Invalid Kubernetes config_path type: expected string or None, got {type(config_path).__name__}. "
-                    f"Config path value: {config_path}. Using None instead. "
-                    f"Please ensure 'config_path' is explicitly set to a string value (e.g., '/Users/***/.kube/config') or null."
+                    "Invalid Kubernetes config_path type: expected string or None, got %s. "
+                    "Config path value: %s. Using None instead. "
+                    "Please ensure 'config_path' is explicitly set to a string value (e.g., '/Users/***/.kube/config') or null.",
+                    type(config_path).__name__, config_path
                 )
                 config_path = None
             
@@ -113,7 +115,7 @@ class KubernetesProvider(BaseProvider):
                 expanded_path = os.path.expanduser(config_path)
                 if not os.path.exists(expanded_path):
                     raise FileNotFoundError(f"Kubeconfig file not found: {expanded_path}")
-                self.logger.info(f"Loading Kubernetes config from: {expanded_path}")
+                self.logger.info("Loading Kubernetes config from: %s", expanded_path)
                 config.load_kube_config(config_file=expanded_path, context=context)
             else:
                 # Use default kubeconfig location (~/.kube/config)
@@ -124,14 +126,15 @@ class KubernetesProvider(BaseProvider):
             
         except config.ConfigException as e:
             self.logger.warning(
-                f"Failed to load Kubernetes configuration: {e}. "
-                f"This may be due to invalid context or config_path values. "
-                f"Please ensure 'config_context' is a string (e.g., 'arn:aws:eks:us-east-1:********:cluster/cluster-name') "
-                f"and 'config_path' is a string (e.g., '/Users/***/.kube/config')."
+                "Failed to load Kubernetes configuration: %s. "
+                "This may be due to invalid context or config_path values. "
+                "Please ensure 'config_context' is a string (e.g., 'arn:aws:eks:us-east-1:********:cluster/cluster-name') "
+                "and 'config_path' is a string (e.g., '/Users/***/.kube/config').",
+                e
             )
             raise ValueError(f"Invalid Kubernetes configuration: {e}")
         except Exception as e:
-            self.logger.warning(f"Unexpected error initializing Kubernetes client: {e}")
+            self.logger.warning("Unexpected error initializing Kubernetes client: %s", e)
             raise
     
     def _verify_connection(self) -> None:
@@ -145,10 +148,10 @@ class KubernetesProvider(BaseProvider):
             self.core_v1.list_namespace(limit=1)
             self.logger.info("Successfully connected to Kubernetes cluster")
         except ApiException as e:
-            self.logger.error(f"Failed to connect to Kubernetes cluster: {e}")
+            self.logger.error("Failed to connect to Kubernetes cluster: %s", e)
             raise ConnectionError(f"Cannot connect to Kubernetes cluster: {e}")
         except Exception as e:
-            self.logger.error(f"Unexpected error verifying connection: {e}")
+            self.logger.error("Unexpected error verifying connection: %s", e)
             raise ConnectionError(f"Cannot verify Kubernetes connection: {e}")
     
     def get_id(self, resource_type: str, resource_block: Dict) -> Optional[str]:
@@ -166,7 +169,7 @@ class KubernetesProvider(BaseProvider):
             method = self._resources_dict[resource_type]
             return method(resource_block)
         else:
-            self.logger.warning(f"Unsupported Kubernetes resource type: {resource_type}")
+            self.logger.warning("Unsupported Kubernetes resource type: %s", resource_type)
             return None
     
     def _extract_metadata(self, resource_block: Dict[str, Any]) -> Tuple[Optional[str], Optional[str]]:
@@ -218,7 +221,7 @@ class KubernetesProvider(BaseProvider):
                             namespace = item.get('value', 'default')
                 
                 if name is None and metadata:
-                    self.logger.debug(f"Metadata list has {len(metadata)} items but no 'name' field found")
+                    self.logger.debug("Metadata list has %s items but no 'name' field found", len(metadata))
                 
                 return name, namespace
             elif isinstance(metadata, dict):
@@ -241,14 +244,14 @@ class KubernetesProvider(BaseProvider):
                         namespace = nested.get('namespace', 'default')
                     # Check if metadata has other keys that might indicate a different structure
                     elif metadata:
-                        self.logger.debug(f"Metadata dict has keys but no 'name': {list(metadata.keys())}")
+                        self.logger.debug("Metadata dict has keys but no 'name': %s", list(metadata.keys()))
                 
                 return name, namespace
             else:
-                self.logger.debug(f"Metadata is neither list nor dict: {type(metadata)}")
+                self.logger.debug("Metadata is neither list nor dict: %s", type(metadata))
                 return None, 'default'
         except Exception as e:
-            self.logger.warning(f"Error extracting metadata: {e}")
+            self.logger.warning("Error extracting metadata: %s", e)
             return None, 'default'
     
     def kubernetes_namespace(self, resource_block: Dict[str, Any]) -> Optional[str]:
@@ -274,15 +277,15 @@ class KubernetesProvider(BaseProvider):
                 return namespace_name
             except ApiException as e:
                 if e.status == 404:
-                    self.logger.warning(f"Namespace '{namespace_name}' not found")
+                    self.logger.warning("Namespace '%s' not found", namespace_name)
                 else:
-                    self.logger.warning(f"Error retrieving namespace '{namespace_name}': {e}")
+                    self.logger.warning("Error retrieving namespace '%s': %s", namespace_name, e)
                 return None
                 
         except KeyError as e:
-            self.logger.warning(f"Missing expected key in resource: {e}")
+            self.logger.warning("Missing expected key in resource: %s", e)
         except Exception as e:
-            self.logger.error(f"Unexpected error retrieving namespace: {e}")
+            self.logger.error("Unexpected error retrieving namespace: %s", e)
         
         return None
     
@@ -309,15 +312,15 @@ class KubernetesProvider(BaseProvider):
                 return f"{namespace}/{pod_name}"
             except ApiException as e:
                 if e.status == 404:
-                    self.logger.warning(f"Pod '{pod_name}' not found in namespace '{namespace}'")
+                    self.logger.warning("Pod '%s' not found in namespace '%s'", pod_name, namespace)
                 else:
-                    self.logger.warning(f"Error retrieving pod '{pod_name}': {e}")
+                    self.logger.warning("Error retrieving pod '%s': %s", pod_name, e)
                 return None
                 
         except KeyError as e:
-            self.logger.warning(f"Missing expected key in resource: {e}")
+            self.logger.warning("Missing expected key in resource: %s", e)
         except Exception as e:
-            self.logger.error(f"Unexpected error retrieving pod: {e}")
+            self.logger.error("Unexpected error retrieving pod: %s", e)
         
         return None
     
@@ -344,15 +347,15 @@ class KubernetesProvider(BaseProvider):
                 return f"{namespace}/{deployment_name}"
             except ApiException as e:
                 if e.status == 404:
-                    self.logger.warning(f"Deployment '{deployment_name}' not found in namespace '{namespace}'")
+                    self.logger.warning("Deployment '%s' not found in namespace '%s'", deployment_name, namespace)
                 else:
-                    self.logger.warning(f"Error retrieving deployment '{deployment_name}': {e}")
+                    self.logger.warning("Error retrieving deployment '%s': %s", deployment_name, e)
                 return None
                 
         except KeyError as e:
-            self.logger.warning(f"Missing expected key in resource: {e}")
+            self.logger.warning("Missing expected key in resource: %s", e)
         except Exception as e:
-            self.logger.error(f"Unexpected error retrieving deployment: {e}")
+            self.logger.error("Unexpected error retrieving deployment: %s", e)
         
         return None
     
@@ -379,15 +382,15 @@ class KubernetesProvider(BaseProvider):
                 return f"{namespace}/{service_name}"
             except ApiException as e:
                 if e.status == 404:
-                    self.logger.warning(f"Service '{service_name}' not found in namespace '{namespace}'")
+                    self.logger.warning("Service '%s' not found in namespace '%s'", service_name, namespace)
                 else:
-                    self.logger.warning(f"Error retrieving service '{service_name}': {e}")
+                    self.logger.warning("Error retrieving service '%s': %s", service_name, e)
                 return None
                 
         except KeyError as e:
-            self.logger.warning(f"Missing expected key in resource: {e}")
+            self.logger.warning("Missing expected key in resource: %s", e)
         except Exception as e:
-            self.logger.error(f"Unexpected error retrieving service: {e}")
+            self.logger.error("Unexpected error retrieving service: %s", e)
         
         return None
     
@@ -414,15 +417,15 @@ class KubernetesProvider(BaseProvider):
                 return f"{namespace}/{config_map_name}"
             except ApiException as e:
                 if e.status == 404:
-                    self.logger.warning(f"ConfigMap '{config_map_name}' not found in namespace '{namespace}'")
+                    self.logger.warning("ConfigMap '%s' not found in namespace '%s'", config_map_name, namespace)
                 else:
-                    self.logger.warning(f"Error retrieving ConfigMap '{config_map_name}': {e}")
+                    self.logger.warning("Error retrieving ConfigMap '%s': %s", config_map_name, e)
                 return None
                 
         except KeyError as e:
-            self.logger.warning(f"Missing expected key in resource: {e}")
+            self.logger.warning("Missing expected key in resource: %s", e)
         except Exception as e:
-            self.logger.error(f"Unexpected error retrieving ConfigMap: {e}")
+            self.logger.error("Unexpected error retrieving ConfigMap: %s", e)
         
         return None
     
@@ -449,15 +452,15 @@ class KubernetesProvider(BaseProvider):
                 return f"{namespace}/{secret_name}"
             except ApiException as e:
                 if e.status == 404:
-                    self.logger.warning(f"Secret '{secret_name}' not found in namespace '{namespace}'")
+                    self.logger.warning("Secret '%s' not found in namespace '%s'", secret_name, namespace)
                 else:
-                    self.logger.warning(f"Error retrieving Secret '{secret_name}': {e}")
+                    self.logger.warning("Error retrieving Secret '%s': %s", secret_name, e)
                 return None
                 
         except KeyError as e:
-            self.logger.warning(f"Missing expected key in resource: {e}")
+            self.logger.warning("Missing expected key in resource: %s", e)
         except Exception as e:
-            self.logger.error(f"Unexpected error retrieving Secret: {e}")
+            self.logger.error("Unexpected error retrieving Secret: %s", e)
         
         return None
     
@@ -484,15 +487,15 @@ class KubernetesProvider(BaseProvider):
                 return f"{namespace}/{pvc_name}"
             except ApiException as e:
                 if e.status == 404:
-                    self.logger.warning(f"PersistentVolumeClaim '{pvc_name}' not found in namespace '{namespace}'")
+                    self.logger.warning("PersistentVolumeClaim '%s' not found in namespace '%s'", pvc_name, namespace)
                 else:
-                    self.logger.warning(f"Error retrieving PersistentVolumeClaim '{pvc_name}': {e}")
+                    self.logger.warning("Error retrieving PersistentVolumeClaim '%s': %s", pvc_name, e)
                 return None
                 
         except KeyError as e:
-            self.logger.warning(f"Missing expected key in resource: {e}")
+            self.logger.warning("Missing expected key in resource: %s", e)
         except Exception as e:
-            self.logger.error(f"Unexpected error retrieving PersistentVolumeClaim: {e}")
+            self.logger.error("Unexpected error retrieving PersistentVolumeClaim: %s", e)
         
         return None
     
@@ -519,15 +522,15 @@ class KubernetesProvider(BaseProvider):
                 return f"{namespace}/{stateful_set_name}"
             except ApiException as e:
                 if e.status == 404:
-                    self.logger.warning(f"StatefulSet '{stateful_set_name}' not found in namespace '{namespace}'")
+                    self.logger.warning("StatefulSet '%s' not found in namespace '%s'", stateful_set_name, namespace)
                 else:
-                    self.logger.warning(f"Error retrieving StatefulSet '{stateful_set_name}': {e}")
+                    self.logger.warning("Error retrieving StatefulSet '%s': %s", stateful_set_name, e)
                 return None
                 
         except KeyError as e:
-            self.logger.warning(f"Missing expected key in resource: {e}")
+            self.logger.warning("Missing expected key in resource: %s", e)
         except Exception as e:
-            self.logger.error(f"Unexpected error retrieving StatefulSet: {e}")
+            self.logger.error("Unexpected error retrieving StatefulSet: %s", e)
         
         return None
     
@@ -554,15 +557,15 @@ class KubernetesProvider(BaseProvider):
                 return f"{namespace}/{daemon_set_name}"
             except ApiException as e:
                 if e.status == 404:
-                    self.logger.warning(f"DaemonSet '{daemon_set_name}' not found in namespace '{namespace}'")
+                    self.logger.warning("DaemonSet '%s' not found in namespace '%s'", daemon_set_name, namespace)
                 else:
-                    self.logger.warning(f"Error retrieving DaemonSet '{daemon_set_name}': {e}")
+                    self.logger.warning("Error retrieving DaemonSet '%s': %s", daemon_set_name, e)
                 return None
                 
         except KeyError as e:
-            self.logger.warning(f"Missing expected key in resource: {e}")
+            self.logger.warning("Missing expected key in resource: %s", e)
         except Exception as e:
-            self.logger.error(f"Unexpected error retrieving DaemonSet: {e}")
+            self.logger.error("Unexpected error retrieving DaemonSet: %s", e)
         
         return None
     
@@ -589,15 +592,15 @@ class KubernetesProvider(BaseProvider):
                 return f"{namespace}/{ingress_name}"
             except ApiException as e:
                 if e.status == 404:
-                    self.logger.warning(f"Ingress '{ingress_name}' not found in namespace '{namespace}'")
+                    self.logger.warning("Ingress '%s' not found in namespace '%s'", ingress_name, namespace)
                 else:
-                    self.logger.warning(f"Error retrieving Ingress '{ingress_name}': {e}")
+                    self.logger.warning("Error retrieving Ingress '%s': %s", ingress_name, e)
                 return None
                 
         except KeyError as e:
-            self.logger.warning(f"Missing expected key in resource: {e}")
+            self.logger.warning("Missing expected key in resource: %s", e)
         except Exception as e:
-            self.logger.error(f"Unexpected error retrieving Ingress: {e}")
+            self.logger.error("Unexpected error retrieving Ingress: %s", e)
         
         return None
     
@@ -624,15 +627,15 @@ class KubernetesProvider(BaseProvider):
                 return f"{namespace}/{service_account_name}"
             except ApiException as e:
                 if e.status == 404:
-                    self.logger.warning(f"ServiceAccount '{service_account_name}' not found in namespace '{namespace}'")
+                    self.logger.warning("ServiceAccount '%s' not found in namespace '%s'", service_account_name, namespace)
                 else:
-                    self.logger.warning(f"Error retrieving ServiceAccount '{service_account_name}': {e}")
+                    self.logger.warning("Error retrieving ServiceAccount '%s': %s", service_account_name, e)
                 return None
                 
         except KeyError as e:
-            self.logger.warning(f"Missing expected key in resource: {e}")
+            self.logger.warning("Missing expected key in resource: %s", e)
         except Exception as e:
-            self.logger.error(f"Unexpected error retrieving ServiceAccount: {e}")
+            self.logger.error("Unexpected error retrieving ServiceAccount: %s", e)
         
         return None
     
@@ -659,15 +662,15 @@ class KubernetesProvider(BaseProvider):
                 return f"{namespace}/{role_name}"
             except ApiException as e:
                 if e.status == 404:
-                    self.logger.warning(f"Role '{role_name}' not found in namespace '{namespace}'")
+                    self.logger.warning("Role '%s' not found in namespace '%s'", role_name, namespace)
                 else:
-                    self.logger.warning(f"Error retrieving Role '{role_name}': {e}")
+                    self.logger.warning("Error retrieving Role '%s': %s", role_name, e)
                 return None
                 
         except KeyError as e:
-            self.logger.warning(f"Missing expected key in resource: {e}")
+            self.logger.warning("Missing expected key in resource: %s", e)
         except Exception as e:
-            self.logger.error(f"Unexpected error retrieving Role: {e}")
+            self.logger.error("Unexpected error retrieving Role: %s", e)
         
         return None
     
@@ -686,38 +689,38 @@ class KubernetesProvider(BaseProvider):
             
             if not role_binding_name:
                 self.logger.warning("Missing 'name' in RoleBinding metadata")
-                self.logger.debug(f"Resource block structure: {resource_block}")
+                self.logger.debug("Resource block structure: %s", resource_block)
                 return None
             
-            self.logger.debug(f"Looking for RoleBinding '{role_binding_name}' in namespace '{namespace}'")
+            self.logger.debug("Looking for RoleBinding '%s' in namespace '%s'", role_binding_name, namespace)
             
             # Verify RoleBinding exists
             try:
                 self.rbac_authorization_v1.read_namespaced_role_binding(name=role_binding_name, namespace=namespace)
-                self.logger.info(f"Found RoleBinding '{role_binding_name}' in namespace '{namespace}'")
+                self.logger.info("Found RoleBinding '%s' in namespace '%s'", role_binding_name, namespace)
                 return f"{namespace}/{role_binding_name}"
             except ApiException as e:
                 if e.status == 404:
-                    self.logger.warning(f"RoleBinding '{role_binding_name}' not found in namespace '{namespace}'")
+                    self.logger.warning("RoleBinding '%s' not found in namespace '%s'", role_binding_name, namespace)
                     # Try to list RoleBindings in the namespace to help debug
                     try:
                         role_bindings = self.rbac_authorization_v1.list_namespaced_role_binding(namespace=namespace)
                         existing_names = [rb.metadata.name for rb in role_bindings.items]
-                        self.logger.debug(f"Existing RoleBindings in namespace '{namespace}': {existing_names}")
+                        self.logger.debug("Existing RoleBindings in namespace '%s': %s", namespace, existing_names)
                         if role_binding_name in existing_names:
-                            self.logger.warning(f"RoleBinding name found in list but read failed - possible permissions issue")
+                            self.logger.warning("RoleBinding name found in list but read failed - possible permissions issue")
                     except Exception as list_error:
-                        self.logger.debug(f"Could not list RoleBindings for debugging: {list_error}")
+                        self.logger.debug("Could not list RoleBindings for debugging: %s", list_error)
                 else:
-                    self.logger.warning(f"Error retrieving RoleBinding '{role_binding_name}': {e}")
+                    self.logger.warning("Error retrieving RoleBinding '%s': %s", role_binding_name, e)
                 return None
                 
         except KeyError as e:
-            self.logger.warning(f"Missing expected key in resource: {e}")
-            self.logger.debug(f"Resource block structure: {resource_block}")
+            self.logger.warning("Missing expected key in resource: %s", e)
+            self.logger.debug("Resource block structure: %s", resource_block)
         except Exception as e:
-            self.logger.error(f"Unexpected error retrieving RoleBinding: {e}")
-            self.logger.debug(f"Resource block structure: {resource_block}", exc_info=True)
+            self.logger.error("Unexpected error retrieving RoleBinding: %s", e)
+            self.logger.debug("Resource block structure: %s", resource_block, exc_info=True)
         
         return None
     
@@ -744,15 +747,15 @@ class KubernetesProvider(BaseProvider):
                 return cluster_role_name
             except ApiException as e:
                 if e.status == 404:
-                    self.logger.warning(f"ClusterRole '{cluster_role_name}' not found")
+                    self.logger.warning("ClusterRole '%s' not found", cluster_role_name)
                 else:
-                    self.logger.warning(f"Error retrieving ClusterRole '{cluster_role_name}': {e}")
+                    self.logger.warning("Error retrieving ClusterRole '%s': %s", cluster_role_name, e)
                 return None
                 
         except KeyError as e:
-            self.logger.warning(f"Missing expected key in resource: {e}")
+            self.logger.warning("Missing expected key in resource: %s", e)
         except Exception as e:
-            self.logger.error(f"Unexpected error retrieving ClusterRole: {e}")
+            self.logger.error("Unexpected error retrieving ClusterRole: %s", e)
         
         return None
     
@@ -779,14 +782,14 @@ class KubernetesProvider(BaseProvider):
                 return cluster_role_binding_name
             except ApiException as e:
                 if e.status == 404:
-                    self.logger.warning(f"ClusterRoleBinding '{cluster_role_binding_name}' not found")
+                    self.logger.warning("ClusterRoleBinding '%s' not found", cluster_role_binding_name)
                 else:
-                    self.logger.warning(f"Error retrieving ClusterRoleBinding '{cluster_role_binding_name}': {e}")
+                    self.logger.warning("Error retrieving ClusterRoleBinding '%s': %s", cluster_role_binding_name, e)
                 return None
                 
         except KeyError as e:
-            self.logger.warning(f"Missing expected key in resource: {e}")
+            self.logger.warning("Missing expected key in resource: %s", e)
         except Exception as e:
-            self.logger.error(f"Unexpected error retrieving ClusterRoleBinding: {e}")
+            self.logger.error("Unexpected error retrieving ClusterRoleBinding: %s", e)
         
         return None
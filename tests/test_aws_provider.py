@@ -6,6 +6,7 @@ from unittest.mock import Mock, patch, call, MagicMock
 from terraform_importer.providers.aws.aws_services.base import BaseAWSService
 from terraform_importer.providers.aws.aws_provider import AWSProvider
 from terraform_importer.providers.aws.aws_services.aws_auth import AWSAuthHandler
+from terraform_importer.handlers.cache_handler import ResultCache
 import json
 
 class TestAWSProviderInit(unittest.TestCase):
@@ -43,7 +44,120 @@ class TestAWSProviderInit(unittest.TestCase):
         self.assertEqual(provider._resources_dict["resource1"], mock_service)
         self.assertEqual(provider._resources_dict["resource2"], mock_service)
 
-    #TODO: unit test for get_aws_service_subclasses , get_id   
+    @patch("terraform_importer.providers.aws.aws_provider.AWSProvider.get_aws_service_subclasses", return_value=[])
+    def test_prefetch_groups_blocks_by_service(self, mock_get_aws_service_subclasses):
+        provider = AWSProvider(self.mock_auth_config)
+        mock_service = MagicMock(spec=BaseAWSService)
+        mock_service.get_resource_list.return_value = ["resource1", "resource2"]
+        provider.add_to_resource_dict(mock_service)
+        blocks = [
+            {"type": "resource1", "address": "resource1.a"},
+            {"type": "resource2", "address": "resource2.b"},
+            {"type": "unknown", "address": "unknown.c"},
+        ]
+        
+        provider.prefetch(blocks)
+        
+        mock_service.prefetch.assert_called_once_with({
+            "resource1": [blocks[0]],
+            "resource2": [blocks[1]],
+        })
+
+    @patch("terraform_importer.providers.aws.aws_provider.AWSProvider.get_aws_service_subclasses", return_value=[])
+    def test_prefetch_failure_is_not_fatal(self, mock_get_aws_service_subclasses):
+        provider = AWSProvider(self.mock_auth_config)
+        mock_service = MagicMock(spec=BaseAWSService)
+        mock_service.get_resource_list.return_value = ["resource1"]
+        mock_service.prefetch.side_effect = Exception("AccessDenied")
+        provider.add_to_resource_dict(mock_service)
+        
+        provider.prefetch([{"type": "resource1", "address": "resource1.a"}])
+        
+        mock_service.prefetch.assert_called_once()
+
+    @patch("terraform_importer.providers.aws.aws_provider.AWSProvider.get_aws_service_subclasses", return_value=[])
+    def test_get_id_uses_result_cache(self, mock_get_aws_service_subclasses):
+        provider = AWSProvider(self.mock_auth_config)
+        mock_service = MagicMock(spec=BaseAWSService)
+        mock_service.get_resource_list.return_value = ["resource1"]
+        provider.add_to_resource_dict(mock_service)
+        provider._result_cache = MagicMock(spec=ResultCache)
+        provider._result_cache.get.return_value = "cached-id"
+        provider._account_id = "123456789012"
+        provider._sessions = MagicMock(region_name="us-east-1")
+        
+        result = provider.get_id("resource1", {"change": {"after": {"name": "a"}}})
+        
+        self.assertEqual(result, "cached-id")
+        mock_service.get_id.assert_not_called()
+
+    @patch("terraform_importer.providers.aws.aws_provider.AWSProvider.get_aws_service_subclasses", return_value=[])
+    def test_get_id_stores_resolved_ids(self, mock_get_aws_service_subclasses):
+        provider = AWSProvider(self.mock_auth_config)
+        mock_service = MagicMock(spec=BaseAWSService)
+        mock_service.get_resource_list.return_value = ["resource1"]
+        mock_service.get_id.side_effect = lambda resource_type, block: block["change"]["after"].get("name")
+        provider.add_to_resource_dict(mock_service)
+        provider._result_cache = MagicMock(spec=ResultCache)
+        provider._result_cache.get.return_value = None
+        provider._account_id = "123456789012"
+        provider._sessions = MagicMock(region_name="us-east-1")
+        
+        found = provider.get_id("resource1", {"change": {"after": {"name": "a"}}})
+        missing = provider.get_id("resource1", {"change": {"after": {}}})
+        
+        self.assertEqual(found, "a")
+        self.assertIsNone(missing)
+        provider._result_cache.set.assert_called_once()
+        self.assertEqual(provider._result_cache.set.call_args.args[1], "a")
+
+    @patch("terraform_importer.providers.aws.aws_provider.AWSProvider.get_aws_service_subclasses", return_value=[])
+    def test_get_id_unknown_resource_type(self, mock_get_aws_service_subclasses):
+        provider = AWSProvider(self.mock_auth_config)
+        
+        self.assertIsNone(provider.get_id("unknown", {"change": {"after": {}}}))
+
+    @patch("terraform_importer.providers.aws.aws_provider.AWSProvider.get_aws_service_subclasses", return_value=[])
+    def test_prefetch_skips_cached_blocks(self, mock_get_aws_service_subclasses):
+        provider = AWSProvider(self.mock_auth_config)
+        mock_service = MagicMock(spec=BaseAWSService)
+        mock_service.get_resource_list.return_value = ["resource1"]
+        provider.add_to_resource_dict(mock_service)
+        provider._result_cache = MagicMock(spec=ResultCache)
+        provider._account_id = "123456789012"
+        provider._sessions = MagicMock(region_name="us-east-1")
+        cached = {"type": "resource1", "change": {"after": {"name": "cached"}}}
+        uncached = {"type": "resource1", "change": {"after": {"name": "new"}}}
+        provider._result_cache.get.side_effect = lambda key: (
+            "cached" if key == provider._result_cache_key("resource1", cached) else None
+        )
+        
+        provider.prefetch([cached, uncached])
+        
+        mock_service.prefetch.assert_called_once_with({"resource1": [uncached]})
+
+    @patch("terraform_importer.providers.aws.aws_provider.CLIENT_CACHE")
+    @patch("terraform_importer.providers.aws.aws_provider.AWSProvider.get_aws_service_subclasses", return_value=[])
+    def test_result_cache_disabled_without_account(self, mock_get_aws_service_subclasses, mock_client_cache):
+        provider = AWSProvider(self.mock_auth_config)
+        mock_service = MagicMock(spec=BaseAWSService)
+        mock_service.get_resource_list.return_value = ["resource1"]
+        mock_service.get_id.return_value = "resolved-id"
+        provider.add_to_resource_dict(mock_service)
+        result_cache = MagicMock(spec=ResultCache)
+        provider._result_cache = result_cache
+        mock_client_cache.get.return_value.get_caller_identity.side_effect = Exception("AccessDenied")
+        
+        first = provider.get_id("resource1", {"change": {"after": {"name": "a"}}})
+        second = provider.get_id("resource1", {"change": {"after": {"name": "b"}}})
+        
+        self.assertEqual((first, second), ("resolved-id", "resolved-id"))
+        self.assertIsNone(provider._result_cache)
+        mock_client_cache.get.return_value.get_caller_identity.assert_called_once()
+        result_cache.get.assert_not_called()
+        result_cache.set.assert_not_called()
+
+    #TODO: unit test for get_aws_service_subclasses
 
 if __name__ == "__main__":
     unittest.main()
\ No newline at end of file
@@ -6,6 +6,12 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")
 import requests
 from terraform_importer.providers.bitbucket.bitbucket_provider import BitbucketDfraustProvider
 
+
+def logged_messages(mock_log):
+    """Returns the messages a mocked logger method was called with, rendered the way logging would."""
+    return [call.args[0] % call.args[1:] if len(call.args) > 1 else call.args[0] for call in mock_log.call_args_list]
+
+
 @patch.object(BitbucketDfraustProvider, 'run_command')  # Class-level patch
 class TestBitbucketDfraustProvider(unittest.TestCase):
 
@@ -182,7 +188,7 @@ class TestBitbucketDfraustProvider(unittest.TestCase):
              self.assertIsNone(url)
      
              # Ensure that the warning was logged (implementation uses warning, not error)
-             mock_logger_warning.assert_called_with("Request failed: 400 - Bad Request")
+             self.assertEqual(logged_messages(mock_logger_warning)[-1], "Request failed: 400 - Bad Request")
 
     @patch("terraform_importer.providers.bitbucket.bitbucket_provider.BitbucketDfraustProvider.check_auth")
     def test_list_deployment_variables_uuid_exception(self,mock_check_auth, mock_run_command):
@@ -202,7 +208,7 @@ class TestBitbucketDfraustProvider(unittest.TestCase):
              self.assertIsNone(result)
      
              # Ensure that the warning was logged (implementation uses warning, not error)
-             mock_logger_warning.assert_called_with("Request failed: Network error")
+             self.assertEqual(logged_messages(mock_logger_warning)[-1], "Request failed: Network error")
 
     ########### test get_deployment_uuid ##########
 
@@ -264,7 +270,7 @@ class TestBitbucketDfraustProvider(unittest.TestCase):
              self.assertIsNone(result)
      
              # Ensure that the warning was logged (implementation uses warning, not error)
-             mock_logger_warning.assert_called_with("Request failed: Network error")
+             self.assertEqual(logged_messages(mock_logger_warning)[-1], "Request failed: Network error")
 
     @patch("terraform_importer.providers.bitbucket.bitbucket_provider.BitbucketDfraustProvider.check_auth")
     def test_get_deployment_uuid_invalid_response(self, mock_check_auth, mock_run_command):
@@ -0,0 +1,97 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+from terraform_importer.handlers.cache_handler import ResultCache, CACHE_TTL_ENV
+
+
+class TestResultCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, "cache", "cache.db")
+        self.cache = ResultCache(ttl=300, path=self.path)
+
+    def tearDown(self):
+        self.cache._conn.close()
+        self.tmp_dir.cleanup()
+
+    def test_set_and_get(self):
+        """Test a stored value is returned by a new cache opened on the same file"""
+        key = ResultCache.make_key("123456789012", "us-east-1", "aws_s3_bucket", {"bucket": "b"})
+        self.cache.set(key, "b")
+
+        reopened = ResultCache(ttl=300, path=self.path)
+        try:
+            self.assertEqual(reopened.get(key), "b")
+        finally:
+            reopened._conn.close()
+
+    def test_get_missing(self):
+        """Test get returns None for an unknown key"""
+        self.assertIsNone(self.cache.get("missing"))
+
+    @patch("terraform_importer.handlers.cache_handler.time.time")
+    def test_get_expired(self, mock_time):
+        """Test entries are ignored once their TTL has passed"""
+        mock_time.return_value = 1000.0
+        self.cache.set("key", "value")
+
+        mock_time.return_value = 1299.0
+        self.assertEqual(self.cache.get("key"), "value")
+        mock_time.return_value = 1301.0
+        self.assertIsNone(self.cache.get("key"))
+
+    def test_clear(self):
+        """Test clear removes every entry"""
+        self.cache.set("key", "value")
+
+        self.cache.clear()
+
+        self.assertIsNone(self.cache.get("key"))
+
+    def test_clear_file(self):
+        """Test clear_file empties an existing cache file"""
+        self.cache.set("key", "value")
+
+        ResultCache.clear_file(self.path)
+
+        self.assertIsNone(self.cache.get("key"))
+
+    def test_clear_file_missing(self):
+        """Test clear_file does not create a cache file that does not exist"""
+        path = os.path.join(self.tmp_dir.name, "other", "cache.db")
+
+        ResultCache.clear_file(path)
+
+        self.assertFalse(os.path.exists(path))
+
+    def test_make_key_ignores_dict_order(self):
+        """Test make_key gives the same key for equal planned values"""
+        self.assertEqual(
+            ResultCache.make_key("aws_s3_bucket", {"a": 1, "b": 2}),
+            ResultCache.make_key("aws_s3_bucket", {"b": 2, "a": 1})
+        )
+        self.assertNotEqual(
+            ResultCache.make_key("aws_s3_bucket", {"a": 1}),
+            ResultCache.make_key("aws_s3_bucket", {"a": 2})
+        )
+
+    def test_from_env_disabled(self):
+        """Test from_env returns None when the TTL is unset, zero or invalid"""
+        for value in (None, "0", "soon"):
+            env = {} if value is None else {CACHE_TTL_ENV: value}
+            with patch.dict(os.environ, env, clear=True):
+                self.assertIsNone(ResultCache.from_env())
+
+    def test_from_env_enabled(self):
+        """Test from_env builds a cache with the configured TTL"""
+        with patch.dict(os.environ, {CACHE_TTL_ENV: "60"}), \
+             patch.object(ResultCache, "__init__", return_value=None) as mock_init:
+            cache = ResultCache.from_env()
+
+        self.assertIsInstance(cache, ResultCache)
+        mock_init.assert_called_once_with(60.0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -2,6 +2,7 @@ import sys
 import unittest
 from unittest.mock import patch
 from terraform_importer.cli import TerraformImporterCLI
+from terraform_importer.handlers.providers_handler import DEFAULT_MAX_WORKERS
 
 class TestParseArgs(unittest.TestCase):
     @patch("os.path.isdir", return_value=True)  # Mocking os.path.isdir
@@ -15,6 +16,29 @@ class TestParseArgs(unittest.TestCase):
         self.assertEqual(args.log_level, "DEBUG")
         self.assertEqual(args.option, [])
         self.assertEqual(args.target, [])
+        self.assertEqual(args.max_workers, DEFAULT_MAX_WORKERS)
+        self.assertFalse(args.clear_cache)
+
+    @patch("os.path.isdir", return_value=True)
+    def test_parse_args_clear_cache(self, mock_isdir):
+        cli = TerraformImporterCLI()
+        args = cli.parse_args(["--config", "./fake-dir", "--clear-cache"])
+
+        self.assertTrue(args.clear_cache)
+
+    @patch("os.path.isdir", return_value=True)
+    def test_parse_args_max_workers(self, mock_isdir):
+        cli = TerraformImporterCLI()
+        args = cli.parse_args(["--config", "./fake-dir", "--max-workers", "4"])
+
+        self.assertEqual(args.max_workers, 4)
+
+    @patch("os.path.isdir", return_value=True)
+    def test_parse_args_rejects_non_positive_max_workers(self, mock_isdir):
+        cli = TerraformImporterCLI()
+
+        with patch("sys.stderr"), self.assertRaises(SystemExit):
+            cli.parse_args(["--config", "./fake-dir", "--max-workers", "0"])
 
 if __name__ == "__main__":
     unittest.main()
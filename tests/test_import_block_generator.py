@@ -9,6 +9,11 @@ from terraform_importer.handlers.providers_handler import ProvidersHandler
 from terraform_importer.generators.import_block_generator import ImportBlockGenerator
 
 
+def logged_messages(mock_log):
+    """Returns the messages a mocked logger method was called with, rendered the way logging would."""
+    return [call.args[0] % call.args[1:] if len(call.args) > 1 else call.args[0] for call in mock_log.call_args_list]
+
+
 class TestImportBlockGenerator(unittest.TestCase):
     def setUp(self):
         # Mock dependencies
@@ -104,6 +109,21 @@ class TestImportBlockGenerator(unittest.TestCase):
         self.generator.create_import_file.assert_called_once_with(mock_import_blocks, "/mock/path/import-targets.tf")
         self.assertEqual(result, mock_import_blocks)
         
+    @patch("terraform_importer.generators.import_block_generator.ProvidersHandler")
+    def test_extract_resource_list_passes_max_workers(self, mock_providers_handler):
+        """Test extract_resource_list builds the ProvidersHandler with the configured concurrency"""
+        generator = ImportBlockGenerator(self.mock_tf_handler, max_workers=3)
+        generator.logger = self.mock_logger
+        mock_resource_list = {"configuration": {"provider_config": {}}}
+        generator.run_terraform = Mock(return_value=mock_resource_list)
+        generator.generate_imports_from_plan = Mock(return_value=[])
+        generator.create_import_file = Mock()
+        self.mock_tf_handler.get_terraform_folder.return_value = "/mock/path"
+
+        generator.extract_resource_list()
+
+        mock_providers_handler.assert_called_once_with(mock_resource_list, 3)
+
     @patch("os.path.join", return_value="/mock/path/import-all.tf")
     def test_extract_resource_list_without_targets(self, mock_os_join):
         # Arrange
@@ -139,7 +159,7 @@ class TestImportBlockGenerator(unittest.TestCase):
         with self.assertRaises(Exception) as context:
             self.generator.extract_resource_list()
         
-        self.mock_logger.error.assert_called_with("Failed to extract resource list: Terraform error")
+        self.assertEqual(logged_messages(self.mock_logger.error)[-1], "Failed to extract resource list: Terraform error")
         self.assertEqual(str(context.exception), "Terraform error") 
 
     ####### _get_provider_for_resource ###########
@@ -167,7 +187,7 @@ class TestImportBlockGenerator(unittest.TestCase):
         provider = self.generator._get_provider_for_resource(resource, address_to_provider_dict)
         
         # The implementation uses logger.warning, not error
-        self.mock_logger.warning.assert_called_with("Failed to get provider for resource aws_instance.example: 'NoneType' object has no attribute 'get'")
+        self.assertEqual(logged_messages(self.mock_logger.warning)[-1], "Failed to get provider for resource aws_instance.example: 'NoneType' object has no attribute 'get'")
         self.assertIsNone(provider)
 
     def test_get_provider_for_nonexistent_resource(self):
@@ -199,6 +219,10 @@ class TestImportBlockGenerator(unittest.TestCase):
                     "address": "aws_s3_bucket.bucket1",
                     "change": {"actions": ["update"]},  # Should be skipped
                 },
+                {
+                    "address": "aws_s3_bucket.bucket2",
+                    "change": {"actions": ["delete", "create"]},  # Replacement, should be skipped
+                },
             ],
         }
 
@@ -215,8 +239,9 @@ class TestImportBlockGenerator(unittest.TestCase):
 
         # Assert
         self.generator.logger.info.assert_any_call("Filtering resources for 'create' actions.")
-        self.generator.logger.debug.assert_any_call("Skipping resource aws_s3_bucket.bucket1 with actions: ['update']")
-        self.generator.logger.info.assert_any_call("Filtered 1 resources for import.")
+        self.assertIn("Skipping resource aws_s3_bucket.bucket1 with actions: ['update']", logged_messages(self.generator.logger.debug))
+        self.assertIn("Skipping resource aws_s3_bucket.bucket2 with actions: ['delete', 'create']", logged_messages(self.generator.logger.debug))
+        self.assertIn("Filtered 1 resources for import.", logged_messages(self.generator.logger.info))
         self.generator._get_provider_for_resource.assert_called_once_with(
             resource_list["resource_changes"][0], {}
         )  # Ensuring it's called only for 'create' action
@@ -249,7 +274,7 @@ class TestImportBlockGenerator(unittest.TestCase):
         result = self.generator.create_import_file(resources, output_path)
 
         # Assert
-        self.generator.logger.info.assert_any_call(f"Creating import file at {output_path}")
+        self.assertIn(f"Creating import file at {output_path}", logged_messages(self.generator.logger.info))
         mock_open.assert_called_once_with(output_path, 'a')
         mock_file.write.assert_any_call("# Terraform import blocks\n\n")
         mock_file.write.assert_any_call("import {\n  to = aws_instance.example1\n  id = \"i-12345\"\n}\n\n")
@@ -267,7 +292,7 @@ class TestImportBlockGenerator(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.generator.create_import_file(resources, output_path)
         
-        self.generator.logger.error.assert_called_once_with("Resource missing required key: 'id'")
+        self.assertEqual(logged_messages(self.generator.logger.error), ["Resource missing required key: 'id'"])
 
     @patch('builtins.open', new_callable=MagicMock)
     def test_create_import_file_io_error(self, mock_open):
@@ -282,7 +307,7 @@ class TestImportBlockGenerator(unittest.TestCase):
         with self.assertRaises(IOError):
             self.generator.create_import_file(resources, output_path)
 
-        self.generator.logger.error.assert_called_once_with(f"Failed to write to file {output_path}: Permission denied")
+        self.assertEqual(logged_messages(self.generator.logger.error), [f"Failed to write to file {output_path}: Permission denied"])
 
 
 if __name__ == "__main__":
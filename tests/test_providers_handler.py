@@ -0,0 +1,69 @@
+import unittest
+from unittest.mock import MagicMock, patch
+from terraform_importer.handlers.providers_handler import ProvidersHandler
+
+
+class TestProvidersHandler(unittest.TestCase):
+    def setUp(self):
+        with patch("terraform_importer.handlers.providers_handler.JsonConfigHandler.edit_provider_config", return_value={}):
+            self.handler = ProvidersHandler({})
+        self.mock_provider = MagicMock()
+        self.mock_provider.get_id.side_effect = lambda resource_type, block: block.get("expected_id")
+        self.handler.providers = {"aws": self.mock_provider}
+        self.resources = [
+            {"type": "aws_s3_bucket", "provider": "aws", "address": f"aws_s3_bucket.b{i}", "expected_id": f"bucket-{i}"}
+            for i in range(10)
+        ]
+        self.resources[3]["expected_id"] = None
+
+    def test_run_all_resources_concurrently_keeps_order(self):
+        """Test run_all_resources returns results in input order and drops unresolved resources"""
+        result = self.handler.run_all_resources(self.resources)
+
+        expected = [
+            {"address": f"aws_s3_bucket.b{i}", "id": f"bucket-{i}"}
+            for i in range(10) if i != 3
+        ]
+        self.assertEqual(result, expected)
+        self.assertEqual(self.mock_provider.get_id.call_count, 10)
+
+    def test_run_all_resources_sequentially(self):
+        """Test run_all_resources resolves resources one by one when max_workers is 1"""
+        self.handler.max_workers = 1
+
+        with patch("terraform_importer.handlers.providers_handler.ThreadPoolExecutor") as mock_executor:
+            result = self.handler.run_all_resources(self.resources)
+
+        mock_executor.assert_not_called()
+        self.assertEqual(len(result), 9)
+
+    def test_run_all_resources_isolates_failures(self):
+        """Test a failing lookup does not abort the other resources"""
+        def get_id(resource_type, block):
+            if block["address"] == "aws_s3_bucket.b5":
+                raise RuntimeError("boom")
+            return block.get("expected_id")
+        self.mock_provider.get_id.side_effect = get_id
+
+        result = self.handler.run_all_resources(self.resources)
+
+        self.assertEqual(len(result), 8)
+        self.assertNotIn({"address": "aws_s3_bucket.b5", "id": "bucket-5"}, result)
+
+    def test_run_all_resources_prefetches_per_provider(self):
+        """Test run_all_resources hands each provider its resource blocks before resolving them"""
+        self.handler.run_all_resources(self.resources)
+
+        self.mock_provider.prefetch.assert_called_once_with(self.resources)
+
+    def test_get_resource_unknown_provider(self):
+        """Test get_resource returns None for a provider that was not configured"""
+        block = {"provider": "missing", "address": "aws_s3_bucket.b"}
+
+        result = self.handler.get_resource("aws_s3_bucket", block)
+
+        self.assertIsNone(result)
+
+
+if __name__ == "__main__":
+    unittest.main()